@@ -2,8 +2,10 @@
 
 Without this, pytest's directory traversal registers package directories
 (e.g. core/) as namespace packages before test collection, which shadows the
-real packages installed from <pkg>/src/.  Importing them here (while
-pythonpath is already in effect) caches the correct module in sys.modules.
+real packages installed from <pkg>/src/.  Importing them in "pytest_configure"
+(while pythonpath is already in effect, but before collection starts) caches the
+correct module in sys.modules, without paying for the imports on every load of
+this conftest.
 """
 
 import socket
@@ -15,11 +17,6 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-import one_ring_core  # noqa: F401
-import one_ring_http  # noqa: F401
-import one_ring_loop  # noqa: F401
-from one_ring_loop.loop import run
-
 if TYPE_CHECKING:
     from collections.abc import Callable
     from pathlib import Path
@@ -27,6 +24,13 @@ if TYPE_CHECKING:
     from one_ring_loop.typedefs import Coro
 
 
+def pytest_configure() -> None:
+    """Pre-imports workspace packages before test collection."""
+    import one_ring_core  # noqa: F401, PLC0415
+    import one_ring_http  # noqa: F401, PLC0415
+    import one_ring_loop  # noqa: F401, PLC0415
+
+
 @pytest.fixture
 def tmp_file_path(tmp_path: Path) -> Path:
     """Provide a temporary file path for file I/O tests.
@@ -72,6 +76,7 @@ class TimingContext:
 @pytest.fixture
 def run_coro() -> Callable[[Coro], object]:
     """Run a generator coroutine on the event loop."""
+    from one_ring_loop.loop import run  # noqa: PLC0415
 
     def _run(coro: Coro) -> object:
         return run(coro)
@@ -94,9 +99,15 @@ def timing() -> TimingContext:
     return TimingContext()
 
 
-@pytest.fixture
-def ssl_contexts(tmp_path: Path) -> tuple[ssl.SSLContext, ssl.SSLContext]:
-    """Generates temporay server and client ssl contexts."""
+@pytest.fixture(scope="session")
+def ssl_contexts(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[ssl.SSLContext, ssl.SSLContext]:
+    """Generates temporay server and client ssl contexts, once per session.
+
+    Uses an EC P-256 key, which is much cheaper to generate than RSA.
+    """
+    tmp_path = tmp_path_factory.mktemp("tls")
     cert_path = tmp_path / "cert.pem"
     key_path = tmp_path / "key.pem"
 
@@ -106,7 +117,9 @@ def ssl_contexts(tmp_path: Path) -> tuple[ssl.SSLContext, ssl.SSLContext]:
             "req",
             "-x509",
             "-newkey",
-            "rsa:2048",
+            "ec",
+            "-pkeyopt",
+            "ec_paramgen_curve:P-256",
             "-keyout",
             key_path,
             "-out",
@@ -1,5 +1,8 @@
 """This example shows how to bridge one_ring to use modern Python "await" syntax.
 
+The coroutines are driven by one_ring_loop's own io_uring based loop, not by asyncio,
+so asyncio loop replacements such as uvloop have nothing to hook into here.
+
 Note: the project applies a structurred approach similar to Trio. However, I have not
 yet taken the time to implement an async version of the TaskGroup, which kind of breaks
 this example...
@@ -7,7 +10,6 @@ this example...
 
 import time
 from collections import deque
-from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from one_ring_loop import run
@@ -22,11 +24,13 @@ if TYPE_CHECKING:
 ### Define "await" compatible sleep ###
 
 
-@dataclass(slots=True, kw_only=True)
 class Sleep:
     """Asynchonous sleep."""
 
-    time: int
+    __slots__ = ("time",)
+
+    def __init__(self, time: int) -> None:
+        self.time = time
 
     def __await__(self) -> Coro[None]:
         """Yields timer instructions to event loop."""
@@ -45,7 +49,9 @@ async def sleep(time: int) -> int:
 class Gather:
     """Gathers multiple tasks to await them as one."""
 
-    def __init__(self, *tasks: Task) -> None:
+    __slots__ = ("tasks",)
+
+    def __init__(self, tasks: tuple[Task, ...]) -> None:
         self.tasks = tasks
 
     def __await__(self) -> Coro[tuple]:
@@ -56,21 +62,23 @@ class Gather:
 
 async def gather(*tasks: Task) -> tuple:
     """Coroutine wrapping Gather object."""
-    return await Gather(*tasks)
+    return await Gather(tasks)
 
 
 async def entry() -> None:
     """Entry point for example."""
-    start_time = time.monotonic()
+    start_time = time.perf_counter()
 
     # Creates task using private function. Internally, this function is only used
-    # by the "run" function, as well as task groups.
-    task1 = _create_standalone_task(sleep(1), deque(), None)
-    task2 = _create_standalone_task(sleep(2), deque(), None)
+    # by the "run" function, as well as task groups. Eager tasks run up to their first
+    # yield right away, so a coroutine that returns without suspending never gets
+    # scheduled at all.
+    task1 = _create_standalone_task(sleep(1), deque(), None, eager=True)
+    task2 = _create_standalone_task(sleep(2), deque(), None, eager=True)
 
     time1, time2 = await gather(task1, task2)
 
-    print(f"Slept for {time.monotonic() - start_time}")
+    print(f"Slept for {time.perf_counter() - start_time}")
     print(f"time1: {time1}")
     print(f"time2: {time2}")
 
@@ -8,6 +8,8 @@ from one_ring_loop.socketio import Connection, create_server
 if TYPE_CHECKING:
     from one_ring_loop.typedefs import Coro
 
+PREFIX = b"Server echoes: "
+
 
 def echo_handler(conn: Connection) -> Coro[None]:
     """Gets data sent from a client and echoes it."""
@@ -16,7 +18,7 @@ def echo_handler(conn: Connection) -> Coro[None]:
             data = yield from conn.receive(1024)
             if not data:
                 break
-            yield from conn.send(b"Server echoes: " + data)
+            yield from conn.send_many(PREFIX, data)
     finally:
         yield from conn.close()
 
@@ -29,7 +31,9 @@ def echo_server() -> Coro[None]:
     try:
         while True:
             conn = yield from server.accept()
-            tg.create_task(echo_handler(conn))
+            # Eagerly started, so the handler's first receive is registered with the
+            # ring without waiting for another loop iteration.
+            tg.create_task(echo_handler(conn), eager=True)
     finally:
         yield from tg.exit()
         yield from server.close()
@@ -26,8 +26,8 @@ if TYPE_CHECKING:
     from one_ring_http.websocket import WebSocket
     from one_ring_loop.typedefs import Coro
 
-ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
-ssl_context.load_cert_chain("dev-cert.pem", "dev-key.pem")
+# Built once and shared as a read-only view by every /big response.
+_BIG_BODY = memoryview(b"A" * 1_000_000)
 
 router = Router()
 
@@ -37,7 +37,7 @@ router.set_404_fallback(static_handler("./examples/http_server/static"))
 @router.get("/big")
 def big_response(_: Request) -> Response:
     """Sends a large response."""
-    return Response.text("A" * 1_000_000)
+    return Response(status_code=HTTPStatus.OK, body=_BIG_BODY)
 
 
 @router.get("/{a}")
@@ -74,9 +74,7 @@ def streaming(_: Request) -> StreamingResponse:
     def producer() -> Coro[None]:
         for word in ["hej!", "jag", "heter", "otto", "sellerstam", ":)"]:
             event = ServerSentEvent(data=word, event=None)
-            print("Producer: sending", word)
             yield from send_stream.send(event.encode())
-            print("Producer: sleeping")
             yield from sleep(1)
 
         yield from send_stream.close()
@@ -138,12 +136,17 @@ middleware.register(logging_middleware)
 middleware.register(cors_middleware())
 
 
-server = HTTPServer(
-    router=router,
-    host="127.0.0.1",
-    port=8000,
-    ssl_context=ssl_context,
-    middleware=middleware,
-)
+if __name__ == "__main__":
+    # Loaded here rather than at import, so importing the module does no disk I/O.
+    ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    ssl_context.load_cert_chain("dev-cert.pem", "dev-key.pem")
+
+    server = HTTPServer(
+        router=router,
+        host="127.0.0.1",
+        port=8000,
+        ssl_context=ssl_context,
+        middleware=middleware,
+    )
 
-run(server.serve())
+    run(server.serve())
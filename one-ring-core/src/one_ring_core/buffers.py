@@ -0,0 +1,90 @@
+"""Pools of buffers registered with the ring for fixed buffer IO."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True, kw_only=True)
+class BufferPool:
+    """Fixed-size buffers, registered once with the kernel and handed out by index.
+
+    Operations on a registered buffer skip the per-IO page pinning the kernel
+    otherwise does for every submitted buffer. The buffers are slices of a single
+    allocation, so the whole pool is one contiguous region of memory.
+    """
+
+    """Number of buffers in the pool"""
+    count: int
+
+    """Size of each buffer in bytes"""
+    size: int
+
+    """Backing memory for all buffers. Buffer index i starts at offset i * size"""
+    slab: bytearray = field(init=False, repr=False)
+
+    """The buffers, in registration order. A buffer's index is its buf_index"""
+    buffers: list[memoryview] = field(init=False, repr=False)
+
+    """Indices of buffers not currently acquired"""
+    _free: list[int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Allocates all buffers up front, in one go."""
+        self.slab = bytearray(self.count * self.size)
+        with memoryview(self.slab) as view:
+            self.buffers = [
+                view[start : start + self.size]
+                for start in range(0, len(self.slab), self.size)
+            ]
+        self._free = list(reversed(range(self.count)))
+
+    def acquire(self) -> int:
+        """Takes a free buffer out of the pool.
+
+        Returns:
+            The index of the acquired buffer.
+
+        Raises:
+            BufferError: if every buffer is in use.
+        """
+        if not self._free:
+            msg = "No free buffers in pool"
+            raise BufferError(msg)
+        return self._free.pop()
+
+    def release(self, index: int) -> None:
+        """Returns a previously acquired buffer to the pool."""
+        self._free.append(index)
+
+
+@dataclass(slots=True, kw_only=True)
+class BufferGroup:
+    """Fixed-size buffers provided to the kernel, for it to pick from on receive.
+
+    Unlike a BufferPool, the kernel chooses the buffer when data arrives, so idle
+    receives hold no memory of their own. A consumed buffer is unavailable until
+    it is provided again.
+    """
+
+    """Buffer group id, as referenced by receive operations"""
+    group_id: int
+
+    """Number of buffers in the group"""
+    count: int
+
+    """Size of each buffer in bytes"""
+    size: int
+
+    """Backing memory for all buffers. Buffer id i starts at offset i * size"""
+    buffer: bytearray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Allocates the backing memory up front."""
+        self.buffer = bytearray(self.count * self.size)
+
+    def read(self, buffer_id: int, nbytes: int) -> bytes:
+        """Copies the first nbytes out of a buffer."""
+        start = buffer_id * self.size
+        with memoryview(self.buffer) as view:
+            return bytes(view[start : start + nbytes])
@@ -12,6 +12,15 @@ from rusty_ring import (
     AT_EMPTY_PATH,
     AT_FDCWD,
     AT_SYMLINK_NOFOLLOW,
+    IORING_CQE_F_BUFFER,
+    IORING_CQE_F_MORE,
+    IOSQE_ASYNC,
+    IOSQE_BUFFER_SELECT,
+    IOSQE_CQE_SKIP_SUCCESS,
+    IOSQE_FIXED_FILE,
+    IOSQE_IO_DRAIN,
+    IOSQE_IO_HARDLINK,
+    IOSQE_IO_LINK,
     IPPROTO_TCP,
     MSG_DONTWAIT,
     MSG_NOSIGNAL,
@@ -167,6 +176,25 @@ class SockOpt(IntEnum):
     TCP_NODELAY = TCP_NODELAY
 
 
+class SqeFlags(IntFlag):
+    """Per-submission flags (IOSQE_*)."""
+
+    FIXED_FILE = IOSQE_FIXED_FILE
+    IO_DRAIN = IOSQE_IO_DRAIN
+    IO_LINK = IOSQE_IO_LINK
+    IO_HARDLINK = IOSQE_IO_HARDLINK
+    ASYNC = IOSQE_ASYNC
+    BUFFER_SELECT = IOSQE_BUFFER_SELECT
+    CQE_SKIP_SUCCESS = IOSQE_CQE_SKIP_SUCCESS
+
+
+class CqeFlags(IntFlag):
+    """Per-completion flags (IORING_CQE_F_*)."""
+
+    BUFFER = IORING_CQE_F_BUFFER
+    MORE = IORING_CQE_F_MORE
+
+
 class MsgFlags(IntFlag):
     """Flags for send/recv operations."""
 
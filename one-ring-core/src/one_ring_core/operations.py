@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import array
 import errno
+import os
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Self, override
+from functools import lru_cache
+from itertools import permutations
+from typing import TYPE_CHECKING, ClassVar, Self, override
 
 from one_ring_core.constants import (
     AddressFamily,
@@ -16,6 +18,7 @@ from one_ring_core.constants import (
     SockOpt,
     SockOptLevel,
     SockType,
+    SqeFlags,
     StatxMask,
 )
 from one_ring_core.log import get_logger
@@ -23,6 +26,7 @@ from one_ring_core.results import (
     CancelResult,
     CloseResult,
     FileOpenResult,
+    ProvideBuffersResult,
     ReadResult,
     SleepResult,
     SocketAcceptResult,
@@ -36,9 +40,17 @@ from one_ring_core.results import (
     StatxResult,
     WriteResult,
 )
-from rusty_ring import SockAddr, StatxBuffer
+from rusty_ring import (
+    IORING_CQE_BUFFER_SHIFT,
+    IORING_CQE_F_BUFFER,
+    SockAddr,
+    StatxBuffer,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Buffer
+
+    from one_ring_core.buffers import BufferGroup, BufferPool
     from one_ring_core.results import IOResult
     from one_ring_core.typedefs import WorkerOperationID
     from rusty_ring import CompletionEvent, Ring
@@ -46,6 +58,42 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Results without fields are immutable and interchangeable, so a single shared instance
+# of each is returned instead of allocating one per completion.
+_CANCEL_RESULT = CancelResult()
+_CLOSE_RESULT = CloseResult()
+_SLEEP_RESULT = SleepResult()
+_SOCKET_SET_OPT_RESULT = SocketSetOptResult()
+_SOCKET_BIND_RESULT = SocketBindResult()
+_SOCKET_LISTEN_RESULT = SocketListenResult()
+_PROVIDE_BUFFERS_RESULT = ProvideBuffersResult()
+_SOCKET_CONNECT_RESULT = SocketConnectResult()
+
+
+def _copy_prefix(buffer: bytearray | memoryview, nbytes: int) -> bytes:
+    """Copies the first nbytes of a buffer out as bytes.
+
+    Slicing through a memoryview copies once, where slicing the bytearray itself
+    would copy into an intermediate bytearray first.
+    """
+    with memoryview(buffer) as view:
+        return bytes(view[:nbytes])
+
+
+_SOCKADDR_BUILDERS = {
+    AddressFamily.INET: SockAddr.v4,
+    AddressFamily.INET6: SockAddr.v6,
+}
+
+
+# Clients connect to, and servers bind, the same few addresses over and over. SockAddr
+# is immutable and pinned by reference while in flight, so one instance can be shared
+# by every operation on the same address.
+@lru_cache(maxsize=1024)
+def _sockaddr(address_family: AddressFamily, ip: str, port: int) -> SockAddr:
+    """Parses and packs a native sockaddr, reusing it for repeated addresses."""
+    return _SOCKADDR_BUILDERS[address_family](ip=ip, port=port)
+
 
 class IOOperation[T: IOResult](metaclass=ABCMeta):
     """Base class for all IO operations."""
@@ -54,17 +102,59 @@ class IOOperation[T: IOResult](metaclass=ABCMeta):
 
     result_type: type[T]
 
+    # Negative results which are not errors for this operation.
+    ok_errnos: ClassVar[frozenset[int]] = frozenset()
+
+    # Whether a completion with MORE set is followed only by a notification that the
+    # kernel is done with the operation's buffer, rather than by more results.
+    notifies: ClassVar[bool] = False
+
+    # Number of SQEs prep prepares, linked in order under the same user_data. Only the
+    # first failure is the result; the cancelled steps after it post CQEs of their own.
+    entries: ClassVar[int] = 1
+
     @abstractmethod
     def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
-        """Prepares a submission queue entry for the SQ."""
+        """Prepares a submission queue entry for the SQ.
+
+        Runs for every submission, so implementations should read their fields and
+        make the native prep call, nothing more. Anything derivable from the fields
+        alone belongs in __post_init__.
+        """
 
     @abstractmethod
     def extract(self, completion_event: CompletionEvent) -> T:
         """Extract fields from a completion queue event and wrap in correct type."""
 
+    def run(self) -> T | None:
+        """Performs the operation with a plain syscall, bypassing the ring.
+
+        Only for operations whose syscall can't block, as it runs on the caller's
+        thread. A read that has to go to disk would stall the event loop.
+
+        Returns:
+            The result, or None if the operation can't be performed this way.
+
+        Raises:
+            OSError: if the syscall fails.
+        """
+        return None
+
     def is_error(self, completion_event: CompletionEvent) -> bool:
-        """Determines if the completion event is an error."""
-        return completion_event.res < 0
+        """Determines if the completion event is an error.
+
+        The worker only asks for negative results, so overrides can't treat a
+        non-negative result as an error.
+        """
+        res = completion_event.res
+        return res < 0 and res not in self.ok_errnos
+
+    def is_multishot(self) -> bool:
+        """Whether a single submission completes once per result, until it ends."""
+        return False
+
+    def discard(self, result: T) -> None:  # noqa: B027
+        """Releases what a result holds, for a result nobody will consume."""
 
 
 @dataclass(slots=True, kw_only=True)
@@ -73,6 +163,13 @@ class Cancel(IOOperation[CancelResult]):
 
     result_type = CancelResult
 
+    ok_errnos = frozenset(
+        {
+            -errno.ENOENT,  # identifier not found
+            -errno.EALREADY,  # identifier already completing
+        }
+    )
+
     """The id of the operation to cancel the in-flight operation for"""
     target_identifier: WorkerOperationID
 
@@ -87,15 +184,38 @@ class Cancel(IOOperation[CancelResult]):
     @override
     def extract(self, completion_event: CompletionEvent) -> CancelResult:
         """Extract fields from a completion queue event and wrap in correct type."""
-        return CancelResult()
+        return _CANCEL_RESULT
+
+
+def _parse_mode(mode: str) -> int:
+    """Converts Python style mode to POSIX flags."""
+    if "r" in mode and "w" in mode:
+        flags = OpenFlags.RDWR
+    elif "w" in mode:
+        flags = OpenFlags.WRONLY
+    else:
+        flags = OpenFlags.RDONLY
+
+    if "c" in mode:
+        flags |= OpenFlags.CREAT
+    if "a" in mode:
+        flags |= OpenFlags.APPEND
+
+    return flags
 
-    @override
-    def is_error(self, completion_event: CompletionEvent) -> bool:
-        """Determines if the completion event is an error."""
-        return completion_event.res < 0 and completion_event.res not in {
-            -errno.ENOENT,  # identifier not found
-            -errno.EALREADY,  # identifier already completing
-        }
+
+# Flags for every spelling of every combination of mode letters, built once at import.
+_MODE_FLAGS = {
+    mode: _parse_mode(mode)
+    for n in range(1, 5)
+    for mode in map("".join, permutations("rwca", n))
+}
+
+
+def _mode_to_flags(mode: str) -> int:
+    """Looks up the POSIX flags of a mode, parsing modes outside the table."""
+    flags = _MODE_FLAGS.get(mode)
+    return _parse_mode(mode) if flags is None else flags
 
 
 @dataclass(slots=True, kw_only=True)
@@ -106,41 +226,37 @@ class FileOpen(IOOperation[FileOpenResult]):
     path: str
     mode: str
 
+    """Slot of the worker's registered files to open the file into, skipping the
+    process fd table. The slot is then the result's fd, for use with fixed_file"""
+    file_index: int | None = None
+
+    """POSIX open flags for mode"""
+    _flags: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Resolves the open flags once, keeping prep to the native call."""
+        self._flags = _mode_to_flags(self.mode)
+
     @override
     def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
         """Prepares a submission queue entry for the SQ."""
         ring.prep_openat(
             user_data,
             self.path,
-            self._mode_to_flags(self.mode),
+            self._flags,
             FileMode.RW_OWNER,
             AtFlags.FDCWD,
+            self.file_index,
         )
 
     @override
     def extract(self, completion_event: CompletionEvent) -> FileOpenResult:
         """Extract fields from a completion queue event and wrap in correct type."""
+        file_index = self.file_index
         return FileOpenResult(
-            fd=completion_event.res,
+            fd=completion_event.res if file_index is None else file_index,
         )
 
-    @staticmethod
-    def _mode_to_flags(mode: str) -> int:
-        """Converts Python style mode to POSIX flags."""
-        if "r" in mode and "w" in mode:
-            flags = OpenFlags.RDWR
-        elif "w" in mode:
-            flags = OpenFlags.WRONLY
-        else:
-            flags = OpenFlags.RDONLY
-
-        if "c" in mode:
-            flags |= OpenFlags.CREAT
-        if "a" in mode:
-            flags |= OpenFlags.APPEND
-
-        return flags
-
 
 @dataclass(slots=True, kw_only=True)
 class Statx(IOOperation[StatxResult]):
@@ -202,18 +318,27 @@ class Read(IOOperation[ReadResult]):
     result_type = ReadResult
     fd: int
 
+    """Whether fd is an index into the worker's registered files"""
+    fixed_file: bool = False
+
     """Number of bytes to read"""
     size: int
 
     """Offset for file read"""
     offset: int = 0
 
+    """Whether the range is known to be in the page cache. Only then can a plain
+    pread not block, so only then may IOWorker's syscall fallback perform it"""
+    cached: bool = False
+
     """Buffer to be filled with contents from read operation"""
     _buffer: bytearray = field(init=False, repr=False)
 
     @override
     def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
         """Prepares a submission queue efntry for the SQ."""
+        if self.fixed_file:
+            ring.set_sqe_flags(user_data, SqeFlags.FIXED_FILE)
         self._buffer = bytearray(self.size)
 
         ring.prep_read(user_data, self.fd, self._buffer, self.size, self.offset)
@@ -221,10 +346,20 @@ class Read(IOOperation[ReadResult]):
     @override
     def extract(self, completion_event: CompletionEvent) -> ReadResult:
         """Extract fields from a completion queue event and wrap in correct type."""
-        return ReadResult(
-            content=bytes(self._buffer),
-            size=completion_event.res,
-        )
+        res = completion_event.res
+        # The buffer was allocated for this read alone, so it is handed over as the
+        # content. Trimming a short read in place shrinks it without copying.
+        buffer = self._buffer
+        del buffer[res:]
+        return ReadResult(content=buffer, size=res)
+
+    @override
+    def run(self) -> ReadResult | None:
+        """Reads with pread, if the range is cached and fd isn't a file index."""
+        if self.fixed_file or not self.cached:
+            return None
+        content = os.pread(self.fd, self.size, self.offset)
+        return ReadResult(content=content, size=len(content))
 
 
 @dataclass(slots=True, kw_only=True)
@@ -234,15 +369,23 @@ class Write(IOOperation[WriteResult]):
     result_type = WriteResult
     fd: int
 
-    """Data to write to file"""
-    data: bytes
+    """Whether fd is an index into the worker's registered files"""
+    fixed_file: bool = False
+
+    """Data to write to file. Any bytes-like object, passed to the kernel as is"""
+    data: Buffer
 
     """Not sure"""
     offset: int = 0
 
+    """Whether the range is known to be in the page cache, see Read.cached"""
+    cached: bool = False
+
     @override
     def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
         """Prepares a submission queue entry for the SQ."""
+        if self.fixed_file:
+            ring.set_sqe_flags(user_data, SqeFlags.FIXED_FILE)
         ring.prep_write(user_data, self.fd, self.data, self.offset)
 
     @override
@@ -252,6 +395,162 @@ class Write(IOOperation[WriteResult]):
             size=completion_event.res,
         )
 
+    @override
+    def run(self) -> WriteResult | None:
+        """Writes with pwrite, if the range is cached and fd isn't a file index."""
+        if self.fixed_file or not self.cached:
+            return None
+        return WriteResult(size=os.pwrite(self.fd, self.data, self.offset))
+
+
+@dataclass(slots=True, kw_only=True)
+class WriteV(IOOperation[WriteResult]):
+    """Writes several buffers to a file as one vectored write, without joining them."""
+
+    result_type = WriteResult
+    fd: int
+
+    """Whether fd is an index into the worker's registered files"""
+    fixed_file: bool = False
+
+    """The buffers to write, in order. Any bytes-like objects, not copied"""
+    buffers: list[Buffer]
+
+    """Offset for file write"""
+    offset: int = 0
+
+    @override
+    def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
+        """Prepares a submission queue entry for the SQ."""
+        if self.fixed_file:
+            ring.set_sqe_flags(user_data, SqeFlags.FIXED_FILE)
+        ring.prep_writev(user_data, self.fd, self.buffers, self.offset)
+
+    @override
+    def extract(self, completion_event: CompletionEvent) -> WriteResult:
+        """Extract fields from a completion queue event and wrap in correct type."""
+        return WriteResult(
+            size=completion_event.res,
+        )
+
+
+@dataclass(slots=True, kw_only=True)
+class ReadFixed(IOOperation[ReadResult]):
+    """Reads into a buffer of a pool registered with the worker.
+
+    Works for both regular files and sockets. Without a buf_index, a buffer is
+    acquired from the pool on prep and released again once the read completes.
+    """
+
+    result_type = ReadResult
+    fd: int
+
+    """Whether fd is an index into the worker's registered files"""
+    fixed_file: bool = False
+
+    """Pool the buffer was registered from"""
+    pool: BufferPool = field(repr=False)
+
+    """Index of the registered buffer to read into. Acquired per read if None"""
+    buf_index: int | None = None
+
+    """Number of bytes to read. Defaults to the full buffer"""
+    size: int | None = None
+
+    """Offset for file read"""
+    offset: int = 0
+
+    """Resolved number of bytes to read"""
+    _size: int = field(init=False, repr=False)
+
+    """Index of the buffer the in-flight read uses"""
+    _buf_index: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Resolves the read size once, keeping prep to the native call."""
+        self._size = self.pool.size if self.size is None else self.size
+
+    @override
+    def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
+        """Prepares a submission queue entry for the SQ."""
+        self._buf_index = (
+            self.pool.acquire() if self.buf_index is None else self.buf_index
+        )
+        if self.fixed_file:
+            ring.set_sqe_flags(user_data, SqeFlags.FIXED_FILE)
+        ring.prep_read_fixed(
+            user_data, self.fd, self._buf_index, self._size, self.offset
+        )
+
+    @override
+    def extract(self, completion_event: CompletionEvent) -> ReadResult:
+        """Extract fields from a completion queue event and wrap in correct type."""
+        res = completion_event.res
+        content = _copy_prefix(self.pool.buffers[self._buf_index], res)
+        self._release()
+        return ReadResult(
+            content=content,
+            size=res,
+        )
+
+    @override
+    def is_error(self, completion_event: CompletionEvent) -> bool:
+        """Determines if the completion event is an error.
+
+        A failed read is never extracted, so an acquired buffer is released here.
+        """
+        if error := IOOperation.is_error(self, completion_event):
+            self._release()
+        return error
+
+    def _release(self) -> None:
+        """Returns the buffer to the pool, if it was acquired for this read."""
+        if self.buf_index is None:
+            self.pool.release(self._buf_index)
+
+
+@dataclass(slots=True, kw_only=True)
+class WriteFixed(IOOperation[WriteResult]):
+    """Writes from a buffer of a pool registered with the worker.
+
+    The caller fills the buffer before registering the operation. Works for both
+    regular files and sockets.
+    """
+
+    result_type = WriteResult
+    fd: int
+
+    """Whether fd is an index into the worker's registered files"""
+    fixed_file: bool = False
+
+    """Pool the buffer was registered from"""
+    pool: BufferPool = field(repr=False)
+
+    """Index of the registered buffer to write from"""
+    buf_index: int
+
+    """Number of bytes of the buffer to write"""
+    size: int
+
+    """Offset for file write"""
+    offset: int = 0
+
+    @override
+    def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
+        """Prepares a submission queue entry for the SQ."""
+        if self.fixed_file:
+            ring.set_sqe_flags(user_data, SqeFlags.FIXED_FILE)
+        ring.prep_write_fixed(
+            user_data, self.fd, self.buf_index, self.size, self.offset
+        )
+
+    @override
+    def extract(self, completion_event: CompletionEvent) -> WriteResult:
+        """Extract fields from a completion queue event and wrap in correct type."""
+        return WriteResult(
+            size=completion_event.res,
+        )
+
 
 @dataclass(slots=True, kw_only=True)
 class Close(IOOperation[CloseResult]):
@@ -260,15 +559,26 @@ class Close(IOOperation[CloseResult]):
     result_type = CloseResult
     fd: int
 
+    """Whether fd is an index into the worker's registered files, to be emptied"""
+    fixed_file: bool = False
+
     @override
     def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
         """Prepares a submission queue entry for the SQ."""
-        ring.prep_close(user_data, self.fd)
+        ring.prep_close(user_data, self.fd, self.fixed_file)
 
     @override
     def extract(self, completion_event: CompletionEvent) -> CloseResult:
         """Extract fields from a completion queue event and wrap in correct type."""
-        return CloseResult()
+        return _CLOSE_RESULT
+
+    @override
+    def run(self) -> CloseResult | None:
+        """Closes with a plain close, unless fd is a registered file index."""
+        if self.fixed_file:
+            return None
+        os.close(self.fd)
+        return _CLOSE_RESULT
 
 
 @dataclass(slots=True, kw_only=True)
@@ -276,25 +586,32 @@ class Sleep(IOOperation[SleepResult]):
     """File descriptor for the regular file."""
 
     result_type = SleepResult
+
+    # Timeouts complete with -ETIME when they expire.
+    ok_errnos = frozenset({-errno.ETIME})
+
     time: float
-    _timespec: Any = field(init=False, repr=False)
+
+    """Whole seconds of time"""
+    _sec: int = field(init=False, repr=False)
+
+    """Remaining nanoseconds of time"""
+    _nsec: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Splits time into seconds and nanoseconds once, keeping prep native."""
+        self._sec = int(self.time)
+        self._nsec = int((self.time - self._sec) * 1_000_000_000)
 
     @override
     def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
         """Prepares a submission queue entry for the SQ."""
-        sec = int(self.time)
-        nsec = int((self.time - sec) * 1_000_000_000)
-        ring.prep_timeout(user_data, sec, nsec)
+        ring.prep_timeout(user_data, self._sec, self._nsec)
 
     @override
     def extract(self, completion_event: CompletionEvent) -> SleepResult:
         """Extract fields from a completion queue event and wrap in correct type."""
-        return SleepResult()
-
-    @override
-    def is_error(self, completion_event: CompletionEvent) -> bool:
-        """Override since timeout returns -ETIME on success."""
-        return completion_event.res != -errno.ETIME
+        return _SLEEP_RESULT
 
 
 @dataclass(slots=True, kw_only=True)
@@ -331,23 +648,23 @@ class SocketSetOpt(IOOperation[SocketSetOptResult]):
     """The file descriptor of the socket"""
     fd: int
 
-    """Docstring"""
+    """The protocol level of the option"""
     level: int = SockOptLevel.SOCKET
 
-    """Docstring"""
+    """The option to set"""
     optname: int = SockOpt.REUSEADDR
 
-    """Docstring"""
-    val: array.array = field(default_factory=lambda: array.array("i", [1]))
+    """The integer value to set the option to"""
+    val: int = 1
 
     @override
     def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
-        ring.prep_socket_setopt(user_data, self.fd)
+        ring.prep_socket_setopt(user_data, self.fd, self.level, self.optname, self.val)
 
     @override
     def extract(self, completion_event: CompletionEvent) -> SocketSetOptResult:
         """Produce a typed sentinel completion event."""
-        return SocketSetOptResult()
+        return _SOCKET_SET_OPT_RESULT
 
 
 @dataclass(slots=True, kw_only=True)
@@ -364,6 +681,7 @@ class SocketBind(IOOperation[SocketBindResult]):
     """The port to assign"""
     port: int
 
+    """Native sockaddr, parsed and packed once from ip and port on construction"""
     _sockaddr: SockAddr = field(init=False)
 
     """Address family"""
@@ -371,10 +689,7 @@ class SocketBind(IOOperation[SocketBindResult]):
 
     def __post_init__(self) -> None:
         """Initializes socket address attribute."""
-        if self.address_family == AddressFamily.INET:
-            self._sockaddr = SockAddr.v4(ip=self.ip, port=self.port)
-        else:
-            self._sockaddr = SockAddr.v6(ip=self.ip, port=self.port)
+        self._sockaddr = _sockaddr(self.address_family, self.ip, self.port)
 
     @override
     def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
@@ -383,7 +698,59 @@ class SocketBind(IOOperation[SocketBindResult]):
     @override
     def extract(self, completion_event: CompletionEvent) -> SocketBindResult:
         """Produce a typed sentinel completion event.."""
-        return SocketBindResult()
+        return _SOCKET_BIND_RESULT
+
+
+@dataclass(slots=True, kw_only=True)
+class SocketBindListen(IOOperation[SocketListenResult]):
+    """Sets SO_REUSEADDR on, binds and listens on a socket in one linked submission.
+
+    The three steps are linked, so they run in order without a round trip between
+    them, and only the final step posts a completion on success. If a step fails,
+    its error is the result and the remaining steps are cancelled.
+    """
+
+    result_type = SocketListenResult
+
+    entries = 3
+
+    """The file descriptor of the socket"""
+    fd: int
+
+    """The IP to assign"""
+    ip: str
+
+    """The port to assign"""
+    port: int
+
+    """Address family"""
+    address_family: AddressFamily = AddressFamily.INET
+
+    """maximum number of connections the kernel will queue before accept"""
+    backlog: int = 128
+
+    """Native sockaddr, parsed and packed once from ip and port on construction"""
+    _sockaddr: SockAddr = field(init=False)
+
+    # Links a step to the next, and skips its completion unless it fails.
+    _LINK_FLAGS: ClassVar[int] = SqeFlags.IO_LINK | SqeFlags.CQE_SKIP_SUCCESS
+
+    def __post_init__(self) -> None:
+        """Initializes socket address attribute."""
+        self._sockaddr = _sockaddr(self.address_family, self.ip, self.port)
+
+    @override
+    def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
+        ring.reserve(self.entries)
+        ring.set_sqe_flags(user_data, self._LINK_FLAGS)
+        ring.prep_socket_setopt(user_data, self.fd)
+        ring.set_sqe_flags(user_data, self._LINK_FLAGS)
+        ring.prep_socket_bind(user_data, self.fd, self._sockaddr)
+        ring.prep_socket_listen(user_data, self.fd, self.backlog)
+
+    @override
+    def extract(self, completion_event: CompletionEvent) -> SocketListenResult:
+        return _SOCKET_LISTEN_RESULT
 
 
 @dataclass(slots=True, kw_only=True)
@@ -403,25 +770,48 @@ class SocketListen(IOOperation[SocketListenResult]):
 
     @override
     def extract(self, completion_event: CompletionEvent) -> SocketListenResult:
-        return SocketListenResult()
+        return _SOCKET_LISTEN_RESULT
 
 
 @dataclass(slots=True, kw_only=True)
 class SocketAccept(IOOperation[SocketAcceptResult]):
-    """Accepts a connection on a socket."""
+    """Accepts a connection on a socket.
+
+    With multishot set, a single submission accepts every incoming connection until
+    cancelled or failed, completing once per connection.
+    """
 
     result_type = SocketAcceptResult
     """The file descriptor of the socket"""
     fd: int
 
+    """Whether fd is an index into the worker's registered files"""
+    fixed_file: bool = False
+
+    """Whether to keep accepting connections from a single submission"""
+    multishot: bool = False
+
     @override
     def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
-        ring.prep_socket_accept(user_data, self.fd)
+        if self.fixed_file:
+            ring.set_sqe_flags(user_data, SqeFlags.FIXED_FILE)
+        if self.multishot:
+            ring.prep_socket_accept_multishot(user_data, self.fd)
+        else:
+            ring.prep_socket_accept(user_data, self.fd)
 
     @override
     def extract(self, completion_event: CompletionEvent) -> SocketAcceptResult:
         return SocketAcceptResult(fd=completion_event.res)
 
+    @override
+    def is_multishot(self) -> bool:
+        return self.multishot
+
+    @override
+    def discard(self, result: SocketAcceptResult) -> None:
+        os.close(result.fd)
+
 
 @dataclass(slots=True, kw_only=True)
 class SocketRecv(IOOperation[SocketRecvResult]):
@@ -431,28 +821,118 @@ class SocketRecv(IOOperation[SocketRecvResult]):
     """The socket file descriptor to read from"""
     fd: int
 
+    """Whether fd is an index into the worker's registered files"""
+    fixed_file: bool = False
+
     """The length of the read content"""
     size: int
 
+    """Caller owned buffer to receive into, reused instead of allocating one"""
+    buffer: bytearray | None = field(default=None, repr=False)
+
     """Buffer to be filled with contents from read operation"""
     _buffer: bytearray = field(init=False, repr=False)
 
-    def __post_init__(self) -> None:
-        """Initializes buffer."""
-        self._buffer = bytearray(self.size)
+    @override
+    def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
+        # Allocated on prep, like Read, so an operation that is never submitted
+        # never allocates.
+        self._buffer = bytearray(self.size) if self.buffer is None else self.buffer
+        if self.fixed_file:
+            ring.set_sqe_flags(user_data, SqeFlags.FIXED_FILE)
+        ring.prep_socket_recv(user_data, self.fd, self._buffer, self.size)
+
+    @override
+    def extract(self, completion_event: CompletionEvent) -> SocketRecvResult:
+        res = completion_event.res
+        if self.buffer is not None:
+            # The caller reuses its buffer for the next receive, so copy out.
+            return SocketRecvResult(content=_copy_prefix(self._buffer, res), size=res)
+        buffer = self._buffer
+        del buffer[res:]
+        return SocketRecvResult(content=buffer, size=res)
+
+
+@dataclass(slots=True, kw_only=True)
+class SocketRecvMulti(IOOperation[SocketRecvResult]):
+    """Receives from a socket repeatedly, into buffers picked from a BufferGroup.
+
+    A single submission completes once per received message, until cancelled, the
+    peer closes or the group runs out of buffers. Each result's buffer_id has to be
+    given back with ProvideBuffers for the kernel to reuse it.
+    """
+
+    result_type = SocketRecvResult
+    """The socket file descriptor to read from"""
+    fd: int
+
+    """The buffers the kernel receives into"""
+    group: BufferGroup = field(repr=False)
 
     @override
     def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
-        ring.prep_socket_recv(user_data, self.fd, self._buffer)
+        ring.prep_socket_recv_multishot(user_data, self.fd, self.group.group_id)
+
+    @override
+    def is_multishot(self) -> bool:
+        return True
 
     @override
     def extract(self, completion_event: CompletionEvent) -> SocketRecvResult:
+        res = completion_event.res
+        flags = completion_event.flags
+        if not flags & IORING_CQE_F_BUFFER:
+            # Nothing received, e.g. on EOF.
+            return SocketRecvResult(content=b"", size=res)
+
+        buffer_id = flags >> IORING_CQE_BUFFER_SHIFT
         return SocketRecvResult(
-            content=bytes(self._buffer[: completion_event.res]),
-            size=completion_event.res,
+            content=self.group.read(buffer_id, res),
+            size=res,
+            buffer_id=buffer_id,
         )
 
 
+@dataclass(slots=True, kw_only=True)
+class ProvideBuffers(IOOperation[ProvideBuffersResult]):
+    """Provides a BufferGroup's buffers to the kernel, or gives consumed ones back."""
+
+    result_type = ProvideBuffersResult
+
+    """The group to provide buffers of"""
+    group: BufferGroup = field(repr=False)
+
+    """Id of the first buffer to provide"""
+    buffer_id: int = 0
+
+    """Number of buffers to provide. Defaults to the rest of the group"""
+    count: int | None = None
+
+    """Resolved number of buffers to provide"""
+    _count: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Resolves the buffer count once, keeping prep to the native call."""
+        self._count = (
+            self.group.count - self.buffer_id if self.count is None else self.count
+        )
+
+    @override
+    def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
+        ring.prep_provide_buffers(
+            user_data,
+            self.group.buffer,
+            self.group.size,
+            self._count,
+            self.group.group_id,
+            self.buffer_id,
+        )
+
+    @override
+    def extract(self, completion_event: CompletionEvent) -> ProvideBuffersResult:
+        return _PROVIDE_BUFFERS_RESULT
+
+
 @dataclass(slots=True, kw_only=True)
 class SocketSend(IOOperation[SocketSendResult]):
     """Sends data to a socket."""
@@ -461,11 +941,16 @@ class SocketSend(IOOperation[SocketSendResult]):
     """The file descriptor of the socket to send data to."""
     fd: int
 
-    """The data to send."""
-    data: bytes
+    """Whether fd is an index into the worker's registered files"""
+    fixed_file: bool = False
+
+    """The data to send. Any bytes-like object, passed to the kernel as is."""
+    data: Buffer
 
     @override
     def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
+        if self.fixed_file:
+            ring.set_sqe_flags(user_data, SqeFlags.FIXED_FILE)
         ring.prep_socket_send(user_data, self.fd, self.data)
 
     @override
@@ -473,6 +958,62 @@ class SocketSend(IOOperation[SocketSendResult]):
         return SocketSendResult(size=completion_event.res)
 
 
+@dataclass(slots=True, kw_only=True)
+class SocketSendZC(IOOperation[SocketSendResult]):
+    """Sends data to a socket without the kernel copying it first.
+
+    Pays off for large payloads only, as the kernel has to notify when it is done
+    with the data, which costs a second completion. The data is sent while the
+    operation is in flight, so it must not be modified until it completes.
+    """
+
+    result_type = SocketSendResult
+    notifies = True
+    """The file descriptor of the socket to send data to."""
+    fd: int
+
+    """Whether fd is an index into the worker's registered files"""
+    fixed_file: bool = False
+
+    """The data to send. Any bytes-like object, passed to the kernel as is."""
+    data: Buffer
+
+    @override
+    def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
+        if self.fixed_file:
+            ring.set_sqe_flags(user_data, SqeFlags.FIXED_FILE)
+        ring.prep_socket_send_zc(user_data, self.fd, self.data)
+
+    @override
+    def extract(self, completion_event: CompletionEvent) -> SocketSendResult:
+        return SocketSendResult(size=completion_event.res)
+
+
+@dataclass(slots=True, kw_only=True)
+class SocketSendMsg(IOOperation[SocketSendResult]):
+    """Sends several buffers to a socket as one scatter send, without joining them."""
+
+    result_type = SocketSendResult
+    """The file descriptor of the socket to send data to."""
+    fd: int
+
+    """Whether fd is an index into the worker's registered files"""
+    fixed_file: bool = False
+
+    """The buffers to send, in order. Any bytes-like objects"""
+    buffers: list[Buffer]
+
+    @override
+    def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
+        if self.fixed_file:
+            ring.set_sqe_flags(user_data, SqeFlags.FIXED_FILE)
+        ring.prep_socket_sendmsg(user_data, self.fd, self.buffers)
+
+    @override
+    def extract(self, completion_event: CompletionEvent) -> SocketSendResult:
+        return SocketSendResult(size=completion_event.res)
+
+
 @dataclass(slots=True, kw_only=True)
 class SocketConnect(IOOperation[SocketConnectResult]):
     """Connects to a socket."""
@@ -490,14 +1031,12 @@ class SocketConnect(IOOperation[SocketConnectResult]):
     """The address family"""
     address_family: AddressFamily = AddressFamily.INET
 
+    """Native sockaddr, parsed and packed once from ip and port on construction"""
     _sockaddr: SockAddr = field(init=False)
 
     def __post_init__(self) -> None:
         """Initializes socket address attribute."""
-        if self.address_family == AddressFamily.INET:
-            self._sockaddr = SockAddr.v4(ip=self.ip, port=self.port)
-        else:
-            self._sockaddr = SockAddr.v6(ip=self.ip, port=self.port)
+        self._sockaddr = _sockaddr(self.address_family, self.ip, self.port)
 
     @override
     def prep(self, user_data: WorkerOperationID, ring: Ring) -> None:
@@ -505,4 +1044,4 @@ class SocketConnect(IOOperation[SocketConnectResult]):
 
     @override
     def extract(self, completion_event: CompletionEvent) -> SocketConnectResult:
-        return SocketConnectResult()
+        return _SOCKET_CONNECT_RESULT
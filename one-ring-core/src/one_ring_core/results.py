@@ -7,9 +7,13 @@ if TYPE_CHECKING:
     from one_ring_core.typedefs import WorkerOperationID
 
 
-@dataclass(slots=True, kw_only=True, frozen=True)
+@dataclass(slots=True, kw_only=True)
 class IOCompletion[T: IOResult]:
-    """Wrapper around IO completion result."""
+    """Wrapper around IO completion result.
+
+    Unlike the results, not frozen: one is built for every completion, and a frozen
+    dataclass sets each field through object.__setattr__, doubling the cost.
+    """
 
     """user_data identifier of completed operation"""
     user_data: WorkerOperationID
@@ -17,6 +21,9 @@ class IOCompletion[T: IOResult]:
     """Result of operation. OSError if failed"""
     result: T | OSError
 
+    """Whether the (multishot) operation stays armed and will complete again"""
+    more: bool = False
+
     def unwrap(self) -> T:
         """Rust style unwrapping of results."""
         if isinstance(self.result, OSError):
@@ -65,7 +72,7 @@ class ReadResult(IOResult):
     """Result of a read operation."""
 
     """Data read"""
-    content: bytes
+    content: bytes | bytearray
 
     """Number of bytes in data read"""
     size: int
@@ -125,11 +132,19 @@ class SocketRecvResult(IOResult):
     """Result for reading from socket."""
 
     """Data received in bytes"""
-    content: bytes
+    content: bytes | bytearray
 
     """Size of data received"""
     size: int
 
+    """Id of the provided buffer received into, to be given back to the kernel"""
+    buffer_id: int | None = None
+
+
+@dataclass(slots=True, kw_only=True, frozen=True)
+class ProvideBuffersResult(IOResult):
+    """Sentinel result for providing buffers to the kernel."""
+
 
 @dataclass(slots=True, kw_only=True, frozen=True)
 class SocketSendResult(IOResult):
@@ -2,36 +2,110 @@
 
 from __future__ import annotations
 
+import errno
 import os
-from contextlib import ExitStack
+from collections import deque
 from dataclasses import dataclass, field
+from functools import cache
 from typing import TYPE_CHECKING, Self
 
+from one_ring_core.constants import SqeFlags
 from one_ring_core.log import get_logger
 from one_ring_core.results import IOCompletion, IOResult
-from rusty_ring import CompletionEvent, Ring
+from rusty_ring import (
+    IORING_CQE_F_MORE,
+    IORING_CQE_F_NOTIF,
+    IORING_OP_SEND_ZC,
+    CompletionEvent,
+    Ring,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from types import TracebackType
 
+    from one_ring_core.buffers import BufferPool
     from one_ring_core.operations import IOOperation
     from one_ring_core.typedefs import WorkerOperationID
 
 
 logger = get_logger(__name__)
 
+# Error messages by errno. There are few errnos and the same ones recur, so each
+# message is built once instead of on every failed completion.
+_strerror = cache(os.strerror)
+
 
 @dataclass(slots=True, kw_only=True)
 class IOWorker:
     """Thin wrapper around rusty_ring.Ring for type based operation registration."""
 
+    """Number of SQ entries. More registrations than this between submits are fine,
+    as the ring submits whenever its SQ fills up"""
+    depth: int = 128
+
+    """Number of CQ entries. Larger than depth, as multishot operations post several
+    completions per submission, and a full CQ sends the kernel down a slow path"""
+    cq_entries: int = 4096
+
+    """Whether a kernel thread polls the SQ, making most submits syscall free.
+
+    Pays off for file-heavy, high-IOPS workloads, but tends to cost throughput for
+    socket-heavy ones, hence off by default.
+    """
+    sqpoll: bool = False
+
+    """Milliseconds the SQ polling thread spins idle before sleeping"""
+    sq_thread_idle: int = 1000
+
+    """Whether a lone operation in a submit is performed with a plain syscall.
+
+    Spares the ring round trip for a single close, or a single read or write of a
+    range flagged as cached. Only operations whose syscall can't block qualify, see
+    IOOperation.run. Off by default.
+    """
+    syscall_fallback: bool = False
+
+    """Whether the kernel supports zero-copy sends, which need Linux 6.0. Probed
+    once on enter"""
+    send_zc: bool = field(default=False, init=False)
+
+    # In-flight operations by identifier. A dict rather than an array indexed by
+    # identifier, as identifiers are chosen by the caller and need not be dense.
     _active_submissions: dict[WorkerOperationID, IOOperation] = field(
         default_factory=dict, init=False
     )
 
     _ring: Ring = field(init=False)
 
-    _stack: ExitStack = field(init=False)
+    # CQEs still to come from the cancelled steps of failed multi-entry operations,
+    # by identifier. A count can outlive its chain when a later step is the one
+    # failing, as fewer steps are left to cancel. That costs one dict entry.
+    _trailing: dict[WorkerOperationID, int] = field(default_factory=dict, init=False)
+
+    # Operations registered since the last submit.
+    _unsubmitted: int = field(default=0, init=False)
+
+    # With syscall_fallback, the first operation registered since the last submit
+    # is held back unprepped, until it is known whether it is submitted alone.
+    _deferred: tuple[WorkerOperationID, IOOperation] | None = field(
+        default=None, init=False
+    )
+
+    # Completions of operations performed with a plain syscall, not yet returned.
+    _ready: deque[IOCompletion[IOResult]] = field(default_factory=deque, init=False)
+
+    # Empty slots of the registered files, for add_file to fill.
+    _free_file_slots: list[int] = field(default_factory=list, init=False)
+
+    # Ring methods are bound once on enter, as they are called every loop tick.
+    _ring_submit: Callable[[], int] = field(init=False)
+
+    _ring_wait: Callable[[], CompletionEvent] = field(init=False)
+
+    _ring_peek: Callable[[], CompletionEvent | None] = field(init=False)
+
+    _ring_peek_batch: Callable[[int], list[CompletionEvent]] = field(init=False)
 
     def register(
         self,
@@ -39,41 +113,138 @@ class IOWorker:
         identifier: WorkerOperationID,
     ) -> WorkerOperationID:
         """Registers operation in the SQ."""
-        operation.prep(identifier, self._ring)
-
-        self._add_submission(identifier, operation)
+        if self.syscall_fallback:
+            if not self._unsubmitted:
+                self._deferred = (identifier, operation)
+                self._unsubmitted = 1
+                return identifier
+            self._prep_deferred()
+        self._prep(operation, identifier)
         return identifier
 
-    def _add_submission(
-        self, identifier: WorkerOperationID, operation: IOOperation
-    ) -> None:
-        self._active_submissions[identifier] = operation
+    def link(self, *registrations: tuple[IOOperation, WorkerOperationID]) -> None:
+        """Registers operations as a chain, each starting once the previous succeeds.
+
+        The kernel runs the chain in order without a round trip between steps. Each
+        operation still completes on its own. If one fails, the rest of the chain
+        completes with ECANCELED. An operation that prepares several entries, like
+        SocketBindListen, can only end a chain.
+
+        The chain is always submitted as a whole. If the ring's SQ can't hold it
+        next to what is already registered, those are submitted first.
+
+        Raises:
+            ValueError: if no operations are given, or one that prepares several
+                entries doesn't end the chain.
+        """
+        if not registrations:
+            msg = "A chain needs at least one operation"
+            raise ValueError(msg)
+        for operation, _ in registrations[:-1]:
+            if operation.entries > 1:
+                msg = f"{type(operation).__name__} can only end a chain"
+                raise ValueError(msg)
+
+        self._prep_deferred()
+        self._ring.reserve(sum(operation.entries for operation, _ in registrations))
+        *head, last = registrations
+        for operation, identifier in head:
+            self._ring.set_sqe_flags(identifier, SqeFlags.IO_LINK)
+            self._prep(operation, identifier)
+        self._prep(*last)
+
+    def register_buffers(self, pool: BufferPool) -> None:
+        """Registers a pool's buffers with the kernel, for fixed buffer IO.
+
+        Only one pool can be registered at a time.
+        """
+        self._ring.register_buffers(pool.buffers)
+
+    def unregister_buffers(self) -> None:
+        """Unregisters the currently registered buffer pool."""
+        self._ring.unregister_buffers()
+
+    def register_files(self, fds: list[int]) -> None:
+        """Registers file descriptors with the kernel as fixed files.
+
+        Operations with fixed_file set then pass the index of a fd in `fds` instead
+        of the fd itself, which skips the kernel's per-operation fd lookup. A fd of
+        -1 reserves an empty slot, to be filled with update_files or add_file.
+        """
+        self._ring.register_files(fds)
+        self._free_file_slots = [
+            index for index in reversed(range(len(fds))) if fds[index] == -1
+        ]
+
+    def update_files(self, offset: int, fds: list[int]) -> None:
+        """Replaces the registered files starting at index offset."""
+        self._ring.register_files_update(offset, fds)
 
-    def _pop_submission(self, identifier: WorkerOperationID) -> IOOperation:
-        """Pops a submission from the internal tracking of active submissions.
+    def add_file(self, fd: int) -> int:
+        """Places a fd in an empty slot of the registered files.
 
-        Args:
-            user_data: the submission to pop.
-            identifier: the identifier provided externally for the IO operation.
+        Filling a slot costs a syscall of its own, so this pays off for fds that
+        serve many operations, like long-lived connections.
 
         Returns:
-            The popped submission.
+            The index to pass as fd to operations with fixed_file set.
+
+        Raises:
+            OSError: if no empty slot is left.
         """
-        return self._active_submissions.pop(identifier)
+        if not self._free_file_slots:
+            raise OSError(errno.ENFILE, "No empty registered file slot")
+        index = self._free_file_slots.pop()
+        self._ring.register_files_update(index, [fd])
+        return index
+
+    def remove_file(self, index: int) -> None:
+        """Empties a slot filled by add_file. The fd itself is left open."""
+        self._ring.register_files_update(index, [-1])
+        self._free_file_slots.append(index)
+
+    def unregister_files(self) -> None:
+        """Unregisters all registered files."""
+        self._ring.unregister_files()
+        self._free_file_slots = []
 
     def submit(self) -> None:
-        """Submits the SQ to the kernel."""
+        """Submits all operations registered since the last submit to the kernel.
+
+        Register a batch of operations first and submit once, as every non-empty
+        submit costs a syscall. Batches larger than the ring's depth need no special
+        handling, as the ring flushes its SQ to the kernel whenever it fills up.
+        Does nothing if no operation has been registered.
+        """
         # This should check that all new registrations where actually submitted
-        self._ring.submit()
+        if self._unsubmitted:
+            deferred = self._deferred
+            if deferred is None or not self._run_deferred(*deferred):
+                self._ring_submit()
+            self._unsubmitted = 0
 
     def wait(self) -> IOCompletion[IOResult]:
         """Blocking check if a completion event is available.
 
+        Operations registered since the last submit are submitted in the same
+        syscall, so there is no need to submit before a wait.
+
         Returns:
             IOCompletion
         """
-        completion_event = self._ring.wait()
-        return self._transform_completion_event(completion_event)
+        if self._deferred is not None:
+            self.submit()
+        if self._ready:
+            return self._ready.popleft()
+        while True:
+            completion_event = self._ring_wait()
+            # The wait submitted everything registered. Not cleared up front, as the
+            # wait may fail before submitting.
+            self._unsubmitted = 0
+            if (
+                completion := self._transform_completion_event(completion_event)
+            ) is not None:
+                return completion
 
     def peek(self) -> IOCompletion[IOResult] | None:
         """Nonblocking check if a completion event is available.
@@ -81,16 +252,57 @@ class IOWorker:
         Returns:
             IOCompletion if available, otherwise None.
         """
-        if (completion_event := self._ring.peek()) is not None:
-            return self._transform_completion_event(completion_event)
+        if self._ready:
+            return self._ready.popleft()
+        while (completion_event := self._ring_peek()) is not None:
+            if (
+                completion := self._transform_completion_event(completion_event)
+            ) is not None:
+                return completion
+
+        return None
 
-        return completion_event
+    def drain(self, max_events: int = 64) -> list[IOCompletion[IOResult]]:
+        """Nonblocking collection of all available completion events.
+
+        Completion events are taken from the ring up to max_events at a time, so
+        the CQ head is advanced once per batch rather than once per event.
+
+        Returns:
+            The available IOCompletions, which may be none.
+        """
+        completions: list[IOCompletion[IOResult]] = []
+        if self._ready:
+            completions.extend(self._ready)
+            self._ready.clear()
+        while completion_events := self._ring_peek_batch(max_events):
+            completions.extend(
+                completion
+                for completion_event in completion_events
+                if (completion := self._transform_completion_event(completion_event))
+                is not None
+            )
+            if len(completion_events) < max_events:
+                break
+        return completions
 
     def __enter__(self) -> Self:
-        """Thin wrapper around rusty_ring.Ring's context manager."""
-        self._stack = ExitStack()
-        self._stack.__enter__()
-        self._ring = self._stack.enter_context(Ring(depth=32))
+        """Thin wrapper around rusty_ring.Ring's context manager.
+
+        The ring is the only resource, so it is entered directly, without an
+        ExitStack around it.
+        """
+        self._ring = Ring(
+            depth=self.depth,
+            cq_entries=self.cq_entries,
+            sqpoll=self.sqpoll,
+            sq_thread_idle=self.sq_thread_idle,
+        ).__enter__()
+        self.send_zc = self._ring.supports(IORING_OP_SEND_ZC)
+        self._ring_submit = self._ring.submit
+        self._ring_wait = self._ring.wait
+        self._ring_peek = self._ring.peek
+        self._ring_peek_batch = self._ring.peek_batch
         return self
 
     def __exit__(
@@ -100,27 +312,120 @@ class IOWorker:
         exc_tb: TracebackType | None,
     ) -> bool | None:
         """Thin wrapper around rusty_ring.Ring's context manager."""
-        self._stack.__exit__(exc_type, exc_val, exc_tb)
+        return self._ring.__exit__(exc_type, exc_val, exc_tb)
+
+    def _prep(self, operation: IOOperation, identifier: WorkerOperationID) -> None:
+        """Preps an operation for submission with the ring, and tracks it.
+
+        If the prep fails within a linked chain, the chain is ended in its place,
+        so the entries already prepped don't link to an unrelated operation.
+        """
+        try:
+            operation.prep(identifier, self._ring)
+        except BaseException:
+            if self._ring.end_link(identifier):
+                # The no-op ending the chain in its place completes on its own.
+                self._trailing[identifier] = 1
+                self._unsubmitted += 1
+            raise
+        self._active_submissions[identifier] = operation
+        self._unsubmitted += 1
+
+    def _prep_deferred(self) -> None:
+        """Preps the held back operation, if any, for submission with the ring."""
+        if self._deferred is not None:
+            identifier, operation = self._deferred
+            self._deferred = None
+            # It was counted as unsubmitted when held back.
+            self._unsubmitted -= 1
+            self._prep(operation, identifier)
+
+    def _run_deferred(
+        self, identifier: WorkerOperationID, operation: IOOperation
+    ) -> bool:
+        """Performs the held back operation with a plain syscall, if it can be.
+
+        Otherwise, it is prepped for submission with the ring instead.
+
+        Returns:
+            Whether the operation was performed.
+        """
+        try:
+            result = operation.run()
+        except OSError as e:
+            result = e
+        if result is None:
+            self._prep_deferred()
+            return False
+        self._deferred = None
+        self._ready.append(IOCompletion(user_data=identifier, result=result))
+        return True
+
+    def _drop_unknown(self, completion_event: CompletionEvent) -> None:
+        """Drops a completion for an identifier with no operation in flight.
+
+        Expected only for the cancelled steps of a failed multi-entry operation, and
+        for the no-op ending a linked chain whose prep failed partway. Anything else
+        is a bookkeeping bug, and logged as such.
+        """
+        user_data = completion_event.user_data
+        remaining = self._trailing.get(user_data)
+        if remaining is not None and completion_event.res in {0, -errno.ECANCELED}:
+            if remaining > 1:
+                self._trailing[user_data] = remaining - 1
+            else:
+                del self._trailing[user_data]
+            return
+        logger.error(
+            "Completion for unknown operation",
+            user_data=user_data,
+            res=completion_event.res,
+            flags=completion_event.flags,
+        )
 
     def _transform_completion_event(
         self,
         completion_event: CompletionEvent,
-    ) -> IOCompletion[IOResult]:
-        """Fetches data from completion event and transforms to relevant type."""
+    ) -> IOCompletion[IOResult] | None:
+        """Fetches data from completion event and transforms to relevant type.
+
+        Returns None for the completions of the cancelled steps that follow a failed
+        step of a multi-entry operation, as the failure already completed it. Also
+        returns None for the notification that a zero-copy send is done with its
+        buffer. A completion for an unknown identifier is logged and dropped.
+        """
         user_data = completion_event.user_data
+        flags = completion_event.flags
         # Now we need to handle the CQE based on the operation type of the submission.
-        operation: IOOperation[IOResult] = self._pop_submission(user_data)
+        # A multishot operation stays registered until its final completion. The
+        # plain int flag is used, as masking with an IntFlag builds an enum member.
+        more = bool(flags & IORING_CQE_F_MORE)
+        # The tracking dict is accessed directly, as this runs for every completion.
+        operation: IOOperation[IOResult] | None = (
+            self._active_submissions.get(user_data)
+            if more
+            else self._active_submissions.pop(user_data, None)
+        )
+        if operation is None:
+            self._drop_unknown(completion_event)
+            return None
+        if flags & IORING_CQE_F_NOTIF:
+            # A zero-copy send's notification only releases its buffer.
+            return None
 
-        # Check for failures.
+        # Check for failures. Only negative results can be errors, so the common
+        # successful completion skips the is_error call.
         cqe_result = completion_event.res
-        if not operation.is_error(completion_event):
+        if cqe_result >= 0 or not operation.is_error(completion_event):
             result = operation.extract(completion_event)
         else:
             error_code = -cqe_result
-            error_message = os.strerror(error_code)
-            result = OSError(-cqe_result, error_message)
+            result = OSError(error_code, _strerror(error_code))
+            if operation.entries > 1:
+                self._trailing[user_data] = operation.entries - 1
 
         return IOCompletion(
             user_data=user_data,
             result=result,
+            more=more and not operation.notifies,
         )
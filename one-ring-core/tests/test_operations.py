@@ -1,8 +1,29 @@
+import inspect
+import os
+import tempfile
 from pathlib import Path
 
+import pytest
+
+from one_ring_core import operations
+from one_ring_core.buffers import BufferPool
 from one_ring_core.log import get_logger
-from one_ring_core.operations import Statx
-from one_ring_core.results import StatxResult
+from one_ring_core.operations import (
+    FileOpen,
+    IOOperation,
+    Read,
+    ReadFixed,
+    SocketAccept,
+    Statx,
+    WriteFixed,
+)
+from one_ring_core.results import (
+    FileOpenResult,
+    ReadResult,
+    SocketAcceptResult,
+    StatxResult,
+    WriteResult,
+)
 from one_ring_core.worker import IOWorker
 
 logger = get_logger(__name__)
@@ -22,3 +43,114 @@ def test_statx() -> None:
     assert Path(path).stat().st_ino == res.ino
     assert Path(path).stat().st_mode == res.mode
     assert int(Path(path).stat().st_mtime) == res.mtime_sec
+
+
+def test_buffer_pool_shares_one_slab() -> None:
+    pool = BufferPool(count=3, size=4)
+    pool.buffers[1][:] = b"abcd"
+    assert len(pool.slab) == 12
+    assert pool.slab[4:8] == b"abcd"
+
+
+def test_fixed_buffer_write_and_read() -> None:
+    pool = BufferPool(count=2, size=16)
+    write_index = pool.acquire()
+    read_index = pool.acquire()
+    pool.buffers[write_index][:5] = b"hello"
+
+    with IOWorker() as worker, tempfile.TemporaryDirectory() as tmpdir:
+        worker.register_buffers(pool)
+        worker.register(FileOpen(path=str(Path(tmpdir) / "fixed.txt"), mode="rwc"), 0)
+        worker.submit()
+        opened = worker.wait().unwrap()
+        assert isinstance(opened, FileOpenResult)
+
+        worker.register(
+            WriteFixed(fd=opened.fd, pool=pool, buf_index=write_index, size=5), 1
+        )
+        worker.submit()
+        written = worker.wait().unwrap()
+        assert isinstance(written, WriteResult)
+        assert written.size == 5
+
+        worker.register(ReadFixed(fd=opened.fd, pool=pool, buf_index=read_index), 2)
+        worker.submit()
+        read = worker.wait().unwrap()
+        assert isinstance(read, ReadResult)
+        assert read.content == b"hello"
+
+    pool.release(write_index)
+    pool.release(read_index)
+
+
+def test_read_fixed_file() -> None:
+    path = "./README.md"
+
+    with IOWorker() as worker, Path(path).open("rb") as file:
+        worker.register_files([-1, file.fileno()])
+        worker.register(Read(fd=1, fixed_file=True, size=64), 0)
+        worker.submit()
+        res = worker.wait().unwrap()
+        worker.unregister_files()
+
+    assert isinstance(res, ReadResult)
+    assert res.content == Path(path).read_bytes()[:64]
+
+
+def test_short_read_is_trimmed() -> None:
+    path = "./README.md"
+    expected = Path(path).read_bytes()
+
+    with IOWorker() as worker, Path(path).open("rb") as file:
+        worker.register(Read(fd=file.fileno(), size=len(expected) + 64), 0)
+        worker.submit()
+        res = worker.wait().unwrap()
+
+    assert isinstance(res, ReadResult)
+    assert res.size == len(expected)
+    assert res.content == expected
+    assert len(res.content) == len(expected)
+
+
+def test_read_fixed_acquires_and_releases_buffer() -> None:
+    path = "./README.md"
+    pool = BufferPool(count=1, size=64)
+
+    with IOWorker() as worker, Path(path).open("rb") as file:
+        worker.register_buffers(pool)
+        for identifier in range(2):
+            worker.register(ReadFixed(fd=file.fileno(), pool=pool), identifier)
+            worker.submit()
+            res = worker.wait().unwrap()
+
+            assert isinstance(res, ReadResult)
+            assert res.content == Path(path).read_bytes()[:64]
+
+
+def test_operations_are_slotted() -> None:
+    # Operations are created per IO call, so none may fall back to an instance dict.
+    for _, cls in inspect.getmembers(operations, inspect.isclass):
+        if issubclass(cls, IOOperation):
+            assert all("__dict__" not in vars(base) for base in cls.__mro__[:-1]), cls
+
+
+def test_operation_without_extract_cannot_be_instantiated() -> None:
+    class Incomplete(IOOperation[ReadResult]):
+        __slots__ = ()
+
+        def prep(self, user_data: int, ring: object) -> None:
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()  # pyrefly: ignore
+
+
+def test_discarded_accept_closes_connection() -> None:
+    read_fd, write_fd = os.pipe()
+    op = SocketAccept(fd=-1, multishot=True)
+    assert op.is_multishot()
+
+    op.discard(SocketAcceptResult(fd=write_fd))
+    with pytest.raises(OSError, match="Bad file descriptor"):
+        os.fstat(write_fd)
+    os.close(read_fd)
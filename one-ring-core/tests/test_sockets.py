@@ -1,12 +1,24 @@
+import os
+import socket
+
+import pytest
+
+from one_ring_core.buffers import BufferGroup
+from one_ring_core.constants import AddressFamily, SockOpt, SockOptLevel
 from one_ring_core.operations import (
+    Cancel,
     Close,
+    ProvideBuffers,
     SocketAccept,
     SocketBind,
+    SocketBindListen,
     SocketConnect,
     SocketCreate,
     SocketListen,
     SocketRecv,
+    SocketRecvMulti,
     SocketSend,
+    SocketSendMsg,
     SocketSetOpt,
 )
 from one_ring_core.worker import IOWorker
@@ -61,6 +73,15 @@ def test_sockets() -> None:
             # Again, two completions
             w.wait()
             w.wait()
+
+            # === Scatter send: two buffers arrive as one message ===
+            w.register(SocketSendMsg(fd=client_fd, buffers=[b"hello ", b"world"]), 10)
+            w.register(SocketRecv(fd=accepted_fd, size=1024), 11)
+            w.submit()
+
+            completions = {c.user_data: c.unwrap() for c in (w.wait(), w.wait())}
+            assert completions[10].size == len(b"hello world")  # pyrefly: ignore
+            assert completions[11].content == b"hello world"  # pyrefly: ignore
         finally:
             if server_fd:
                 w.register(Close(fd=server_fd), 1)
@@ -74,3 +95,132 @@ def test_sockets() -> None:
                 w.register(Close(fd=accepted_fd), 3)
                 w.submit()
                 w.wait()
+
+
+def test_multishot_accept() -> None:
+    with socket.create_server(("127.0.0.1", 0)) as server, IOWorker() as w:
+        w.register(SocketAccept(fd=server.fileno(), multishot=True), 1)
+        w.submit()
+
+        port = server.getsockname()[1]
+        clients = [socket.create_connection(("127.0.0.1", port)) for _ in range(2)]
+        try:
+            # One submission, one completion per connection.
+            for completion in (w.wait(), w.wait()):
+                assert completion.user_data == 1
+                assert completion.more
+                os.close(completion.unwrap().fd)  # pyrefly: ignore
+
+            w.register(Cancel(target_identifier=1), 2)
+            w.submit()
+
+            completions = {c.user_data: c for c in (w.wait(), w.wait())}
+            assert not completions[1].more
+            completions[2].unwrap()
+        finally:
+            for client in clients:
+                client.close()
+
+
+def test_multishot_recv_with_provided_buffers() -> None:
+    group = BufferGroup(group_id=1, count=2, size=64)
+    reader, writer = socket.socketpair()
+
+    with reader, writer, IOWorker() as w:
+        w.register(ProvideBuffers(group=group), 1)
+        w.submit()
+        w.wait().unwrap()
+
+        w.register(SocketRecvMulti(fd=reader.fileno(), group=group), 2)
+        w.submit()
+
+        buffer_ids = set()
+        for message in (b"hello", b"world"):
+            writer.sendall(message)
+            completion = w.wait()
+            result = completion.unwrap()
+            assert completion.more
+            assert result.content == message  # pyrefly: ignore
+            buffer_ids.add(result.buffer_id)  # pyrefly: ignore
+
+        # Each message was received into its own buffer.
+        assert buffer_ids == {0, 1}
+
+        # Give a buffer back, and receive into it again.
+        w.register(ProvideBuffers(group=group, buffer_id=0, count=1), 3)
+        w.submit()
+        w.wait().unwrap()
+        writer.sendall(b"again")
+        assert w.wait().unwrap().content == b"again"  # pyrefly: ignore
+
+        writer.close()
+        completion = w.wait()
+        assert not completion.more
+        assert completion.unwrap().size == 0  # pyrefly: ignore
+
+
+def test_set_tcp_nodelay() -> None:
+    with socket.socket() as sock, IOWorker() as w:
+        w.register(
+            SocketSetOpt(
+                fd=sock.fileno(), level=SockOptLevel.TCP, optname=SockOpt.TCP_NODELAY
+            ),
+            1,
+        )
+        w.submit()
+        w.wait().unwrap()
+
+        assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+
+
+def test_bind_listen_linked_failure() -> None:
+    with socket.create_server(("127.0.0.1", 0)) as taken, IOWorker() as w:
+        port = taken.getsockname()[1]
+
+        w.register(SocketCreate(), 1)
+        w.submit()
+        fd = w.wait().unwrap().fd  # pyrefly: ignore
+
+        w.register(SocketBindListen(fd=fd, ip="127.0.0.1", port=port), 2)
+        w.submit()
+        with pytest.raises(OSError, match="Address already in use"):
+            w.wait().unwrap()
+
+        # The cancelled listen step's completion is dropped, not returned.
+        w.register(Close(fd=fd), 3)
+        w.submit()
+        assert w.wait().user_data == 3
+
+
+def test_bind_listen_first_step_failure() -> None:
+    with IOWorker() as w:
+        # Setting the option fails, so both bind and listen are cancelled.
+        w.register(SocketBindListen(fd=-1, ip="127.0.0.1", port=0), 1)
+        w.submit()
+        with pytest.raises(OSError, match="Bad file descriptor"):
+            w.wait().unwrap()
+
+        w.register(Close(fd=-1), 2)
+        w.submit()
+        assert w.wait().user_data == 2
+        assert not w._trailing  # noqa: SLF001
+
+
+def test_repeated_address_shares_sockaddr() -> None:
+    first = SocketConnect(fd=-1, ip="127.0.0.1", port=8000)
+    second = SocketConnect(fd=-1, ip="127.0.0.1", port=8000)
+    other = SocketConnect(fd=-1, ip="127.0.0.1", port=8001)
+
+    assert first._sockaddr is second._sockaddr  # noqa: SLF001
+    assert first._sockaddr is not other._sockaddr  # noqa: SLF001
+
+
+def test_sockaddr_cache_is_per_address_family() -> None:
+    bind = SocketBind(fd=-1, ip="::1", port=8000, address_family=AddressFamily.INET6)
+    connect = SocketConnect(
+        fd=-1, ip="::1", port=8000, address_family=AddressFamily.INET6
+    )
+    v4 = SocketConnect(fd=-1, ip="127.0.0.1", port=8000)
+
+    assert bind._sockaddr is connect._sockaddr  # noqa: SLF001
+    assert connect._sockaddr is not v4._sockaddr  # noqa: SLF001
@@ -1,11 +1,23 @@
+import errno
 import tempfile
 from pathlib import Path
 
 import pytest
 
 from one_ring_core.log import get_logger
-from one_ring_core.operations import FileOpen
-from one_ring_core.results import FileOpenResult
+from one_ring_core.operations import (
+    Close,
+    FileOpen,
+    Read,
+    SocketBindListen,
+    Write,
+)
+from one_ring_core.results import (
+    CloseResult,
+    FileOpenResult,
+    ReadResult,
+    WriteResult,
+)
 from one_ring_core.worker import IOWorker
 
 logger = get_logger(__name__)
@@ -40,6 +52,18 @@ def test_io_worker_multi_read_peek() -> None:
                 i += 1
 
 
+def test_io_worker_drain() -> None:
+    with IOWorker() as worker, tempfile.TemporaryDirectory() as tmpdir:
+        for identifier in range(3):
+            test_path = Path(tmpdir) / f"drain_{identifier}.txt"
+            worker.register(FileOpen(path=str(test_path), mode="rwc"), identifier)
+        completions = [worker.wait()]
+        while len(completions) < 3:
+            completions.extend(worker.drain(max_events=2))
+        assert sorted(completion.user_data for completion in completions) == [0, 1, 2]
+        assert worker.drain() == []
+
+
 def test_io_worker_no_such_file() -> None:
     with IOWorker() as worker, tempfile.TemporaryDirectory() as tmpdir:
         test_path = Path(tmpdir) / "should_not_exist.txt"
@@ -48,3 +72,202 @@ def test_io_worker_no_such_file() -> None:
         completion = worker.wait()
         with pytest.raises(FileNotFoundError, match="No such file or directory"):
             completion.unwrap()
+
+
+def test_io_worker_submit_without_registrations() -> None:
+    with IOWorker() as worker:
+        worker.submit()
+        assert worker.peek() is None
+
+
+def test_io_worker_sqpoll() -> None:
+    with IOWorker(sqpoll=True) as worker, tempfile.TemporaryDirectory() as tmpdir:
+        test_path = Path(tmpdir) / "sqpoll.txt"
+        worker.register(FileOpen(path=str(test_path), mode="rwc"), 1)
+        worker.submit()
+        assert isinstance(worker.wait().unwrap(), FileOpenResult)
+
+
+def test_io_worker_add_file() -> None:
+    with IOWorker() as worker, Path("./README.md").open("rb") as file:
+        worker.register_files([-1])
+        index = worker.add_file(file.fileno())
+        worker.register(Read(fd=index, fixed_file=True, size=16), 1)
+        worker.submit()
+        res = worker.wait().unwrap()
+        assert isinstance(res, ReadResult)
+        assert res.content == Path("./README.md").read_bytes()[:16]
+
+        with pytest.raises(OSError, match="No empty registered file slot"):
+            worker.add_file(file.fileno())
+
+        worker.remove_file(index)
+        assert worker.add_file(file.fileno()) == index
+
+
+def test_io_worker_syscall_fallback() -> None:
+    with (
+        IOWorker(syscall_fallback=True) as worker,
+        tempfile.TemporaryDirectory() as tmpdir,
+    ):
+        test_path = Path(tmpdir) / "fallback.txt"
+        worker.register(FileOpen(path=str(test_path), mode="rwc"), 1)
+        worker.submit()
+        open_result = worker.wait().unwrap()
+        assert isinstance(open_result, FileOpenResult)
+        fd = open_result.fd
+
+        worker.register(Write(fd=fd, data=b"hello", cached=True), 2)
+        worker.submit()
+        completion = worker.peek()
+        assert completion is not None
+        assert completion.user_data == 2
+        assert completion.unwrap() == WriteResult(size=5)
+
+        worker.register(Read(fd=fd, size=16, cached=True), 3)
+        read_result = worker.wait().unwrap()
+        assert isinstance(read_result, ReadResult)
+        assert read_result.content == b"hello"
+
+        worker.register(Read(fd=fd, size=16), 4)
+        worker.register(Read(fd=fd, size=16, offset=1), 5)
+        worker.submit()
+        contents = {}
+        for completion in (worker.wait(), worker.wait()):
+            result = completion.unwrap()
+            assert isinstance(result, ReadResult)
+            contents[completion.user_data] = result.content
+        assert contents == {4: b"hello", 5: b"ello"}
+
+        worker.register(Close(fd=fd), 6)
+        worker.submit()
+        assert isinstance(worker.wait().unwrap(), CloseResult)
+
+
+def test_io_worker_syscall_fallback_interleaved() -> None:
+    with (
+        IOWorker(syscall_fallback=True) as worker,
+        tempfile.TemporaryDirectory() as tmpdir,
+    ):
+        test_path = Path(tmpdir) / "interleaved.txt"
+        test_path.write_bytes(b"hello")
+        worker.register(FileOpen(path=str(test_path), mode="r"), 1)
+        open_result = worker.wait().unwrap()
+        assert isinstance(open_result, FileOpenResult)
+        fd = open_result.fd
+
+        # Performed inline, then followed by one that has to go through the ring.
+        worker.register(Read(fd=fd, size=16, cached=True), 2)
+        worker.submit()
+        worker.register(FileOpen(path=str(test_path), mode="r"), 3)
+        first, second = worker.wait(), worker.wait()
+        assert first.user_data == 2
+        assert first.unwrap() == ReadResult(content=b"hello", size=5)
+        assert second.user_data == 3
+        second_result = second.unwrap()
+        assert isinstance(second_result, FileOpenResult)
+
+        # Not alone, so both go through the ring.
+        worker.register(Read(fd=fd, size=16, cached=True), 4)
+        worker.register(Close(fd=second_result.fd), 5)
+        worker.submit()
+        assert not worker._ready  # noqa: SLF001
+        completions = {}
+        for _ in range(2):
+            completion = worker.wait()
+            completions[completion.user_data] = completion.unwrap()
+        assert completions[4] == ReadResult(content=b"hello", size=5)
+        assert isinstance(completions[5], CloseResult)
+
+        # Not known to be cached, so it could block and goes through the ring.
+        worker.register(Read(fd=fd, size=16), 6)
+        worker.submit()
+        assert not worker._ready  # noqa: SLF001
+        assert worker.wait().unwrap() == ReadResult(content=b"hello", size=5)
+
+        worker.register(Close(fd=fd), 7)
+        assert isinstance(worker.wait().unwrap(), CloseResult)
+
+
+def test_io_worker_link() -> None:
+    with IOWorker() as worker, tempfile.TemporaryDirectory() as tmpdir:
+        worker.register(FileOpen(path=str(Path(tmpdir) / "link.txt"), mode="rwc"), 1)
+        open_result = worker.wait().unwrap()
+        assert isinstance(open_result, FileOpenResult)
+        fd = open_result.fd
+
+        worker.link((Write(fd=fd, data=b"hello"), 2), (Read(fd=fd, size=16), 3))
+        completions = {}
+        for _ in range(2):
+            completion = worker.wait()
+            completions[completion.user_data] = completion.unwrap()
+        assert completions[2] == WriteResult(size=5)
+        assert isinstance(completions[3], ReadResult)
+        assert completions[3].content == b"hello"
+
+        worker.link((Read(fd=-1, size=16), 4), (Close(fd=fd), 5))
+        results = {}
+        for _ in range(2):
+            completion = worker.wait()
+            results[completion.user_data] = completion.result
+        assert isinstance(results[4], OSError)
+        assert isinstance(results[5], OSError)
+        assert results[5].errno == errno.ECANCELED
+
+        worker.register(Close(fd=fd), 6)
+        assert isinstance(worker.wait().unwrap(), CloseResult)
+
+
+def test_io_worker_link_failed_prep() -> None:
+    with IOWorker() as worker, tempfile.TemporaryFile() as file:
+        fd = file.fileno()
+        with pytest.raises(TypeError):
+            worker.link(
+                (Write(fd=fd, data=b"hello"), 1),
+                (Write(fd=fd, data="not a buffer"), 2),  # pyrefly: ignore
+            )
+        # Must not be linked to the write that was already prepped.
+        worker.register(Read(fd=fd, size=16, offset=0), 3)
+
+        completions = {}
+        for _ in range(2):
+            completion = worker.wait()
+            completions[completion.user_data] = completion.unwrap()
+        assert completions[1] == WriteResult(size=5)
+        assert isinstance(completions[3], ReadResult)
+
+
+def test_io_worker_link_rejects_empty_chain() -> None:
+    with IOWorker() as worker, pytest.raises(ValueError, match="at least one"):
+        worker.link()
+
+
+def test_io_worker_link_rejects_multi_entry_head() -> None:
+    with IOWorker() as worker:
+        with pytest.raises(ValueError, match="can only end a chain"):
+            worker.link(
+                (SocketBindListen(fd=-1, ip="127.0.0.1", port=0), 1),
+                (Close(fd=-1), 2),
+            )
+        # Nothing of the rejected chain was prepped.
+        worker.register(Close(fd=-1), 3)
+        completion = worker.wait()
+        assert completion.user_data == 3
+
+
+def test_io_worker_open_read_close_direct() -> None:
+    with IOWorker() as worker:
+        worker.register_files([-1])
+        worker.link(
+            (FileOpen(path="./README.md", mode="r", file_index=0), 1),
+            (Read(fd=0, fixed_file=True, size=16), 2),
+            (Close(fd=0, fixed_file=True), 3),
+        )
+        results = {}
+        for _ in range(3):
+            completion = worker.wait()
+            results[completion.user_data] = completion.unwrap()
+        assert results[1] == FileOpenResult(fd=0)
+        assert isinstance(results[2], ReadResult)
+        assert results[2].content == Path("./README.md").read_bytes()[:16]
+        assert isinstance(results[3], CloseResult)
@@ -23,15 +23,32 @@ class MiddlewareStack:
 
     _middleware: list[HTTPMiddleware] = field(default_factory=list, init=False)
 
+    """Handlers already wrapped in all middleware, keyed by the bare handler"""
+    _compiled: dict[AsyncHTTPHandler, AsyncHTTPHandler] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
     def register(self, func: HTTPMiddleware) -> HTTPMiddleware:
         """Registers a middleware function.
 
         First registered is innermost, last registered outermost.
         """
         self._middleware.append(func)
+        self._compiled.clear()
 
         return func
 
+    def compile(self, handler: AsyncHTTPHandler) -> AsyncHTTPHandler:
+        """Wraps a handler in all middleware, composing it once per handler."""
+        compiled = self._compiled.get(handler)
+        if compiled is None:
+            compiled = handler
+            for middleware in self:
+                compiled = middleware(compiled)
+            self._compiled[handler] = compiled
+
+        return compiled
+
     def __iter__(self) -> Iterator[HTTPMiddleware]:
         """Returns iterator of middlewars in reversed order."""
         return reversed(self._middleware)
@@ -18,16 +18,29 @@ if TYPE_CHECKING:
 logger = get_logger()
 
 # Must match typedefs.HTTPMethod
-ALLOWED_HTTP_METHODS: set[HTTPMethod] = {
-    "GET",
-    "POST",
-    "PUT",
-    "PATCH",
-    "DELETE",
-    "OPTIONS",
-    "HEAD",
+ALLOWED_HTTP_METHODS: frozenset[HTTPMethod] = frozenset(
+    {
+        "GET",
+        "POST",
+        "PUT",
+        "PATCH",
+        "DELETE",
+        "OPTIONS",
+        "HEAD",
+    }
+)
+
+"""Allowed methods keyed by their raw bytes, to validate before decoding"""
+_METHODS_BY_NAME: dict[bytes, HTTPMethod] = {
+    method.encode(): method for method in ALLOWED_HTTP_METHODS
 }
 
+"""Upper bound on interned header names, so arbitrary client headers can't grow it"""
+_HEADER_NAME_CACHE_SIZE = 1024
+
+"""Lowercased header names keyed by their raw bytes, as sent by clients"""
+_header_names: dict[bytes, str] = {}
+
 
 @dataclass(slots=True, kw_only=True)
 class Request:
@@ -57,35 +70,29 @@ class Request:
     @classmethod
     def parse(cls, buffered_stream: BufferedByteReceiveStream) -> Coro[Self]:
         """Parses data from a buffered receive stream and provides a Request object."""
-        # Get tokens from first line
-        first_line = yield from buffered_stream.receive_until(
-            delimiter=b"\r\n", max_bytes=65536
+        # Get request line and headers in one go, and split them apart in memory
+        head = yield from buffered_stream.receive_until(
+            delimiter=b"\r\n\r\n", max_bytes=65536
         )
-        tokens = first_line.split(b" ")
-        method = tokens[0].decode()
-        target = tokens[1].decode()
-        version = tokens[2].decode()
-
-        if not cls.verify_http_method(method):
+        first_line, *header_lines = head.split(b"\r\n")
+        raw_method, _, rest = first_line.partition(b" ")
+        method = _METHODS_BY_NAME.get(raw_method)
+        if method is None:
             raise RuntimeError("Unsupported HTTP method")
+        raw_target, _, raw_version = rest.partition(b" ")
+        target = raw_target.decode()
+        version = raw_version.decode()
 
-        # Get headers, until reaching empty line
         headers: HTTPHeaders = {}
-        line = yield from buffered_stream.receive_until(
-            delimiter=b"\r\n", max_bytes=65536
-        )
-        while line:
-            key_val = line.split(b": ", 1)
-            header_name = key_val[0].decode().lower()
-            header_val = key_val[1].decode()
+        for line in header_lines:
+            raw_name, _, raw_val = line.partition(b": ")
+            header_name = _header_name(raw_name)
+            header_val = raw_val.decode()
 
             if header_name in headers:
                 header_val = headers[header_name] + ", " + header_val
 
             headers[header_name] = header_val
-            line = yield from buffered_stream.receive_until(
-                delimiter=b"\r\n", max_bytes=65536
-            )
 
         # Get body, if we have "content-length"
         body = b""
@@ -109,3 +116,13 @@ class Request:
     def verify_http_method(method: str) -> TypeGuard[HTTPMethod]:
         """Verifies that HTTP method is valid."""
         return method in ALLOWED_HTTP_METHODS
+
+
+def _header_name(raw: bytes) -> str:
+    """Gets the lowercased name of a raw header name, interning common ones."""
+    name = _header_names.get(raw)
+    if name is None:
+        name = raw.decode().lower()
+        if len(_header_names) < _HEADER_NAME_CACHE_SIZE:
+            _header_names[raw] = name
+    return name
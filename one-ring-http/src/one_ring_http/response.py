@@ -1,16 +1,75 @@
 import json
+import time
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from email.utils import formatdate
 from typing import TYPE_CHECKING, Self
 
 from one_ring_http.status import HTTPStatus
 from one_ring_loop.streams.exceptions import EndOfStreamError
 
 if TYPE_CHECKING:
+    from collections.abc import Buffer
+
     from one_ring_http.typedef import HTTPHeaders
     from one_ring_loop.streams.memory import MemoryObjectReceiveStream
     from one_ring_loop.typedefs import Coro
 
+"""Encoded status line for every status, so it is never formatted per response"""
+_STATUS_LINES: dict[HTTPStatus, bytes] = {
+    status: f"HTTP/1.1 {status} {status.phrase}\r\n".encode() for status in HTTPStatus
+}
+
+_SERVER_LINE = b"server: one-ring-http/0.2.1\r\n"
+
+"""Content lengths below this have their header line cached once encoded"""
+_CONTENT_LENGTH_LINES = 8193
+
+"""Encoded content-length lines indexed by length, filled in as lengths come up"""
+_content_length_lines: list[bytes | None] = [None] * _CONTENT_LENGTH_LINES
+
+"""Upper bound on cached header lines, in case a cached header varies after all"""
+_HEADER_LINES_SIZE = 1024
+
+"""Headers whose lines are cached. Their values come from a small, fixed set, unlike
+those of headers such as etag or location, which would only fill the cache"""
+_CACHED_HEADERS = frozenset(
+    {
+        "accept-ranges",
+        "cache-control",
+        "connection",
+        "content-encoding",
+        "content-type",
+        "transfer-encoding",
+        "upgrade",
+        "vary",
+    }
+)
+
+"""Encoded header lines keyed by header name and value, for repeated headers"""
+_header_lines: dict[tuple[str, str], bytes] = {}
+
+"""Second the cached date line was formatted for, and the line itself"""
+_date_cache: tuple[int, bytes] = (0, b"")
+
+
+def _date_line() -> bytes:
+    """Gets the encoded date header line, formatted at most once per second."""
+    global _date_cache  # noqa: PLW0603
+    now = int(time.time())
+    if _date_cache[0] != now:
+        _date_cache = (now, f"date: {formatdate(now, usegmt=True)}\r\n".encode())
+    return _date_cache[1]
+
+
+def _content_length_line(value: str) -> bytes:
+    """Gets the encoded content-length header line, cached for common lengths."""
+    if not value.isdecimal() or (length := int(value)) >= _CONTENT_LENGTH_LINES:
+        return f"content-length: {value}\r\n".encode()
+    line = _content_length_lines[length]
+    if line is None:
+        line = _content_length_lines[length] = f"content-length: {length}\r\n".encode()
+    return line
+
 
 @dataclass(slots=True, kw_only=True)
 class ResponseBase:
@@ -22,48 +81,56 @@ class ResponseBase:
     """HTTP headers for the response"""
     headers: HTTPHeaders = field(default_factory=dict)
 
-    @staticmethod
-    def formatdate() -> str:
-        """Formats current date and time for HTTP date format."""
-        return datetime.now(UTC).strftime("%a, %d %b %Y %H:%M:%S GMT")
-
-    def _serialize_head(self) -> bytes:
-        status_line = (
-            f"HTTP/1.1 {self.status_code} {self.status_code.phrase}\r\n".encode()
-        )
-
-        headers = f"date: {self.formatdate()}\r\n".encode()
-        headers += b"server: one-ring-http/0.2.1\r\n"
-
-        for header_name, header_val in self.headers.items():
-            headers += f"{header_name}: {header_val}\r\n".encode()
-
-        return status_line + headers
+    def _head_parts(self) -> list[Buffer]:
+        """Collects the status line, headers and blank line, ready to be joined."""
+        parts: list[Buffer] = [
+            _STATUS_LINES[self.status_code],
+            _date_line(),
+            _SERVER_LINE,
+        ]
+        for header in self.headers.items():
+            header_line = _header_lines.get(header)
+            if header_line is None and header[0] == "content-length":
+                header_line = _content_length_line(header[1])
+            elif header_line is None:
+                header_line = f"{header[0]}: {header[1]}\r\n".encode()
+                if (
+                    header[0] in _CACHED_HEADERS
+                    and len(_header_lines) < _HEADER_LINES_SIZE
+                ):
+                    _header_lines[header] = header_line
+            parts.append(header_line)
+        parts.append(b"\r\n")
+        return parts
 
 
 @dataclass(slots=True, kw_only=True)
 class Response(ResponseBase):
     """A HTTP/1.1 response to be serialized."""
 
-    """HTTP body for the response"""
-    body: bytes = field(default=b"")
+    """HTTP body for the response. Any bytes-like object, e.g. a shared memoryview"""
+    body: Buffer = field(default=b"")
 
     def __post_init__(self) -> None:
         """Set default headers for basic response."""
         if self.status_code != HTTPStatus.SWITCHING_PROTOCOLS:
-            self.headers["content-length"] = str(len(self.body))
+            self.headers["content-length"] = str(memoryview(self.body).nbytes)
         if self.body and "content-type" not in self.headers:
             self.headers["content-type"] = "text/plain; charset=utf-8"
 
     def serialize(self, exclude_body: bool = False) -> bytes:  # noqa: FBT001, FBT002
         """Serializes a response for transfer."""
-        serialized_response = self._serialize_head()
-        serialized_response += b"\r\n"
+        return b"".join(self.serialize_parts(exclude_body))
 
-        if not exclude_body:
-            serialized_response += self.body
+    def serialize_parts(self, exclude_body: bool = False) -> list[Buffer]:  # noqa: FBT001, FBT002
+        """Serializes a response into parts, with the body kept as its own last part.
 
-        return serialized_response
+        For sending the body without first copying it in behind the head.
+        """
+        parts = self._head_parts()
+        if not exclude_body:
+            parts.append(self.body)
+        return parts
 
     @classmethod
     def html(cls, body: str, status_code: HTTPStatus = HTTPStatus.OK) -> Self:
@@ -119,7 +186,7 @@ class StreamingResponse(ResponseBase):
             raise EndOfStreamError
         if not self._sent_head:
             self._sent_head = True
-            return self._serialize_head() + b"\r\n"
+            return b"".join(self._head_parts())
 
         try:
             chunk = yield from self.body_stream.receive()
@@ -20,6 +20,9 @@ if TYPE_CHECKING:
         WebSocketHandler,
     )
 
+"""Upper bound on remembered unmatched paths, so scanners can't grow it"""
+_MISSES_SIZE = 1024
+
 
 def page_not_found(_: Request) -> Response:
     """Default handler for 404."""
@@ -40,6 +43,12 @@ class Router:
         default_factory=dict, init=False
     )
 
+    """Path patterns compiled on registration, for paths with parameters."""
+    _patterns: dict[URLPath, re.Pattern[str]] = field(default_factory=dict, init=False)
+
+    """Recently requested paths that matched no route, bounded in size."""
+    _misses: set[URLPath] = field(default_factory=set, init=False)
+
     """Keeps tracks of registered HTTP 'handlers'"""
     _websocket_registry: dict[URLPath, WebSocketHandler] = field(
         default_factory=dict, init=False
@@ -55,26 +64,42 @@ class Router:
         """Registers a path."""
         if path not in self._registry:
             self._registry[path] = {}
+            if "{" in path:
+                self._patterns[path] = self._compile_path(path)
+            self._misses.clear()
         self._registry[path][method] = handler
 
     def resolve(
         self, method: HTTPMethod, path: URLPath
     ) -> tuple[HTTPHandler, URLPathParams]:
-        """Returns the handler for a method and path."""
-        for registered_path in self._registry:
-            pattern = self._compile_path(registered_path)
-            if (path_params := pattern.match(path)) is not None:
-                if (method_to_handler := self._registry.get(registered_path)) is None:
+        """Returns the handler for a method and path.
+
+        Paths without parameters are looked up directly, and take precedence over
+        parameterized paths that would also match.
+        """
+        path_params: URLPathParams = {}
+        # A parameterized path requested literally still goes through its pattern.
+        method_to_handler = None if path in self._patterns else self._registry.get(path)
+        if method_to_handler is None:
+            if path in self._misses:
+                return self.fallback_404, {}
+            for registered_path, pattern in self._patterns.items():
+                if (match := pattern.match(path)) is not None:
+                    path_params = match.groupdict()
+                    method_to_handler = self._registry[registered_path]
                     break
-                handler = method_to_handler.get(method)
-
-                if handler is None and method == "HEAD":
-                    handler = method_to_handler.get("GET")
-                if handler is None:
-                    return self.fallback_405, {}
-                return handler, path_params.groupdict()
-
-        return self.fallback_404, {}
+            else:
+                if len(self._misses) < _MISSES_SIZE:
+                    self._misses.add(path)
+                return self.fallback_404, {}
+
+        handler = method_to_handler.get(method)
+
+        if handler is None and method == "HEAD":
+            handler = method_to_handler.get("GET")
+        if handler is None:
+            return self.fallback_405, {}
+        return handler, path_params
 
     def register(
         self, method: HTTPMethod, path: str
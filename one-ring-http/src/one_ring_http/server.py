@@ -19,6 +19,9 @@ from one_ring_loop.threadpool import run_in_thread
 
 logger = get_logger()
 
+"""Body size from which the head and body are sent without joining them first"""
+_SCATTER_MIN_SIZE = 16384
+
 if TYPE_CHECKING:
     import ssl
 
@@ -49,6 +52,11 @@ class HTTPServer:
     """Stack of middleware"""
     middleware: MiddlewareStack = field(default_factory=MiddlewareStack)
 
+    """Async versions of the handlers resolved so far, keyed by the handler"""
+    _async_handlers: dict[HTTPHandler, AsyncHTTPHandler] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
     def serve(self) -> Coro[None]:
         """Starts the server."""
         server = yield from create_server(self.host, self.port)
@@ -130,8 +138,7 @@ class HTTPServer:
             )
 
         handler, path_params = self.router.resolve(request.method, request.path)
-        handler = self._ensure_async_handler(handler)
-        handler = self._apply_middleware(handler)
+        handler = self.middleware.compile(self._ensure_async_handler(handler))
         request.path_params = path_params
         response = yield from handler(request)
 
@@ -159,20 +166,25 @@ class HTTPServer:
 
         else:
             exclude_body = request.method == "HEAD"
-            yield from stream.send(response.serialize(exclude_body))
+            if exclude_body or memoryview(response.body).nbytes < _SCATTER_MIN_SIZE:
+                yield from stream.send(response.serialize(exclude_body))
+            else:
+                yield from stream.send_many(*response.serialize_parts())
 
-    def _apply_middleware(self, handler: AsyncHTTPHandler) -> AsyncHTTPHandler:
-        """Gets handler from router and applies all middleware.
+    def _ensure_async_handler(self, handler: HTTPHandler) -> AsyncHTTPHandler:
+        """Ensures a handler is async by wrapping it in thread pool if not.
 
-        TODO: don't apply middleware on each request...
+        The result is cached, so a sync handler keeps the same wrapper across
+        requests.
         """
-        for middleware in self.middleware:
-            handler = middleware(handler)
+        async_handler = self._async_handlers.get(handler)
+        if async_handler is None:
+            async_handler = self._make_async_handler(handler)
+            self._async_handlers[handler] = async_handler
 
-        return handler
+        return async_handler
 
-    def _ensure_async_handler(self, handler: HTTPHandler) -> AsyncHTTPHandler:
-        """Ensures a handler is async by wrapping it in thread pool if not."""
+    def _make_async_handler(self, handler: HTTPHandler) -> AsyncHTTPHandler:
         if self._is_async_handler(handler):
             return handler
 
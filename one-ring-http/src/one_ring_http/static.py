@@ -48,7 +48,8 @@ def static_handler(root: str | Path) -> HTTPHandler:
         file = yield from open_file(file_path)
 
         try:
-            body = yield from file.read()
+            # The size is known from the ETag's statx, so the file is read in one go.
+            body = yield from file.read(metadata.size)
             content_type = (
                 mimetypes.guess_type(str(file_path))[0] or "application/octet-stream"
             )
@@ -3,7 +3,7 @@
 from collections.abc import Generator
 from typing import TYPE_CHECKING
 
-from one_ring_http.middleware import cors_middleware
+from one_ring_http.middleware import MiddlewareStack, cors_middleware
 from one_ring_http.response import Response
 from one_ring_http.status import HTTPStatus
 from one_ring_loop.lowlevel import checkpoint
@@ -104,3 +104,35 @@ class TestCorsMiddleware:
             assert response.headers["access-control-allow-origin"] == "*"
 
         run_coro(entry())
+
+
+class TestMiddlewareStack:
+    def test_compile_applies_last_registered_outermost(self) -> None:
+        applied: list[str] = []
+        stack = MiddlewareStack()
+
+        def inner(handler: AsyncHTTPHandler) -> AsyncHTTPHandler:
+            applied.append("inner")
+            return handler
+
+        def outer(handler: AsyncHTTPHandler) -> AsyncHTTPHandler:
+            applied.append("outer")
+            return handler
+
+        stack.register(inner)
+        stack.register(outer)
+        stack.compile(_dummy_handler_factory())
+        assert applied == ["inner", "outer"]
+
+    def test_compile_is_cached_per_handler(self) -> None:
+        stack = MiddlewareStack()
+        stack.register(cors_middleware())
+        handler = _dummy_handler_factory()
+        assert stack.compile(handler) is stack.compile(handler)
+
+    def test_register_invalidates_compiled(self) -> None:
+        stack = MiddlewareStack()
+        handler = _dummy_handler_factory()
+        assert stack.compile(handler) is handler
+        stack.register(cors_middleware())
+        assert stack.compile(handler) is not handler
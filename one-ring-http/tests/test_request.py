@@ -145,6 +145,22 @@ class TestRequestParse:
 
         run_coro(entry())
 
+    def test_no_headers(self, run_coro: Callable[[Coro], object]) -> None:
+        def entry() -> Coro[None]:
+            send, recv = create_memory_object_stream[bytes](None)
+            buffered = BufferedByteReceiveStream(receive_stream=recv)
+            yield from send.send(b"GET / HTTP/1.1\r\n\r\nGET /next HTTP/1.1\r\n\r\n")
+            yield from send.close()
+
+            request = yield from Request.parse(buffered)
+            assert request.path == "/"
+            assert request.headers == {}
+
+            request = yield from Request.parse(buffered)
+            assert request.path == "/next"
+
+        run_coro(entry())
+
     def test_invalid_method_raises(self, run_coro: Callable[[Coro], object]) -> None:
         def entry() -> Coro[None]:
             send, recv = create_memory_object_stream[bytes](None)
@@ -1,7 +1,9 @@
 """Tests for HTTP response serialization."""
 
 import json
+from email.utils import parsedate_to_datetime
 
+from one_ring_http import response
 from one_ring_http.response import Response
 from one_ring_http.status import HTTPStatus
 
@@ -11,11 +13,40 @@ class TestResponseSerialize:
         raw = Response(status_code=HTTPStatus.OK).serialize()
         assert raw.startswith(b"HTTP/1.1 200 OK\r\n")
 
+    def test_status_line_for_every_status(self) -> None:
+        for status in HTTPStatus:
+            raw = Response(status_code=status).serialize()
+            assert raw.startswith(
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n".encode()
+            )
+
+    def test_date_header_is_http_date(self) -> None:
+        raw = Response(status_code=HTTPStatus.OK).serialize()
+        date_line = next(
+            line for line in raw.split(b"\r\n") if line.startswith(b"date: ")
+        )
+        assert parsedate_to_datetime(date_line.removeprefix(b"date: ").decode())
+
     def test_with_body(self) -> None:
         raw = Response(status_code=HTTPStatus.OK, body=b"hello").serialize()
         assert b"content-length: 5\r\n" in raw
         assert raw.endswith(b"\r\n\r\nhello")
 
+    def test_with_large_body(self) -> None:
+        raw = Response(status_code=HTTPStatus.OK, body=bytes(100_000)).serialize()
+        assert b"content-length: 100000\r\n" in raw
+
+    def test_with_memoryview_body(self) -> None:
+        body = memoryview(b"hello world")[:5]
+        raw = Response(status_code=HTTPStatus.OK, body=body).serialize()
+        assert b"content-length: 5\r\n" in raw
+        assert raw.endswith(b"\r\n\r\nhello")
+
+    def test_content_length_counts_bytes(self) -> None:
+        body = memoryview(bytes(8)).cast("I")
+        raw = Response(status_code=HTTPStatus.OK, body=body).serialize()
+        assert b"content-length: 8\r\n" in raw
+
     def test_with_custom_headers(self) -> None:
         raw = Response(
             status_code=HTTPStatus.NOT_FOUND,
@@ -34,6 +65,23 @@ class TestResponseSerialize:
         assert b"x-custom: value1\r\n" in raw
         assert b"x-other: value2\r\n" in raw
 
+    def test_only_constant_header_lines_are_cached(self) -> None:
+        Response(
+            status_code=HTTPStatus.OK,
+            headers={"content-type": "text/css", "etag": '"5d8c72a5"'},
+        ).serialize()
+        header_lines = response._header_lines  # noqa: SLF001
+        assert ("content-type", "text/css") in header_lines
+        assert ("etag", '"5d8c72a5"') not in header_lines
+
+    def test_content_length_lines_are_cached_on_first_use(self) -> None:
+        lines = response._content_length_lines  # noqa: SLF001
+        lines[7] = None
+        raw = Response(status_code=HTTPStatus.OK, body=b"seven!!").serialize()
+        assert b"content-length: 7\r\n" in raw
+        assert lines[7] == b"content-length: 7\r\n"
+        assert ("content-length", "7") not in response._header_lines  # noqa: SLF001
+
     def test_empty_body_default(self) -> None:
         r = Response(status_code=HTTPStatus.NO_CONTENT)
         assert r.body == b""
@@ -46,6 +94,13 @@ class TestResponseSerialize:
         assert raw.endswith(b"\r\n\r\n")
         assert b"hello" not in raw
 
+    def test_serialize_parts_keeps_body_separate(self) -> None:
+        body = memoryview(b"hello")
+        response = Response(status_code=HTTPStatus.OK, body=body)
+        parts = response.serialize_parts()
+        assert parts[-1] is body
+        assert b"".join(parts) == response.serialize()
+
     def test_serialize_exclude_body_preserves_content_length(self) -> None:
         raw = Response(status_code=HTTPStatus.OK, body=b"hello").serialize(
             exclude_body=True
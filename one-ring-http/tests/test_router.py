@@ -70,6 +70,38 @@ class TestRouter:
         handler, _ = router.resolve("HEAD", "/hello")
         assert handler is _created
 
+    def test_resolve_path_params(self) -> None:
+        router = Router()
+        router.add("GET", "/users/{user_id}", _ok)
+        handler, path_params = router.resolve("GET", "/users/42")
+        assert handler is _ok
+        assert path_params == {"user_id": "42"}
+
+    def test_static_path_matches_literally(self) -> None:
+        router = Router()
+        router.add("GET", "/favicon.ico", _ok)
+        handler, _ = router.resolve("GET", "/favicon.ico")
+        assert handler is _ok
+        handler, _ = router.resolve("GET", "/faviconXico")
+        assert handler is router.fallback_404
+
+    def test_static_path_takes_precedence(self) -> None:
+        router = Router()
+        router.add("GET", "/users/{user_id}", _ok)
+        router.add("GET", "/users/me", _created)
+        handler, path_params = router.resolve("GET", "/users/me")
+        assert handler is _created
+        assert path_params == {}
+
+    def test_route_added_after_miss(self) -> None:
+        router = Router()
+        router.add("GET", "/items/{item_id}", _ok)
+        handler, _ = router.resolve("GET", "/other")
+        assert handler is router.fallback_404
+        router.add("GET", "/other", _created)
+        handler, _ = router.resolve("GET", "/other")
+        assert handler is _created
+
 
 class TestPageNotFound:
     def test_returns_404(self) -> None:
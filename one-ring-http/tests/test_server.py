@@ -139,6 +139,38 @@ class TestHTTPServer:
 
         run(entry())
 
+    @pytest.mark.io
+    def test_get_large_body(
+        self,
+        ssl_contexts: tuple[ssl.SSLContext, ssl.SSLContext],
+        unused_tcp_port: int,
+    ) -> None:
+        server_ctx, client_ctx = ssl_contexts
+        port = unused_tcp_port
+        body = bytes(range(256)) * 1024
+
+        router = Router()
+        router.add(
+            "GET", "/large", lambda req: Response(status_code=HTTPStatus.OK, body=body)
+        )
+
+        def entry() -> Coro[None]:
+            tg = TaskGroup()
+            tg.enter()
+            try:
+                tg.create_task(_serve_until_cancelled(router, port, server_ctx))
+                yield from sleep(0.1)
+
+                resp = yield from _client_exchange(
+                    port, client_ctx, b"GET /large HTTP/1.1\r\nhost: localhost\r\n\r\n"
+                )
+                assert resp.status_code == 200
+                assert resp.body == body
+            finally:
+                yield from tg.exit()
+
+        run(entry())
+
     @pytest.mark.io
     def test_post_with_body(
         self,
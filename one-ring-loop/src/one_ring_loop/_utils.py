@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import threading
 from collections import deque
 from dataclasses import dataclass, field
@@ -15,10 +16,7 @@ if TYPE_CHECKING:
 
 def _get_new_operation_id() -> TaskID:
     """Gets an unused ID to submit to the IO worker."""
-    ret = _local.free_operation_id
-    _local.free_operation_id += 1
-
-    return ret
+    return next(_local.operation_ids)
 
 
 def _execute[T: IOResult](op: IOOperation[T]) -> Coro[T]:
@@ -39,7 +37,11 @@ class _Local(threading.local):
     """Wrapper around threading.local for proper type annotations."""
 
     loop: Loop | None = None
-    free_operation_id: int = 1
+
+    # IDs are never reused. A 64-bit user_data can't run out in practice.
+    operation_ids: itertools.count[int] = field(
+        default_factory=lambda: itertools.count(1)
+    )
 
     # TODO: Move the below two to be attributes on Loop.
     cancel_queue: deque[TaskID] = field(default_factory=deque)
@@ -48,7 +50,7 @@ class _Local(threading.local):
     def cleanup(self) -> None:
         """Resets all attributes."""
         self.loop = None
-        self.free_operation_id = 1
+        self.operation_ids = itertools.count(1)
 
         self.cancel_queue = deque()
         self.unpark_queue = deque()
@@ -2,50 +2,97 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from one_ring_core.operations import Close, FileOpen, Read, Statx, Write
+from one_ring_core.operations import Close, FileOpen, Read, Statx, Write, WriteV
 from one_ring_loop._utils import _execute
 
 if TYPE_CHECKING:
+    from collections.abc import Buffer
+
     from one_ring_core.results import StatxResult
     from one_ring_loop.typedefs import Coro
 
 
+# Size of the first read when reading a whole file. Files smaller than this are read
+# without fetching their size first.
+_READ_CHUNK_SIZE = 64 * 1024
+
+
 @dataclass(slots=True, kw_only=True)
 class File:
     """Utility wrapper for file operations. Represents a single regular file."""
 
     fd: int
 
-    def read(self, size: int | None = None) -> Coro[bytes]:
+    def read(self, size: int | None = None) -> Coro[bytes | bytearray]:
         """Read file low-level coroutine.
 
+        The content is the buffer the kernel read into, handed over without a copy.
+
+        Reading the whole file never stats it synchronously. The size comes from a
+        statx through the ring, and only when the first chunk came back full. The
+        statx isn't linked to the read, as a link can't pass its result on as the
+        size of the next operation.
+
         Args:
             size: number of bytes to fetch. Fetches the whole file if None.
         """
-        _size = size
-        if _size is None:
-            # Async fetching of size from metadata using statx.
-            metadata = yield from _execute(Statx.from_fd(fd=self.fd))
-            _size = metadata.size
-
-        result = yield from _execute(Read(fd=self.fd, size=_size))
-        return result.content
+        if size is not None:
+            result = yield from _execute(Read(fd=self.fd, size=size))
+            return result.content
+
+        # Optimistically read a chunk first, as a short read means the whole file
+        # was read and the statx round trip is unnecessary.
+        first = yield from _execute(Read(fd=self.fd, size=_READ_CHUNK_SIZE))
+        if first.size < _READ_CHUNK_SIZE:
+            return first.content
+
+        metadata = yield from _execute(Statx.from_fd(fd=self.fd))
+        # The first chunk is a handed over bytearray, so the rest is appended to it
+        # in place rather than copying both into a new object.
+        content = first.content
+        remaining = max(metadata.size - first.size, 0)
+        if remaining:
+            rest = yield from _execute(
+                Read(fd=self.fd, size=remaining, offset=first.size)
+            )
+            content += rest.content
+            return content
+
+        # The size doesn't cover what was already read, as for procfs and sysfs files
+        # that report 0, or a file truncated in between. Read on until a short read.
+        while True:
+            rest = yield from _execute(
+                Read(fd=self.fd, size=_READ_CHUNK_SIZE, offset=len(content))
+            )
+            content += rest.content
+            if rest.size < _READ_CHUNK_SIZE:
+                return content
 
     def read_text(self, size: int | None = None) -> Coro[str]:
         """Reads file content and decodes to string."""
         content = yield from self.read(size)
         return content.decode()
 
-    def write(self, data: bytes | str) -> Coro[int]:
+    def write(self, data: Buffer | str) -> Coro[int]:
         """Write file low-level coroutine.
 
         Args:
-            data: the data to write to the file.
+            data: the data to write to the file. Any bytes-like object is written
+                without copying.
         """
         _data = data.encode() if isinstance(data, str) else data
         result = yield from _execute(Write(fd=self.fd, data=_data))
         return result.size
 
+    def write_many(self, *data: Buffer) -> Coro[int]:
+        """Writes several buffers to the file in one operation, without joining them.
+
+        Args:
+            data: the buffers to write, in order. Any bytes-like objects work.
+        """
+        result = yield from _execute(WriteV(fd=self.fd, buffers=list(data)))
+        return result.size
+
     def close(self) -> Coro[None]:
         """Close file low-level coroutine."""
         yield from _execute(Close(fd=self.fd))
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import errno
-from collections import defaultdict
+from collections import defaultdict, deque
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeIs
 
 from one_ring_core.log import get_logger
 from one_ring_core.operations import Cancel, IOOperation
@@ -27,10 +27,40 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def _is_io_operation(value: object) -> TypeIs[IOOperation]:
+    """Checks for an IO operation without going through ABCMeta.__instancecheck__.
+
+    Every value a task yields is checked, and IOOperation is an ABC, so its MRO is
+    searched directly instead.
+    """
+    return IOOperation in type(value).__mro__
+
+
+@dataclass(slots=True)
+class _Multishot:
+    """An armed multishot operation, shared by every task that yields it."""
+
+    """The operation, held so its id() stays unique while armed"""
+    operation: IOOperation
+
+    """Completions that arrived with no task waiting, in order"""
+    completions: deque[IOCompletion[IOResult]] = field(default_factory=deque)
+
+    """Tasks waiting for a completion, in the order they yielded the operation.
+    Only ever non-empty while completions is empty"""
+    waiters: deque[TaskID] = field(default_factory=deque)
+
+
 @dataclass(slots=True, kw_only=True)
 class Loop:
     """The one-ring-loop. Bask in it's glory."""
 
+    """Whether the kernel polls for submissions, see IOWorker.sqpoll"""
+    sqpoll: bool = False
+
+    """Whether the kernel supports zero-copy sends, see IOWorker.send_zc"""
+    send_zc: bool = field(default=False, init=False)
+
     # TODO: See if there's a nice way to consolidate the below three attributes.
     """The tasks currently running"""
     tasks: dict[TaskID, Task] = field(default_factory=dict, init=False)
@@ -46,16 +76,23 @@ class Loop:
     """Maps operation id to task id for in-flight operations"""
     operation_to_task: dict[int, TaskID] = field(default_factory=dict, init=False)
 
+    """Maps id() of an armed multishot operation to its operation id"""
+    multishot_operations: dict[int, int] = field(default_factory=dict, init=False)
+
+    """Armed multishot operations by operation id"""
+    multishot_armed: dict[int, _Multishot] = field(default_factory=dict, init=False)
+
     def run_until_complete(self) -> None:
         """Runs the event loop until all tasks are complete."""
-        with IOWorker() as worker:
+        with IOWorker(sqpoll=self.sqpoll) as worker:
+            self.send_zc = worker.send_zc
             while self.tasks:
                 self._start_tasks()  # Start new tasks
                 self._cancel_ready_tasks()  # Cancel tasks ready to be submitted
                 self._register_io_cancellations(worker)  # Register I/O cancellations
-                self._register_ready_tasks(worker)  # Submit new I/O
+                self._register_ready_tasks(worker)  # Register new I/O
                 self._drive_unparked_tasks()  # Drive wakeups
-                self._drive_completed_tasks(worker)  # Drive kernel completions
+                self._drive_completed_tasks(worker)  # Submit I/O, drive completions
                 self._drive_checkpointed_tasks()  # Drive checkpoints
                 self._remove_done_tasks()  # Clean up and wake dependent tasks
 
@@ -67,8 +104,7 @@ class Loop:
                 task.start()
 
     def _register_io_cancellations(self, worker: IOWorker) -> None:
-        """Drains cancellation queue and registers and submits IO cancellations ops."""
-        should_submit = False
+        """Drains cancellation queue and registers IO cancellations ops."""
         while _local.cancel_queue:
             task_id = _local.cancel_queue.popleft()
             if task_id not in self.tasks:
@@ -77,18 +113,14 @@ class Loop:
             if task.is_waiting_on:
                 continue
             if task.should_cancel():
-                if task.is_parked:
-                    # No kernel op, throw directly
+                if task.is_parked or self._leave_multishot(task):
+                    # No kernel op to cancel, throw directly
                     with self.set_current_task(task):
                         task.throw(Cancelled())
                 elif (op_id := task.pending_cancel_op_id()) is not None:
-                    should_submit = True
                     cancel_op = Cancel(target_identifier=op_id)
                     worker.register(cancel_op, _get_new_operation_id())
 
-        if should_submit:
-            worker.submit()
-
     def _get_ready_tasks(self) -> list[Task]:
         """Gets the tasks ready to register with the IO worker."""
         return [task for task in self.tasks.values() if task.is_ready]
@@ -103,44 +135,56 @@ class Loop:
 
     def _register_ready_tasks(self, worker: IOWorker) -> None:
         """Register ready tasks with the I/O worker."""
-        should_submit = False
         for task in self._get_ready_tasks():
             # If a .throw call finished the task, don't register it.
-            if task.is_done:
+            state = task.state
+            if not isinstance(state, Ready):
                 continue
 
-            match task.state:
-                case Ready(operation=IOOperation() as op):
-                    should_submit = True
-                    op_id = _get_new_operation_id()
-                    worker.register(op, op_id)
-                    self.operation_to_task[op_id] = task.task_id
-                    task.state = Submitted(operation=op, op_id=op_id)
-                case Ready(operation=WaitsOn(task_ids=ids)):
-                    for task_id in ids:
-                        self.task_dependencies[task_id].add(task.task_id)
-                    task.state = Submitted(operation=WaitsOn(task_ids=ids))
-                case Ready(operation=Park()):
-                    task.state = Submitted(operation=Park())
-                case _:
+            # Dispatches on the operation alone, most common first. A match on the
+            # state would check the state and fetch the operation once per case.
+            op = state.operation
+            if _is_io_operation(op):
+                if (op_id := self.multishot_operations.get(id(op))) is not None:
+                    self._resume_multishot(task, op_id)
                     continue
-
-        if should_submit:
-            worker.submit()
-
-    def _collect_completions(self, worker: IOWorker) -> set[IOCompletion[IOResult]]:
-        """Waits for completions if all tasks are waiting, otherwise peeks."""
-        completions: set[IOCompletion] = set()
+                op_id = _get_new_operation_id()
+                worker.register(op, op_id)
+                task.state = Submitted(operation=op, op_id=op_id)
+                if op.is_multishot():
+                    # Armed right away, so a task yielding it before its first
+                    # completion waits on this submission rather than making another.
+                    self.multishot_operations[id(op)] = op_id
+                    self.multishot_armed[op_id] = _Multishot(
+                        operation=op, waiters=deque((task.task_id,))
+                    )
+                else:
+                    self.operation_to_task[op_id] = task.task_id
+            elif isinstance(op, WaitsOn):
+                for task_id in op.task_ids:
+                    self.task_dependencies[task_id].add(task.task_id)
+                task.state = Submitted(operation=op)
+            elif isinstance(op, Park):
+                task.state = Submitted(operation=op)
+
+    def _collect_completions(self, worker: IOWorker) -> list[IOCompletion[IOResult]]:
+        """Waits for completions if all tasks are waiting, otherwise peeks.
+
+        Everything registered this iteration is submitted first, once. When the
+        loop blocks, the submit and the wait share a single syscall. Completions are
+        kept in order, as a multishot operation's completions must be seen in order.
+        """
+        completions: list[IOCompletion] = []
 
         if all(task.is_submitted for task in self.tasks.values()):
             if not any(task.has_pending_io for task in self.tasks.values()):
                 raise RuntimeError("Deadlock: all tasks blocked, no pending I/O")
             completion = worker.wait()
-            completions.add(completion)
+            completions.append(completion)
         else:
-            # Peek until we get None.
-            while (completion := worker.peek()) is not None:
-                completions.add(completion)
+            worker.submit()
+        # Take everything else that has completed in one go.
+        completions.extend(worker.drain())
 
         return completions
 
@@ -149,22 +193,109 @@ class Loop:
         for completion in completions:
             op_id = completion.user_data
             task_id = self.operation_to_task.pop(op_id, None)
-
             if task_id is None:
+                if (armed := self.multishot_armed.get(op_id)) is not None:
+                    self._route_multishot(op_id, armed, completion)
                 continue
             task = self.tasks.get(task_id)
             if task is None:
                 continue
 
-            with self.set_current_task(task):
-                if (
-                    isinstance(oserror := completion.result, OSError)
-                    and oserror.errno is not None
-                    and oserror.errno == errno.ECANCELED
-                ):
-                    task.throw(Cancelled())
-                else:
-                    task.drive(completion)
+            self._drive_with_completion(task, completion)
+
+    def _drive_with_completion(
+        self, task: Task, completion: IOCompletion[IOResult]
+    ) -> None:
+        """Drives a task with the completion of the operation it waits on."""
+        with self.set_current_task(task):
+            if (
+                isinstance(oserror := completion.result, OSError)
+                and oserror.errno is not None
+                and oserror.errno == errno.ECANCELED
+            ):
+                task.throw(Cancelled())
+            else:
+                task.drive(completion)
+
+    def _route_multishot(
+        self, op_id: int, armed: _Multishot, completion: IOCompletion[IOResult]
+    ) -> None:
+        """Hands a completion of an armed multishot operation to the next waiter.
+
+        Completions that arrive while no task waits are queued, until a task yields
+        the operation again. On the final completion, the waiters left behind get it
+        too if it is an error. Otherwise they yield the operation anew.
+        """
+        if not armed.waiters:
+            if completion.more or not isinstance(completion.result, OSError):
+                armed.completions.append(completion)
+            else:
+                # Cancelled or failed with nobody waiting, e.g. on close. Dropped, as
+                # the operation may never be yielded again.
+                self._disarm_multishot(op_id)
+            return
+
+        if not completion.more:
+            self._disarm_multishot(op_id)
+        task_id = armed.waiters.popleft()
+        if (task := self.tasks.get(task_id)) is not None:
+            self._drive_with_completion(task, completion)
+        if completion.more:
+            return
+        failed = isinstance(completion.result, OSError)
+        while armed.waiters:
+            if (task := self.tasks.get(armed.waiters.popleft())) is None:
+                continue
+            if failed:
+                self._drive_with_completion(task, completion)
+            else:
+                task.state = Ready(operation=armed.operation)
+
+    def _resume_multishot(self, task: Task, op_id: int) -> None:
+        """Resumes a task that yields an armed multishot operation again.
+
+        Nothing is registered with the worker. The task is driven with a queued
+        completion if there is one, and otherwise waits for the next.
+        """
+        armed = self.multishot_armed[op_id]
+        task.state = Submitted(operation=armed.operation, op_id=op_id)
+        if not armed.completions:
+            armed.waiters.append(task.task_id)
+            return
+
+        completion = armed.completions.popleft()
+        if not completion.more:
+            self._disarm_multishot(op_id)
+        self._drive_with_completion(task, completion)
+
+    def _leave_multishot(self, task: Task) -> bool:
+        """Stops a cancelled task from waiting on an armed multishot operation.
+
+        Only done while other tasks wait on it too, as cancelling the operation in
+        the kernel would end it for them as well.
+
+        Returns:
+            Whether the task was waiting alongside others, and no longer is.
+        """
+        op_id = task.pending_cancel_op_id()
+        armed = None if op_id is None else self.multishot_armed.get(op_id)
+        if armed is None or len(armed.waiters) < 2:  # noqa: PLR2004
+            return False
+        armed.waiters.remove(task.task_id)
+        return True
+
+    def _disarm_multishot(self, op_id: int) -> None:
+        """Forgets a multishot operation after its final completion.
+
+        Queued completions nobody will take are discarded, which closes the
+        connections of queued accepts.
+        """
+        armed = self.multishot_armed.pop(op_id)
+        del self.multishot_operations[id(armed.operation)]
+        while armed.completions:
+            result = armed.completions.popleft().result
+            if not isinstance(result, OSError):
+                armed.operation.discard(result)
 
     def _drive_unparked_tasks(self) -> None:
         """Drives tasks that have been unparked.
@@ -218,29 +349,37 @@ class Loop:
 
     @contextmanager
     def set_current_task(self, task: Task) -> Generator[None]:
-        """Utility wrapper for setting and removing currently executing task."""
+        """Utility wrapper for setting and restoring the currently executing task.
+
+        Restores the previous task on exit, since eagerly started tasks are driven
+        from within their parent.
+        """
+        previous_task = self._current_task
         self._current_task = task
         try:
             yield
         finally:
-            self._current_task = None
+            self._current_task = previous_task
 
     def add_task(self, task: Task) -> None:
         """Adds a task to be run by the event loop."""
         self.tasks[task.task_id] = task
 
 
-def run(gen: Coro) -> None:
+def run(gen: Coro, *, sqpoll: bool = False) -> None:
     """Entry point for running the event loop.
 
     Creates a Task from the generator on the event loop, and runs the loop.
 
     Args:
         gen: the entry coroutine
+        sqpoll: whether a kernel thread polls for submissions, which makes most of
+            the loop's submits syscall free. Pays off for busy, file heavy loops.
+            Kernels before 5.11 require CAP_SYS_NICE for it.
     """
     from one_ring_loop.task import _create_standalone_task  # noqa: PLC0415
 
-    _local.loop = Loop()
+    _local.loop = Loop(sqpoll=sqpoll)
     _create_standalone_task(gen, None, None)
     _local.loop.run_until_complete()
     _local.cleanup()
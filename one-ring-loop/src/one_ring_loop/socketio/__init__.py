@@ -1,48 +1,41 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from one_ring_core.operations import (
+    Cancel,
     Close,
     SocketAccept,
-    SocketBind,
+    SocketBindListen,
     SocketConnect,
     SocketCreate,
-    SocketListen,
     SocketRecv,
     SocketSend,
-    SocketSetOpt,
+    SocketSendMsg,
+    SocketSendZC,
 )
 from one_ring_loop._utils import _execute
+from one_ring_loop.lowlevel import get_running_loop
 from one_ring_loop.streams.exceptions import EndOfStreamError
 
 if TYPE_CHECKING:
+    from collections.abc import Buffer
+
     from one_ring_loop.typedefs import Coro
 
 # TODO: Clean up
 # Better names
 # Centralize "close" together with fileio
 
+# Smallest payload sent with zero copy. Below it, the kernel's notification that it
+# is done with the buffer costs more than copying the buffer does.
+_ZERO_COPY_MIN_SIZE = 16 * 1024
+
 
 def _create() -> Coro[int]:
     result = yield from _execute(SocketCreate())
     return result.fd
 
 
-def _set_options(fd: int) -> Coro[None]:
-    yield from _execute(SocketSetOpt(fd=fd))
-    return None
-
-
-def _bind(fd: int, host: str, port: int) -> Coro[None]:
-    yield from _execute(SocketBind(fd=fd, ip=host, port=port))
-    return None
-
-
-def _listen(fd: int) -> Coro[None]:
-    yield from _execute(SocketListen(fd=fd))
-    return None
-
-
 def _connect(fd: int, host: str, port: int) -> Coro[None]:
     yield from _execute(SocketConnect(fd=fd, ip=host, port=port))
     return None
@@ -51,9 +44,8 @@ def _connect(fd: int, host: str, port: int) -> Coro[None]:
 def create_server(host: str, port: int) -> Coro[Server]:
     """Creates a socket (server), sets options, binds it and wraps in SocketListener."""
     fd = yield from _create()
-    yield from _set_options(fd)
-    yield from _bind(fd, host, port)
-    yield from _listen(fd)
+    # Options, bind and listen are submitted together as one linked operation.
+    yield from _execute(SocketBindListen(fd=fd, ip=host, port=port))
     return Server(fd=fd)
 
 
@@ -72,17 +64,32 @@ class Server:
     """The socket's file descriptor"""
     fd: int
 
+    """Multishot accept operation for this socket. Submitted by the first accept and
+    yielded again by later ones, which the loop resumes from its completions"""
+    _accept_op: SocketAccept = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Builds the shared accept operation."""
+        self._accept_op = SocketAccept(fd=self.fd, multishot=True)
+
     def accept(self) -> Coro[Connection]:
         """Waits until there's a connection to accept.
 
         Returns:
             client file descriptor
         """
-        result = yield from _execute(SocketAccept(fd=self.fd))
+        result = yield from _execute(self._accept_op)
         return Connection(fd=result.fd)
 
     def close(self) -> Coro[None]:
-        """Close socket."""
+        """Close socket.
+
+        A multishot accept still armed is cancelled first, as closing the fd doesn't
+        end it.
+        """
+        op_id = get_running_loop().multishot_operations.get(id(self._accept_op))
+        if op_id is not None:
+            yield from _execute(Cancel(target_identifier=op_id))
         yield from _execute(Close(fd=self.fd))
         return None
 
@@ -94,17 +101,64 @@ class Connection:
     """Either server file descriptor, or client file descriptor."""
     fd: int
 
+    """Scratch buffer reused by every receive on this connection"""
+    _recv_buffer: bytearray = field(default_factory=bytearray, init=False, repr=False)
+
+    """Receive operation bound to this connection's fd and buffer, built once"""
+    _recv_op: SocketRecv | None = field(default=None, init=False, repr=False)
+
+    """Whether a receive into the scratch buffer is in flight"""
+    _receiving: bool = field(default=False, init=False, repr=False)
+
     def receive(self, max_bytes: int = 65536) -> Coro[bytes]:
-        """Reads data from socket."""
-        result = yield from _execute(SocketRecv(fd=self.fd, size=max_bytes))
+        """Reads data from socket.
+
+        Receives go into a scratch buffer reused by the connection. A receive started
+        while another one is in flight gets a buffer of its own instead, as the
+        kernel would otherwise fill the same buffer for both.
+        """
+        if self._receiving:
+            result = yield from _execute(SocketRecv(fd=self.fd, size=max_bytes))
+        else:
+            op = self._recv_op
+            if op is None or op.size != max_bytes:
+                if len(self._recv_buffer) < max_bytes:
+                    self._recv_buffer = bytearray(max_bytes)
+                op = self._recv_op = SocketRecv(
+                    fd=self.fd, size=max_bytes, buffer=self._recv_buffer
+                )
+            self._receiving = True
+            try:
+                result = yield from _execute(op)
+            finally:
+                self._receiving = False
+
         if not result.content:
             raise EndOfStreamError
-        return result.content
+        # Content from the scratch buffer was already copied out as exact bytes, which
+        # bytes() returns as is. Only a buffer of its own is copied here.
+        return bytes(result.content)
 
-    def send(self, data: bytes, /) -> Coro[None]:
-        """Sends data to socket."""
+    def send(self, data: Buffer, /) -> Coro[None]:
+        """Sends data to socket. Any bytes-like object is sent without copying.
+
+        Large bytes objects are sent without the kernel copying them either, where
+        the kernel supports it. Only bytes qualify, as the kernel may still read the
+        data after the send returns.
+        """
+        if (
+            isinstance(data, bytes)
+            and len(data) >= _ZERO_COPY_MIN_SIZE
+            and get_running_loop().send_zc
+        ):
+            yield from _execute(SocketSendZC(fd=self.fd, data=data))
+            return None
         yield from _execute(SocketSend(fd=self.fd, data=data))
 
+    def send_many(self, *data: Buffer) -> Coro[None]:
+        """Sends several buffers to socket in one operation, without joining them."""
+        yield from _execute(SocketSendMsg(fd=self.fd, buffers=list(data)))
+
     def close(self) -> Coro[None]:
         """Close socket."""
         yield from _execute(Close(fd=self.fd))
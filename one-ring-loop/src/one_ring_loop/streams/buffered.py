@@ -8,6 +8,8 @@ from one_ring_loop.streams.exceptions import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Buffer
+
     from one_ring_loop.streams.protocols import ReceiveStream, SendStream
     from one_ring_loop.typedefs import Coro
 
@@ -19,7 +21,8 @@ class BufferedByteReceiveStream:
     """Wrapped receive stream"""
     receive_stream: ReceiveStream[bytes]
 
-    """Internal buffer"""
+    """Internal buffer. Consumed from the front in place, so it keeps its allocation
+    instead of being copied into a new bytearray of a different size on every read"""
     _buffer: bytearray = field(default_factory=bytearray, init=False, repr=False)
 
     """Marker for closed resouce"""
@@ -35,15 +38,11 @@ class BufferedByteReceiveStream:
         if self._closed:
             raise ClosedResourceError("Cannot received from closed resouce")
 
-        if len(self._buffer) >= max_bytes:
-            data = bytes(self._buffer[:max_bytes])
-            self._buffer = self._buffer[max_bytes:]
-            return data
+        if len(self._buffer) < max_bytes:
+            received_data = yield from self.receive_stream.receive()
+            self._buffer.extend(received_data)
 
-        received_data = yield from self.receive_stream.receive()
-        combined_data = self._buffer + received_data
-        self._buffer = combined_data[max_bytes:]
-        return bytes(combined_data[:max_bytes])
+        return self._consume(max_bytes)
 
     def receive_exactly(self, nbytes: int) -> Coro[bytes]:
         """Reads exactly the given amount of bytes from the resouce."""
@@ -54,9 +53,7 @@ class BufferedByteReceiveStream:
         except EndOfStreamError as e:
             raise EndOfStreamError("Stream closed before receiving enough data") from e
 
-        data = bytes(self._buffer[:nbytes])
-        self._buffer = self._buffer[nbytes:]
-        return data
+        return self._consume(nbytes)
 
     def receive_until(self, *, delimiter: bytes, max_bytes: int) -> Coro[bytes]:
         """Reads from the resouce until delimiter is found, or max bytes are read."""
@@ -67,13 +64,22 @@ class BufferedByteReceiveStream:
         except EndOfStreamError as e:
             raise EndOfStreamError("Stream closed before delimiter found") from e
 
-        if len(split := self._buffer.split(delimiter, 1)) > 1:
-            self._buffer = split[1]
-            return bytes(split[0])
+        if (index := self._buffer.find(delimiter)) != -1:
+            data = self._consume(index)
+            del self._buffer[: len(delimiter)]
+            return data
 
         msg = f"Delimiter '{delimiter}' was not found within {max_bytes} bytes"
         raise DelimiterNotFoundError(msg)
 
+    def _consume(self, nbytes: int) -> bytes:
+        """Takes up to nbytes off the front of the internal buffer."""
+        with memoryview(self._buffer) as view:
+            data = bytes(view[:nbytes])
+        # Deleting from the front of a bytearray only moves its start offset.
+        del self._buffer[:nbytes]
+        return data
+
     @property
     def buffer(self) -> bytes:
         """Returns the contents of the internal buffer."""
@@ -95,3 +101,7 @@ class BufferedByteStream(BufferedByteReceiveStream):
     def send(self, data: bytes) -> Coro[None]:
         """Sends data via send stream."""
         yield from self.send_stream.send(data)
+
+    def send_many(self, *data: Buffer) -> Coro[None]:
+        """Sends several buffers via send stream, joining them only if it has to."""
+        yield from self.send_stream.send_many(*data)
@@ -13,6 +13,8 @@ from one_ring_loop.streams.exceptions import (
 from one_ring_loop.sync_primitives import Condition
 
 if TYPE_CHECKING:
+    from collections.abc import Buffer
+
     from one_ring_loop.typedefs import Coro
 
 logger = get_logger()
@@ -96,6 +98,10 @@ class MemoryObjectSendStream[T](MemoryObjectStreamBase[T]):
         finally:
             self.receive_condition.release()
 
+    def send_many(self: MemoryObjectSendStream[bytes], *data: Buffer) -> Coro[None]:
+        """Joins several buffers, and sends them to the stream as one item."""
+        yield from self.send(b"".join(data))
+
     def _predicate(self) -> bool:
         if self.stream_refcount["receive_streams"] <= 0:
             raise BrokenResourceError
@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
+    from collections.abc import Buffer
+
     from one_ring_loop.typedefs import Coro
 
 
@@ -24,6 +26,12 @@ class SendStream[T](Resource, Protocol):
     def send(self, data: T, /) -> Coro[None]:
         """Sends data to stream."""
 
+    def send_many(self, *data: Buffer) -> Coro[None]:
+        """Sends several buffers to stream, in order, as if joined first.
+
+        Streams that can send the buffers as they are do. Others join them.
+        """
+
 
 class TransportStream[T](SendStream[T], ReceiveStream[T], Protocol):
     """Bidirectional stream."""
@@ -9,7 +9,7 @@ from one_ring_loop.log import get_logger
 from one_ring_loop.streams.exceptions import EndOfStreamError
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Buffer, Callable
 
     from one_ring_loop.streams.protocols import TransportStream
     from one_ring_loop.typedefs import Coro
@@ -56,7 +56,7 @@ class TLSStream:
             raise EndOfStreamError
         return data
 
-    def send(self, data: bytes) -> Coro[None]:
+    def send(self, data: Buffer) -> Coro[None]:
         """Encrypts and sends data to peer.
 
         Args:
@@ -64,6 +64,22 @@ class TLSStream:
         """
         yield from self._call_ssl_method(self._ssl_object.write, data)
 
+    def send_many(self, *data: Buffer) -> Coro[None]:
+        """Encrypts several buffers and sends them to peer in one transport send.
+
+        The buffers are encrypted one by one, so they are never joined in plaintext.
+
+        Args:
+            data: buffers to encrypt and send, in order
+        """
+        for part in data:
+            try:
+                self._ssl_object.write(part)
+            except ssl.SSLWantReadError, ssl.SSLWantWriteError:
+                yield from self._call_ssl_method(self._ssl_object.write, part)
+        if self._write_bio.pending:
+            yield from self._transport_stream.send(self._write_bio.read())
+
     @classmethod
     def wrap(
         cls,
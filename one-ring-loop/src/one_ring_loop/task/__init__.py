@@ -243,11 +243,17 @@ class TaskGroup:
     """List of errors produced by children."""
     _errors: list[BaseException] = field(default_factory=list, init=False)
 
-    def create_task(self, gen: Coro) -> None:
-        """Creates a task managed by the task group."""
-        task = _create_standalone_task(gen, get_current_task().cancel_scopes, self)
-        for cancel_scope in task.cancel_scopes:
-            cancel_scope.add_task(task.task_id)
+    def create_task(self, gen: Coro, *, eager: bool = False) -> None:
+        """Creates a task managed by the task group.
+
+        Args:
+            gen: the coroutine for the Task to wrap
+            eager: run the task up to its first yield immediately, instead of on the
+                next loop iteration
+        """
+        task = _create_standalone_task(
+            gen, get_current_task().cancel_scopes, self, eager=eager
+        )
         self.tasks.append(task)
 
     def enter(self) -> None:
@@ -296,30 +302,42 @@ def wait_on(*tasks: Task) -> Coro[None]:
 
 
 def _create_standalone_task[T](
-    gen: Coro[T], cancel_scopes: deque[CancelScope] | None, task_group: TaskGroup | None
+    gen: Coro[T],
+    cancel_scopes: deque[CancelScope] | None,
+    task_group: TaskGroup | None,
+    *,
+    eager: bool = False,
 ) -> Task[T]:
     """Creates a task by adding it to the event loop.
 
     This function is not meant to be used by users. Right now, it's only exposed for the
     bridging example.
 
+    Eagerly created tasks are driven up to their first yield before this function
+    returns. A task finishing without yielding then never costs a loop iteration.
+
     Args:
         gen: the coroutine for the Task to wrap
         cancel_scopes: the cancel scopes relevant to the task
         task_group: the task group to which the task belongs to
+        eager: start the task immediately, instead of on the next loop iteration
     """
     task_id = _get_new_operation_id()
     if cancel_scopes is None:
-        new_cancel_scope = CancelScope()
-        new_cancel_scope.add_task(task_id)
-        _cancel_scopes = deque([new_cancel_scope])
+        _cancel_scopes = deque([CancelScope()])
     else:
         _cancel_scopes = deque(cancel_scopes)
+    for cancel_scope in _cancel_scopes:
+        cancel_scope.add_task(task_id)
 
     task: Task[T] = Task(
         gen=gen, task_id=task_id, cancel_scopes=_cancel_scopes, task_group=task_group
     )
-    get_running_loop().add_task(task)
+    loop = get_running_loop()
+    loop.add_task(task)
+    if eager:
+        with loop.set_current_task(task):
+            task.start()
     return task
 
 
@@ -38,9 +38,14 @@ class EventFD:
 
 _executor = ThreadPoolExecutor()
 
+# Eventfds of finished thread calls. Waiting reads the eventfd back to zero, so they
+# can be reused instead of creating and closing one per call.
+_free_eventfds: list[EventFD] = []
 
-# TODO: This creates a new eventfd per thread. Not optimal, but otherwise requires
-# plumbing into event loop for a clean solution. To fix later, if it becomes a problem.
+
+# TODO: This needs an eventfd per concurrent thread call. Not optimal, but otherwise
+# requires plumbing into event loop for a clean solution. To fix later, if it becomes
+# a problem.
 # Architecture idea:
 # 1. Create queue to put thread results into.
 # 2. Park thread tasks waiting on result.
@@ -51,7 +56,7 @@ def run_in_thread[T, **P](
     func: Callable[P, T], *args: P.args, **kwargs: P.kwargs
 ) -> Coro[T]:
     """Runs a function in a threadpool."""
-    eventfd = EventFD()
+    eventfd = _free_eventfds.pop() if _free_eventfds else EventFD()
 
     def wrapper() -> T:
         try:
@@ -63,8 +68,10 @@ def run_in_thread[T, **P](
     fut = _executor.submit(wrapper)
     try:
         yield from eventfd.wait()
-        ret = fut.result()
-    finally:
+    except BaseException:
+        # The thread may still notify after e.g. cancellation, so don't reuse it.
         eventfd.close()
+        raise
+    _free_eventfds.append(eventfd)
 
-    return ret
+    return fut.result()
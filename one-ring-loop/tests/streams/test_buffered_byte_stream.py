@@ -71,6 +71,22 @@ class TestBufferedByteStream:
         with pytest.raises(DelimiterNotFoundError):
             run_coro(entry())
 
+    def test_send_many(self, run_coro) -> None:
+        def entry() -> Coro[None]:
+            send_stream, receive_stream = create_memory_object_stream[bytes](5)
+            buffered = BufferedByteStream(
+                send_stream=send_stream, receive_stream=receive_stream
+            )
+            try:
+                yield from buffered.send_many(b"hel", memoryview(b"lo, world!"))
+
+                result = yield from buffered.receive_exactly(12)
+                assert result == b"hello, world"
+            finally:
+                yield from buffered.close()
+
+        run_coro(entry())
+
     def test_closed_stream_raises(self, run_coro) -> None:
         def entry() -> Coro[None]:
             send_stream, receive_stream = create_memory_object_stream[bytes](5)
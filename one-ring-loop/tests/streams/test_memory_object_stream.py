@@ -49,6 +49,19 @@ class TestMemoryObjectSendStream:
 
         assert isinstance(exc_info.value.exceptions[0], EndOfStreamError)
 
+    def test_send_many_joins_buffers(self, run_coro) -> None:
+        def entry() -> Coro[None]:
+            send_stream, receive_stream = create_memory_object_stream[bytes](1)
+            try:
+                yield from send_stream.send_many(b"hello", memoryview(b", world"))
+                result = yield from receive_stream.receive()
+                assert result == b"hello, world"
+            finally:
+                yield from send_stream.close()
+                yield from receive_stream.close()
+
+        run_coro(entry())
+
     def test_clone_send_receive(self, run_coro) -> None:
         def producer(send_stream: MemoryObjectSendStream[int]) -> Coro[None]:
             for i in range(5):
@@ -25,3 +25,82 @@ class TestFileIO:
                 yield from file.close()
 
         run_coro(coro())
+
+    @pytest.mark.io
+    def test_read_larger_than_first_chunk(self, run_coro, tmp_file_path: Path) -> None:
+        content = bytes(range(256)) * 1024
+
+        def coro() -> Coro[None]:
+            file = yield from open_file(str(tmp_file_path), "rwc")
+            try:
+                yield from file.write(content)
+                result = yield from file.read()
+                assert result == content
+            finally:
+                yield from file.close()
+
+        run_coro(coro())
+
+    @pytest.mark.io
+    def test_read_exactly_first_chunk(self, run_coro, tmp_file_path: Path) -> None:
+        # The size from statx adds nothing to the full first chunk, so the rest is
+        # read in chunks until a short read.
+        content = bytes(range(256)) * 256
+
+        def coro() -> Coro[None]:
+            file = yield from open_file(str(tmp_file_path), "rwc")
+            try:
+                yield from file.write(content)
+                result = yield from file.read()
+                assert result == content
+            finally:
+                yield from file.close()
+
+        run_coro(coro())
+
+    @pytest.mark.io
+    def test_write_many(self, run_coro, tmp_file_path: Path) -> None:
+        def coro() -> Coro[None]:
+            file = yield from open_file(str(tmp_file_path), "rwc")
+            try:
+                written = yield from file.write_many(b"Hello, ", b"world!")
+                assert written == 13
+                result = yield from file.read()
+                assert result == b"Hello, world!"
+            finally:
+                yield from file.close()
+
+        run_coro(coro())
+
+    @pytest.mark.io
+    def test_write_many_buffers(self, run_coro, tmp_file_path: Path) -> None:
+        content = bytearray(b"Hello, world!")
+
+        def coro() -> Coro[None]:
+            file = yield from open_file(str(tmp_file_path), "rwc")
+            try:
+                written = yield from file.write_many(
+                    content[:7], memoryview(content)[7:]
+                )
+                assert written == len(content)
+                result = yield from file.read()
+                assert result == content
+            finally:
+                yield from file.close()
+
+        run_coro(coro())
+
+    @pytest.mark.io
+    def test_write_memoryview(self, run_coro, tmp_file_path: Path) -> None:
+        content = bytearray(b"Hello, world!")
+
+        def coro() -> Coro[None]:
+            file = yield from open_file(str(tmp_file_path), "rwc")
+            try:
+                yield from file.write(memoryview(content)[7:])
+                result = yield from file.read()
+                assert result == b"world!"
+            finally:
+                yield from file.close()
+
+        run_coro(coro())
@@ -1,10 +1,32 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
+from one_ring_loop.fileio import open_file
+from one_ring_loop.loop import run
 from one_ring_loop.lowlevel import get_running_loop
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from one_ring_loop.typedefs import Coro
+
 
 def test_get_running_loop_errors() -> None:
     with pytest.raises(RuntimeError, match="No event loop running"):
         get_running_loop()
+
+
+def test_run_with_sqpoll(tmp_path: Path) -> None:
+    def coro() -> Coro[None]:
+        file = yield from open_file(str(tmp_path / "sqpoll.txt"), "rwc")
+        try:
+            yield from file.write("Hello!")
+            result = yield from file.read_text()
+            assert result == "Hello!"
+        finally:
+            yield from file.close()
+
+    run(coro(), sqpoll=True)
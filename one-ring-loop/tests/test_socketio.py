@@ -3,11 +3,15 @@ from typing import TYPE_CHECKING
 import pytest
 
 from one_ring_loop.log import get_logger
+from one_ring_loop.lowlevel import checkpoint
 from one_ring_loop.socketio import connect, create_server
+from one_ring_loop.streams.exceptions import EndOfStreamError
 from one_ring_loop.sync_primitives import Event
 from one_ring_loop.task import TaskGroup
+from one_ring_loop.timerio import sleep
 
 if TYPE_CHECKING:
+    from one_ring_loop.socketio import Connection, Server
     from one_ring_loop.typedefs import Coro
 
 logger = get_logger(__name__)
@@ -52,3 +56,183 @@ class TestSocketIO:
                 yield from tg.exit()
 
         run_coro(entry())
+
+    @pytest.mark.io
+    def test_server_accepts_many_clients(self, run_coro, unused_tcp_port: int) -> None:
+        n_clients = 3
+
+        def _run_server(ip: str, port: int, event: Event) -> Coro:
+            server_socket = yield from create_server(ip, port)
+            try:
+                event.set()
+                for i in range(n_clients):
+                    connection = yield from server_socket.accept()
+                    yield from connection.send(b"client %d" % i)
+                    yield from connection.close()
+            finally:
+                yield from server_socket.close()
+
+        def entry() -> Coro:
+            ip = "127.0.0.1"
+            port = unused_tcp_port
+            event = Event()
+            tg = TaskGroup()
+            tg.enter()
+            try:
+                tg.create_task(_run_server(ip, port, event))
+                yield from event.wait()
+                contents = []
+                for _ in range(n_clients):
+                    client_socket = yield from connect(ip, port)
+                    try:
+                        contents.append((yield from client_socket.receive(1024)))
+                    finally:
+                        yield from client_socket.close()
+                yield from tg.wait()
+                assert contents == [b"client %d" % i for i in range(n_clients)]
+            finally:
+                yield from tg.exit()
+
+        run_coro(entry())
+
+    @pytest.mark.io
+    def test_send_large_payload(self, run_coro, unused_tcp_port: int) -> None:
+        payload = bytes(range(256)) * 128
+
+        def _run_server(ip: str, port: int, event: Event) -> Coro:
+            server_socket = yield from create_server(ip, port)
+            try:
+                event.set()
+                connection = yield from server_socket.accept()
+                yield from connection.send(payload)
+                yield from connection.close()
+            finally:
+                yield from server_socket.close()
+
+        def entry() -> Coro:
+            ip = "127.0.0.1"
+            port = unused_tcp_port
+            event = Event()
+            tg = TaskGroup()
+            tg.enter()
+            try:
+                tg.create_task(_run_server(ip, port, event))
+                yield from event.wait()
+                client_socket = yield from connect(ip, port)
+                received = bytearray()
+                try:
+                    while len(received) < len(payload):
+                        received += yield from client_socket.receive()
+                finally:
+                    yield from client_socket.close()
+                yield from tg.wait()
+                assert received == payload
+            finally:
+                yield from tg.exit()
+
+        run_coro(entry())
+
+    @pytest.mark.io
+    def test_concurrent_accepts_share_submission(
+        self, run_coro, unused_tcp_port: int
+    ) -> None:
+        def _accept_one(server_socket: Server, i: int) -> Coro:
+            connection = yield from server_socket.accept()
+            yield from connection.send(b"acceptor %d" % i)
+            yield from connection.close()
+
+        def entry() -> Coro:
+            ip = "127.0.0.1"
+            port = unused_tcp_port
+            server_socket = yield from create_server(ip, port)
+            tg = TaskGroup()
+            tg.enter()
+            try:
+                # Both accept before the first connection arrives.
+                tg.create_task(_accept_one(server_socket, 0))
+                tg.create_task(_accept_one(server_socket, 1))
+                yield from checkpoint()
+                contents = []
+                for _ in range(2):
+                    client_socket = yield from connect(ip, port)
+                    try:
+                        contents.append((yield from client_socket.receive(1024)))
+                    finally:
+                        yield from client_socket.close()
+                yield from tg.wait()
+                assert sorted(contents) == [b"acceptor 0", b"acceptor 1"]
+            finally:
+                yield from tg.exit()
+                yield from server_socket.close()
+
+        run_coro(entry())
+
+    @pytest.mark.io
+    def test_concurrent_receives_on_one_connection(
+        self, run_coro, unused_tcp_port: int
+    ) -> None:
+        def _run_server(ip: str, port: int, event: Event) -> Coro:
+            server_socket = yield from create_server(ip, port)
+            try:
+                event.set()
+                connection = yield from server_socket.accept()
+                # Both receives are in flight before anything is sent.
+                yield from sleep(0.05)
+                yield from connection.send(b"first")
+                yield from sleep(0.05)
+                yield from connection.send(b"second")
+                yield from connection.close()
+            finally:
+                yield from server_socket.close()
+
+        def entry() -> Coro:
+            ip = "127.0.0.1"
+            port = unused_tcp_port
+            event = Event()
+            contents = []
+
+            def _receive_one(connection: Connection) -> Coro:
+                contents.append((yield from connection.receive(1024)))
+
+            tg = TaskGroup()
+            tg.enter()
+            try:
+                tg.create_task(_run_server(ip, port, event))
+                yield from event.wait()
+                client_socket = yield from connect(ip, port)
+                try:
+                    tg.create_task(_receive_one(client_socket))
+                    tg.create_task(_receive_one(client_socket))
+                    yield from tg.wait()
+                finally:
+                    yield from client_socket.close()
+                assert sorted(contents) == [b"first", b"second"]
+            finally:
+                yield from tg.exit()
+
+        run_coro(entry())
+
+    @pytest.mark.io
+    def test_close_closes_queued_connections(
+        self, run_coro, unused_tcp_port: int
+    ) -> None:
+        def entry() -> Coro:
+            ip = "127.0.0.1"
+            port = unused_tcp_port
+            server_socket = yield from create_server(ip, port)
+            try:
+                first = yield from connect(ip, port)
+                connection = yield from server_socket.accept()
+                yield from connection.close()
+                # Accepted by the armed multishot accept with nobody waiting.
+                second = yield from connect(ip, port)
+                yield from sleep(0.05)
+            finally:
+                yield from server_socket.close()
+
+            with pytest.raises(EndOfStreamError):
+                yield from second.receive(1024)
+            yield from first.close()
+            yield from second.close()
+
+        run_coro(entry())
@@ -116,3 +116,28 @@ def test_raises_exception_group_from_group(run_coro, timing) -> None:
         )
 
     run_coro(entry())
+
+
+def test_eager_task_runs_until_first_yield(run_coro) -> None:
+    events: list[str] = []
+
+    def child(name: str) -> Coro[None]:
+        events.append(f"{name} started")
+        yield from sleep(0.1)
+        events.append(f"{name} finished")
+
+    def entry() -> Coro[None]:
+        tg = TaskGroup()
+        tg.enter()
+        try:
+            tg.create_task(child("lazy"))
+            tg.create_task(child("eager"), eager=True)
+            events.append("created")
+            yield from tg.wait()
+        finally:
+            yield from tg.exit()
+
+    run_coro(entry())
+
+    assert events[:3] == ["eager started", "created", "lazy started"]
+    assert sorted(events[3:]) == ["eager finished", "lazy finished"]
@@ -50,3 +50,11 @@ def test_threads_raises(run_coro, timing) -> None:
 
     assert len(exc_info.value.exceptions) == 1
     assert isinstance(exc_info.value.exceptions[0], RuntimeError)
+
+
+def test_sequential_calls_return_results(run_coro) -> None:
+    def entry() -> Coro[None]:
+        for i in range(3):
+            assert (yield from run_in_thread(lambda i=i: i * 2)) == i * 2
+
+    run_coro(entry())
@@ -5,6 +5,18 @@ from rusty_ring._rusty_ring import (
     AT_EMPTY_PATH,
     AT_FDCWD,
     AT_SYMLINK_NOFOLLOW,
+    IORING_CQE_BUFFER_SHIFT,
+    IORING_CQE_F_BUFFER,
+    IORING_CQE_F_MORE,
+    IORING_CQE_F_NOTIF,
+    IORING_OP_SEND_ZC,
+    IOSQE_ASYNC,
+    IOSQE_BUFFER_SELECT,
+    IOSQE_CQE_SKIP_SUCCESS,
+    IOSQE_FIXED_FILE,
+    IOSQE_IO_DRAIN,
+    IOSQE_IO_HARDLINK,
+    IOSQE_IO_LINK,
     IPPROTO_TCP,
     MSG_DONTWAIT,
     MSG_NOSIGNAL,
@@ -66,6 +78,18 @@ __all__ = [
     "AT_EMPTY_PATH",
     "AT_FDCWD",
     "AT_SYMLINK_NOFOLLOW",
+    "IORING_CQE_BUFFER_SHIFT",
+    "IORING_CQE_F_BUFFER",
+    "IORING_CQE_F_MORE",
+    "IORING_CQE_F_NOTIF",
+    "IORING_OP_SEND_ZC",
+    "IOSQE_ASYNC",
+    "IOSQE_BUFFER_SELECT",
+    "IOSQE_CQE_SKIP_SUCCESS",
+    "IOSQE_FIXED_FILE",
+    "IOSQE_IO_DRAIN",
+    "IOSQE_IO_HARDLINK",
+    "IOSQE_IO_LINK",
     "IPPROTO_TCP",
     "MSG_DONTWAIT",
     "MSG_NOSIGNAL",
@@ -1,4 +1,5 @@
 import types
+from collections.abc import Buffer
 from typing import Self
 
 class SockAddr:
@@ -16,7 +17,16 @@ class CompletionEvent:
     def flags(self) -> int: ...
 
 class Ring:
-    def __init__(self, depth: int = 32) -> None: ...
+    def __init__(
+        self,
+        depth: int = 32,
+        *,
+        cq_entries: int | None = None,
+        sqpoll: bool = False,
+        sq_thread_idle: int = 1000,
+        single_issuer: bool = True,
+        coop_taskrun: bool = True,
+    ) -> None: ...
     def __enter__(self) -> Self: ...
     def __exit__(
         self,
@@ -26,13 +36,24 @@ class Ring:
     ) -> bool: ...
     def submit(self) -> int: ...
     def peek(self) -> CompletionEvent | None: ...
+    def peek_batch(self, max_events: int = 64) -> list[CompletionEvent]: ...
     def wait(self) -> CompletionEvent: ...
+    def register_buffers(self, bufs: list[bytearray | memoryview]) -> None: ...
+    def unregister_buffers(self) -> None: ...
+    def set_sqe_flags(self, user_data: int, flags: int) -> None: ...
+    def reserve(self, entries: int) -> None: ...
+    def end_link(self, user_data: int) -> bool: ...
+    def supports(self, code: int) -> bool: ...
+    def register_files(self, fds: list[int]) -> None: ...
+    def register_files_update(self, offset: int, fds: list[int]) -> int: ...
+    def unregister_files(self) -> None: ...
     def prep_nop(self, user_data: int) -> None: ...
     def prep_timeout(self, user_data: int, sec: int, nsec: int) -> None: ...
     def prep_close(
         self,
         user_data: int,
         fd: int,
+        fixed_file: bool = False,
     ) -> None: ...
     def prep_cancel(
         self, user_data: int, target_user_data: int, flags: int = 0
@@ -40,9 +61,24 @@ class Ring:
     def prep_read(
         self, user_data: int, fd: int, buf: bytearray, nbytes: int, offset: int
     ) -> None: ...
-    def prep_write(self, user_data: int, fd: int, buf: bytes, offset: int) -> None: ...
+    def prep_read_fixed(
+        self, user_data: int, fd: int, buf_index: int, nbytes: int, offset: int = 0
+    ) -> None: ...
+    def prep_write(self, user_data: int, fd: int, buf: Buffer, offset: int) -> None: ...
+    def prep_writev(
+        self, user_data: int, fd: int, bufs: list[Buffer], offset: int
+    ) -> None: ...
+    def prep_write_fixed(
+        self, user_data: int, fd: int, buf_index: int, nbytes: int, offset: int = 0
+    ) -> None: ...
     def prep_openat(
-        self, user_data: int, path: str, flags: int, mode: int, dir_fd: int
+        self,
+        user_data: int,
+        path: str,
+        flags: int,
+        mode: int,
+        dir_fd: int,
+        file_index: int | None = None,
     ) -> None: ...
     def prep_statx(
         self,
@@ -65,17 +101,39 @@ class Ring:
         self,
         user_data: int,
         fd: int,
+        level: int = ...,
+        optname: int = ...,
+        val: int = 1,
     ) -> None: ...
     def prep_socket_bind(
         self, user_data: int, fd: int, sock_addr: SockAddr
     ) -> None: ...
     def prep_socket_listen(self, user_data: int, fd: int, backlog: int) -> None: ...
     def prep_socket_accept(self, user_data: int, fd: int) -> None: ...
+    def prep_socket_accept_multishot(self, user_data: int, fd: int) -> None: ...
     def prep_socket_recv(
-        self, user_data: int, fd: int, buf: bytearray, flags: int = 0
+        self, user_data: int, fd: int, buf: bytearray, nbytes: int, flags: int = 0
+    ) -> None: ...
+    def prep_socket_recv_multishot(
+        self, user_data: int, fd: int, bgid: int
+    ) -> None: ...
+    def prep_provide_buffers(
+        self,
+        user_data: int,
+        buf: bytearray,
+        size: int,
+        nbufs: int,
+        bgid: int,
+        bid: int = 0,
     ) -> None: ...
     def prep_socket_send(
-        self, user_data: int, fd: int, buf: bytes, flags: int = 0
+        self, user_data: int, fd: int, buf: Buffer, flags: int = 0
+    ) -> None: ...
+    def prep_socket_send_zc(
+        self, user_data: int, fd: int, buf: Buffer, flags: int = 0
+    ) -> None: ...
+    def prep_socket_sendmsg(
+        self, user_data: int, fd: int, bufs: list[Buffer], flags: int = 0
     ) -> None: ...
     def prep_socket_connect(
         self, user_data: int, fd: int, sock_addr: SockAddr
@@ -159,6 +217,24 @@ TCP_NODELAY: int
 MSG_NOSIGNAL: int
 MSG_DONTWAIT: int
 
+# SQE flags
+IOSQE_FIXED_FILE: int
+IOSQE_IO_DRAIN: int
+IOSQE_IO_LINK: int
+IOSQE_IO_HARDLINK: int
+IOSQE_ASYNC: int
+IOSQE_BUFFER_SELECT: int
+IOSQE_CQE_SKIP_SUCCESS: int
+
+# Opcodes, for Ring.supports
+IORING_OP_SEND_ZC: int
+
+# CQE flags
+IORING_CQE_F_BUFFER: int
+IORING_CQE_F_MORE: int
+IORING_CQE_F_NOTIF: int
+IORING_CQE_BUFFER_SHIFT: int
+
 # Signals
 SIGINT: int
 SIGTERM: int
@@ -1,14 +1,31 @@
-use io_uring::{IoUring, opcode, types};
+use io_uring::{IoUring, Probe, opcode, squeue, types};
+use pyo3::buffer::PyBuffer;
 use pyo3::exceptions::{PyRuntimeError, PyValueError};
 use pyo3::prelude::*;
-use pyo3::types::{PyByteArray, PyBytes};
+use pyo3::types::PyByteArray;
 use std::collections::HashMap;
 use std::ffi::CString;
 use std::net::{Ipv4Addr, Ipv6Addr};
 use std::os::unix::io::RawFd;
 
+/// CQE flag set when the kernel picked a provided buffer for the request.
+const IORING_CQE_F_BUFFER: u32 = 1 << 0;
+
+/// CQE flag set while a multishot request stays armed and will post more CQEs.
+const IORING_CQE_F_MORE: u32 = 1 << 1;
+
+/// CQE flag marking the notification that a zero-copy send is done with its
+/// buffer. It follows the send's result CQE, which has `IORING_CQE_F_MORE` set.
+const IORING_CQE_F_NOTIF: u32 = 1 << 3;
+
+/// Shift of the provided buffer id in the CQE flags.
+const IORING_CQE_BUFFER_SHIFT: u32 = 16;
+
 /// A completed io_uring operation.
-#[pyclass(frozen)]
+///
+/// One is created per CQE, so instances are recycled through a freelist
+/// instead of going through the allocator each time.
+#[pyclass(frozen, freelist = 256)]
 #[derive(Clone, Debug)]
 struct CompletionEvent {
     #[pyo3(get)]
@@ -35,6 +52,31 @@ struct StatxRequest {
     statxbuf: Py<StatxBuffer>,
 }
 
+/// A `msghdr` for `sendmsg`, with the iovecs and buffers it points into.
+#[allow(dead_code)]
+struct MsgRequest {
+    bufs: Vec<PyBuffer<u8>>,
+    iovecs: Box<[libc::iovec]>,
+    msghdr: Box<libc::msghdr>,
+}
+
+// SAFETY: the raw pointers in `iovecs` and `msghdr` only point into heap
+// allocations owned by the same request, which are never mutated after prep.
+unsafe impl Send for MsgRequest {}
+unsafe impl Sync for MsgRequest {}
+
+/// The iovecs for a vectored write, with the buffers they point into.
+#[allow(dead_code)]
+struct IovecRequest {
+    bufs: Vec<PyBuffer<u8>>,
+    iovecs: Box<[libc::iovec]>,
+}
+
+// SAFETY: the raw pointers in `iovecs` only point into the buffers owned by
+// the same request, which hold their exports until the request is dropped.
+unsafe impl Send for IovecRequest {}
+unsafe impl Sync for IovecRequest {}
+
 /// Owns an io_uring instance and exposes prep/submit/complete operations.
 ///
 /// Usage from Python:
@@ -50,6 +92,22 @@ struct Ring {
     ring: Option<IoUring>,
     depth: u32,
 
+    /// CQ size, if not the kernel's default of twice the SQ depth.
+    cq_entries: Option<u32>,
+
+    /// Whether the ring is set up with a kernel SQ polling thread.
+    sqpoll: bool,
+
+    /// Milliseconds the SQ polling thread spins idle before sleeping.
+    sq_thread_idle: u32,
+
+    /// Whether to promise the kernel that only one thread submits to the ring.
+    single_issuer: bool,
+
+    /// Whether completions may wait for the next kernel entry instead of
+    /// interrupting the submitting thread.
+    coop_taskrun: bool,
+
     /// Buffers that are currently owned by the kernel (between submit and CQE).
     /// Keyed by `user_data` so they can be released when the CQE arrives.
     ///
@@ -58,25 +116,99 @@ struct Ring {
     /// TODO: Consolidate into 1.
     pinned_mutable_buffers: HashMap<u64, Py<PyByteArray>>,
 
-    pinned_immutable_buffers: HashMap<u64, Py<PyBytes>>,
+    /// Exports of any bytes-like object the kernel reads from (write/send).
+    pinned_immutable_buffers: HashMap<u64, PyBuffer<u8>>,
 
     /// CStrings for paths passed to openat.
     pinned_paths: HashMap<u64, CString>,
 
-    /// Timespecs for timeouts.
-    pinned_timespecs: HashMap<u64, types::Timespec>,
+    /// Timespecs for timeouts. Boxed for pointer stability across HashMap resizes.
+    pinned_timespecs: HashMap<u64, Box<types::Timespec>>,
+
+    /// Timespecs of completed timeouts, reused instead of allocating new ones.
+    timespec_pool: Vec<Box<types::Timespec>>,
 
-    /// Addresses for sockets.
-    pinned_sockaddr: HashMap<u64, SockAddrInner>,
+    /// Addresses for sockets. The Python objects are held rather than their
+    /// contents copied, which also keeps the address at a stable location.
+    pinned_sockaddr: HashMap<u64, Py<SockAddr>>,
 
     /// Socket option values. Boxed for pointer stability across HashMap resizes.
     pinned_sockopts: HashMap<u64, Box<i32>>,
 
     // Statx buffers
     pinned_statx_buffers: HashMap<u64, StatxRequest>,
+
+    /// Message headers (and their iovecs) for scatter sends.
+    pinned_msgs: HashMap<u64, MsgRequest>,
+
+    /// Iovecs for vectored writes.
+    pinned_iovecs: HashMap<u64, IovecRequest>,
+
+    /// Buffers registered with the kernel, indexed by their fixed buffer index.
+    /// Holding a buffer export keeps the bytearrays from being resized.
+    registered_buffers: Vec<PyBuffer<u8>>,
+
+    /// Memory handed to the kernel as provided buffers, keyed by buffer group.
+    /// The kernel may write into it at any time, so it stays pinned until the
+    /// ring is closed rather than being released per CQE.
+    provided_buffers: HashMap<u16, PyBuffer<u8>>,
+
+    /// IOSQE_* flags for the next pushed SQE, and the user_data it must have.
+    /// Taken by the next push either way, so flags meant for an SQE whose prep
+    /// failed are dropped rather than applied to an unrelated one.
+    next_sqe_flags: Option<(u64, squeue::Flags)>,
+
+    /// Whether the last pushed SQE links to the next one, i.e. a chain is open.
+    /// The SQ is never flushed while it is, as the kernel would end the chain
+    /// at the submit boundary and run the rest unlinked.
+    link_open: bool,
+}
+
+/// Pointer and length of a buffer the kernel will read from. The buffer must
+/// be contiguous, as the kernel reads it as a single range.
+fn readable_ptr_and_len(buf: &PyBuffer<u8>) -> PyResult<(*const u8, u32)> {
+    if !buf.is_c_contiguous() {
+        return Err(PyValueError::new_err("Buffer must be C-contiguous"));
+    }
+    Ok((buf.buf_ptr() as *const u8, buf.len_bytes() as u32))
+}
+
+/// One iovec per buffer, pointing into the buffers without copying. Each
+/// buffer must be contiguous, like for `readable_ptr_and_len`.
+fn readable_iovecs(bufs: &[PyBuffer<u8>]) -> PyResult<Box<[libc::iovec]>> {
+    bufs.iter()
+        .map(|buf| {
+            let (ptr, len) = readable_ptr_and_len(buf)?;
+            Ok(libc::iovec {
+                iov_base: ptr as *mut libc::c_void,
+                iov_len: len as usize,
+            })
+        })
+        .collect()
 }
 
 impl Ring {
+    /// Build the io_uring instance, with or without the optional setup flags.
+    fn build_ring(&self, optional_flags: bool) -> std::io::Result<IoUring> {
+        let mut builder = IoUring::builder();
+        if let Some(cq_entries) = self.cq_entries {
+            builder.setup_cqsize(cq_entries);
+        }
+        if self.sqpoll {
+            builder.setup_sqpoll(self.sq_thread_idle);
+        }
+        if optional_flags {
+            if self.single_issuer {
+                builder.setup_single_issuer();
+            }
+            // Cooperative task running only applies when this thread submits.
+            if self.coop_taskrun && !self.sqpoll {
+                builder.setup_coop_taskrun();
+            }
+        }
+        builder.build(self.depth)
+    }
+
     fn uring_mut(&mut self) -> PyResult<&mut IoUring> {
         self.ring
             .as_mut()
@@ -85,7 +217,25 @@ impl Ring {
 
     /// Push an entry onto the SQ. Panics if SQ is full.
     fn push_entry(&mut self, entry: io_uring::squeue::Entry) -> PyResult<()> {
+        let flags = match self.next_sqe_flags.take() {
+            Some((user_data, flags)) if user_data == entry.get_user_data() => flags,
+            _ => squeue::Flags::empty(),
+        };
+        let entry = entry.flags(flags);
+        let link_open = self.link_open;
         let ring = self.uring_mut()?;
+        // A full SQ is flushed to the kernel instead of failing the push, so a
+        // caller can prepare any number of entries between submits and still
+        // pay only one syscall per `depth` entries.
+        if ring.submission().is_full() {
+            if link_open {
+                return Err(PyRuntimeError::new_err(
+                    "Submission queue filled up within a linked chain (reserve room for it first)",
+                ));
+            }
+            ring.submit()
+                .map_err(|e| PyRuntimeError::new_err(format!("io_uring_submit failed: {e}")))?;
+        }
         // SAFETY: we trust that the caller has set up the entry correctly and
         // that any buffers referenced are pinned in `pinned_buffers`.
         unsafe {
@@ -93,6 +243,7 @@ impl Ring {
                 .push(&entry)
                 .map_err(|_| PyRuntimeError::new_err("Submission queue is full"))?;
         }
+        self.link_open = flags.intersects(squeue::Flags::IO_LINK | squeue::Flags::IO_HARDLINK);
         Ok(())
     }
 
@@ -102,43 +253,112 @@ impl Ring {
         self.pinned_immutable_buffers.remove(&user_data);
         self.pinned_paths.remove(&user_data);
         self.pinned_sockaddr.remove(&user_data);
-        self.pinned_timespecs.remove(&user_data);
+        if let Some(timespec) = self.pinned_timespecs.remove(&user_data) {
+            self.timespec_pool.push(timespec);
+        }
         self.pinned_sockopts.remove(&user_data);
         self.pinned_statx_buffers.remove(&user_data);
+        self.pinned_msgs.remove(&user_data);
+        self.pinned_iovecs.remove(&user_data);
     }
 
     fn cqe_to_event(&mut self, cqe: &io_uring::cqueue::Entry) -> CompletionEvent {
         let user_data = cqe.user_data();
-        self.release_pinned(user_data);
+        // A multishot request keeps using its resources until its final CQE.
+        if cqe.flags() & IORING_CQE_F_MORE == 0 {
+            self.release_pinned(user_data);
+        }
         CompletionEvent {
             user_data,
             res: cqe.result(),
             flags: cqe.flags(),
         }
     }
+
+    /// Returns the fixed buffer at `buf_index` and its usable length.
+    fn fixed_buffer(&self, buf_index: u16, nbytes: u32) -> PyResult<(*mut u8, u32)> {
+        let buf = self
+            .registered_buffers
+            .get(buf_index as usize)
+            .ok_or_else(|| {
+                PyValueError::new_err(format!("No fixed buffer at index {buf_index}"))
+            })?;
+        Ok((buf.buf_ptr().cast(), nbytes.min(buf.len_bytes() as u32)))
+    }
 }
 
 #[pymethods]
 impl Ring {
+    /// The pinned-resource maps are pre-sized to the SQ depth, so pinning a
+    /// resource for a steady-state number of in-flight operations never
+    /// reallocates on the submission path.
+    ///
+    /// With `sqpoll` the kernel polls the SQ from its own thread, and
+    /// `submit` only enters the kernel to wake that thread after it has gone
+    /// idle for `sq_thread_idle` milliseconds.
+    ///
+    /// `single_issuer` lets the kernel skip locking on submission, and only
+    /// holds if the ring is used from the thread that entered it.
+    /// `coop_taskrun` stops completions from interrupting the thread with
+    /// an IPI; they are processed on its next kernel entry instead, which an
+    /// event loop makes every iteration anyway. It is ignored with `sqpoll`.
+    /// Kernels predating either flag get a ring without both.
+    ///
+    /// `cq_entries` sizes the CQ independently of the SQ. Multishot and
+    /// batched operations post many more completions than submissions, and
+    /// a CQ with room for them all avoids the kernel's overflow path.
     #[new]
-    #[pyo3(signature = (depth = 32))]
-    fn new(depth: u32) -> Self {
+    #[pyo3(signature = (
+        depth = 32,
+        cq_entries = None,
+        sqpoll = false,
+        sq_thread_idle = 1000,
+        single_issuer = true,
+        coop_taskrun = true
+    ))]
+    fn new(
+        depth: u32,
+        cq_entries: Option<u32>,
+        sqpoll: bool,
+        sq_thread_idle: u32,
+        single_issuer: bool,
+        coop_taskrun: bool,
+    ) -> Self {
+        let capacity = depth as usize;
         Ring {
             ring: None,
             depth,
-            pinned_mutable_buffers: HashMap::new(),
-            pinned_immutable_buffers: HashMap::new(),
-            pinned_paths: HashMap::new(),
-            pinned_timespecs: HashMap::new(),
-            pinned_sockaddr: HashMap::new(),
-            pinned_sockopts: HashMap::new(),
-            pinned_statx_buffers: HashMap::new(),
+            cq_entries,
+            sqpoll,
+            sq_thread_idle,
+            single_issuer,
+            coop_taskrun,
+            pinned_mutable_buffers: HashMap::with_capacity(capacity),
+            pinned_immutable_buffers: HashMap::with_capacity(capacity),
+            pinned_paths: HashMap::with_capacity(capacity),
+            pinned_timespecs: HashMap::with_capacity(capacity),
+            timespec_pool: Vec::new(),
+            pinned_sockaddr: HashMap::with_capacity(capacity),
+            pinned_sockopts: HashMap::with_capacity(capacity),
+            pinned_statx_buffers: HashMap::with_capacity(capacity),
+            pinned_msgs: HashMap::with_capacity(capacity),
+            pinned_iovecs: HashMap::with_capacity(capacity),
+            registered_buffers: Vec::new(),
+            provided_buffers: HashMap::new(),
+            next_sqe_flags: None,
+            link_open: false,
         }
     }
 
     /// Python CM protocol.
     fn __enter__(mut slf: PyRefMut<'_, Self>) -> PyResult<PyRefMut<'_, Self>> {
-        let ring = IoUring::new(slf.depth)
+        let ring = slf
+            .build_ring(true)
+            .or_else(|e| match e.raw_os_error() {
+                // Unknown setup flags are rejected as invalid by older kernels.
+                Some(libc::EINVAL) => slf.build_ring(false),
+                _ => Err(e),
+            })
             .map_err(|e| PyRuntimeError::new_err(format!("io_uring_setup failed: {e}")))?;
         slf.ring = Some(ring);
         Ok(slf)
@@ -158,15 +378,31 @@ impl Ring {
         self.pinned_timespecs.clear();
         self.pinned_sockopts.clear();
         self.pinned_statx_buffers.clear();
+        self.pinned_msgs.clear();
+        self.pinned_iovecs.clear();
         self.ring = None; // Drop triggers internal io_uring cleanup
+        self.registered_buffers.clear();
+        self.provided_buffers.clear();
         Ok(false)
     }
 
     /// Submit all queued SQEs to the kernel. Returns number submitted.
-    fn submit(&mut self) -> PyResult<u32> {
-        let n = self
-            .uring_mut()?
-            .submit()
+    ///
+    /// Prepare a batch of entries first and submit once, so the batch costs a
+    /// single syscall. Preparing more than `depth` entries is fine: the SQ is
+    /// flushed whenever it fills up, and the count returned only covers the
+    /// entries not already flushed. Linked chains are the exception, see
+    /// `reserve`.
+    ///
+    /// Under SQPOLL this is a syscall only when the polling thread needs a
+    /// wakeup; otherwise publishing the SQ tail is enough.
+    ///
+    /// The GIL is released for the syscall, as the kernel may complete work
+    /// inline while submitting, like reads served from the page cache.
+    fn submit(&mut self, py: Python<'_>) -> PyResult<u32> {
+        let ring = self.uring_mut()?;
+        let n = py
+            .detach(|| ring.submit())
             .map_err(|e| PyRuntimeError::new_err(format!("io_uring_submit failed: {e}")))?;
         Ok(n as u32)
     }
@@ -182,6 +418,17 @@ impl Ring {
         }
     }
 
+    /// Non-blocking peek of up to `max_events` CQEs.
+    ///
+    /// Drains the CQ in a single pass and advances its head once for the
+    /// whole batch, instead of once per `peek` call.
+    #[pyo3(signature = (max_events = 64))]
+    fn peek_batch(&mut self, max_events: usize) -> PyResult<Vec<CompletionEvent>> {
+        let ring = self.uring_mut()?;
+        let cqes: Vec<io_uring::cqueue::Entry> = ring.completion().take(max_events).collect();
+        Ok(cqes.iter().map(|cqe| self.cqe_to_event(cqe)).collect())
+    }
+
     /// Blocking wait for at least one CQE and return it.
     fn wait(&mut self, py: Python<'_>) -> PyResult<CompletionEvent> {
         let ring = self.uring_mut()?;
@@ -194,6 +441,162 @@ impl Ring {
         Ok(self.cqe_to_event(&cqe))
     }
 
+    /// Register `bufs` with the kernel as fixed buffers, so their pages are
+    /// pinned once instead of on every operation. Buffers are addressed by
+    /// their index in `bufs`, and can't be resized while registered.
+    ///
+    /// Any writable, contiguous buffer is accepted, so the buffers can be
+    /// memoryview slices of a single allocation.
+    fn register_buffers(&mut self, bufs: Vec<Bound<'_, PyAny>>) -> PyResult<()> {
+        let buffers = bufs
+            .iter()
+            .map(|buf| {
+                let buffer = PyBuffer::<u8>::get(buf)?;
+                if buffer.readonly() || !buffer.is_c_contiguous() {
+                    return Err(PyValueError::new_err(
+                        "Fixed buffers must be writable and contiguous",
+                    ));
+                }
+                Ok(buffer)
+            })
+            .collect::<PyResult<Vec<_>>>()?;
+        let iovecs: Vec<libc::iovec> = buffers
+            .iter()
+            .map(|buf| libc::iovec {
+                iov_base: buf.buf_ptr(),
+                iov_len: buf.len_bytes(),
+            })
+            .collect();
+
+        let ring = self.uring_mut()?;
+        // SAFETY: the buffers stay alive and un-resized while registered, as
+        // `registered_buffers` holds an export of each of them.
+        unsafe { ring.submitter().register_buffers(&iovecs) }.map_err(|e| {
+            PyRuntimeError::new_err(format!("io_uring_register_buffers failed: {e}"))
+        })?;
+        self.registered_buffers = buffers;
+        Ok(())
+    }
+
+    /// Unregister all fixed buffers, releasing them back to Python.
+    fn unregister_buffers(&mut self) -> PyResult<()> {
+        self.uring_mut()?
+            .submitter()
+            .unregister_buffers()
+            .map_err(|e| {
+                PyRuntimeError::new_err(format!("io_uring_unregister_buffers failed: {e}"))
+            })?;
+        self.registered_buffers.clear();
+        Ok(())
+    }
+
+    /// Set IOSQE_* flags (e.g. `IOSQE_FIXED_FILE`) for the next prepared SQE,
+    /// which must be prepared with `user_data`.
+    ///
+    /// Flags set by several calls for the same `user_data` before the SQE is
+    /// prepared are combined, so a caller can link an operation that sets
+    /// flags of its own. If the prep fails, the flags are dropped by the next
+    /// SQE prepared, as its `user_data` differs.
+    fn set_sqe_flags(&mut self, user_data: u64, flags: u8) -> PyResult<()> {
+        let flags = squeue::Flags::from_bits(flags)
+            .ok_or_else(|| PyValueError::new_err(format!("Invalid SQE flags: {flags:#x}")))?;
+        self.next_sqe_flags = Some(match self.next_sqe_flags {
+            Some((pending, pending_flags)) if pending == user_data => {
+                (user_data, pending_flags | flags)
+            }
+            _ => (user_data, flags),
+        });
+        Ok(())
+    }
+
+    /// Make room in the SQ for `entries` more SQEs, flushing it first if needed.
+    ///
+    /// Call before preparing a linked chain of `entries` SQEs, so the SQ never
+    /// fills up within the chain. A flush there would split the chain across
+    /// two submits, and the kernel would run its second half unlinked.
+    fn reserve(&mut self, entries: u32) -> PyResult<()> {
+        let link_open = self.link_open;
+        let ring = self.uring_mut()?;
+        let (capacity, len) = {
+            let sq = ring.submission();
+            (sq.capacity(), sq.len())
+        };
+        if entries as usize > capacity {
+            return Err(PyValueError::new_err(format!(
+                "{entries} entries don't fit a submission queue of {capacity}"
+            )));
+        }
+        if capacity - len < entries as usize {
+            if link_open {
+                return Err(PyRuntimeError::new_err(
+                    "No room left for the rest of an open linked chain",
+                ));
+            }
+            ring.submit()
+                .map_err(|e| PyRuntimeError::new_err(format!("io_uring_submit failed: {e}")))?;
+        }
+        Ok(())
+    }
+
+    /// End an open linked chain, for when a prep within it failed. Returns
+    /// whether a chain was open.
+    ///
+    /// The SQEs already pushed can't be taken back, so the chain is ended with
+    /// a no-op under `user_data` instead. Its CQE has a result of 0, or
+    /// -ECANCELED when an earlier link in the chain failed.
+    fn end_link(&mut self, user_data: u64) -> PyResult<bool> {
+        self.next_sqe_flags = None;
+        if !self.link_open {
+            return Ok(false);
+        }
+        self.push_entry(opcode::Nop::new().build().user_data(user_data))?;
+        Ok(true)
+    }
+
+    /// Whether the kernel supports the opcode `code`, e.g. `IORING_OP_SEND_ZC`.
+    ///
+    /// Asks the kernel with IORING_REGISTER_PROBE, which costs a syscall, so
+    /// ask once and keep the answer. Kernels too old to probe (before 5.6)
+    /// support none of the opcodes worth asking about.
+    fn supports(&mut self, code: u8) -> PyResult<bool> {
+        let mut probe = Probe::new();
+        Ok(self
+            .uring_mut()?
+            .submitter()
+            .register_probe(&mut probe)
+            .is_ok()
+            && probe.is_supported(code))
+    }
+
+    /// Register `fds` with the kernel as fixed files, addressed by their index
+    /// in `fds` when `IOSQE_FIXED_FILE` is set. A fd of -1 leaves its slot
+    /// empty, to be filled later with `register_files_update`.
+    fn register_files(&mut self, fds: Vec<RawFd>) -> PyResult<()> {
+        self.uring_mut()?
+            .submitter()
+            .register_files(&fds)
+            .map_err(|e| PyRuntimeError::new_err(format!("io_uring_register_files failed: {e}")))
+    }
+
+    /// Replace the fixed files starting at slot `offset`. Returns the number
+    /// of slots updated.
+    fn register_files_update(&mut self, offset: u32, fds: Vec<RawFd>) -> PyResult<usize> {
+        self.uring_mut()?
+            .submitter()
+            .register_files_update(offset, &fds)
+            .map_err(|e| {
+                PyRuntimeError::new_err(format!("io_uring_register_files_update failed: {e}"))
+            })
+    }
+
+    /// Unregister all fixed files.
+    fn unregister_files(&mut self) -> PyResult<()> {
+        self.uring_mut()?
+            .submitter()
+            .unregister_files()
+            .map_err(|e| PyRuntimeError::new_err(format!("io_uring_unregister_files failed: {e}")))
+    }
+
     /// Submit a no-op.
     fn prep_nop(&mut self, user_data: u64) -> PyResult<()> {
         let entry = opcode::Nop::new().build().user_data(user_data);
@@ -202,9 +605,13 @@ impl Ring {
 
     /// Submit a timeout (sleep).
     fn prep_timeout(&mut self, user_data: u64, sec: u64, nsec: u32) -> PyResult<()> {
-        let timespec = types::Timespec::new().sec(sec).nsec(nsec);
+        let mut timespec = self
+            .timespec_pool
+            .pop()
+            .unwrap_or_else(|| Box::new(types::Timespec::new()));
+        *timespec = types::Timespec::new().sec(sec).nsec(nsec);
+        let ts: *const types::Timespec = &*timespec;
         self.pinned_timespecs.insert(user_data, timespec);
-        let ts = self.pinned_timespecs.get(&user_data).unwrap();
 
         let entry = opcode::Timeout::new(ts).build().user_data(user_data);
 
@@ -236,6 +643,43 @@ impl Ring {
         self.push_entry(entry)
     }
 
+    /// Prep a read into the registered fixed buffer at `buf_index`.
+    /// Works on regular files as well as sockets.
+    #[pyo3(signature = (user_data, fd, buf_index, nbytes, offset = 0))]
+    fn prep_read_fixed(
+        &mut self,
+        user_data: u64,
+        fd: RawFd,
+        buf_index: u16,
+        nbytes: u32,
+        offset: u64,
+    ) -> PyResult<()> {
+        let (ptr, len) = self.fixed_buffer(buf_index, nbytes)?;
+        let entry = opcode::ReadFixed::new(types::Fd(fd), ptr, len, buf_index)
+            .offset(offset)
+            .build()
+            .user_data(user_data);
+        self.push_entry(entry)
+    }
+
+    /// Prep a write of `nbytes` from the registered fixed buffer at `buf_index`.
+    #[pyo3(signature = (user_data, fd, buf_index, nbytes, offset = 0))]
+    fn prep_write_fixed(
+        &mut self,
+        user_data: u64,
+        fd: RawFd,
+        buf_index: u16,
+        nbytes: u32,
+        offset: u64,
+    ) -> PyResult<()> {
+        let (ptr, len) = self.fixed_buffer(buf_index, nbytes)?;
+        let entry = opcode::WriteFixed::new(types::Fd(fd), ptr.cast_const(), len, buf_index)
+            .offset(offset)
+            .build()
+            .user_data(user_data);
+        self.push_entry(entry)
+    }
+
     // Prepares statx for metadata extraction.
     fn prep_statx(
         &mut self,
@@ -278,25 +722,50 @@ impl Ring {
         _py: Python<'_>,
         user_data: u64,
         fd: RawFd,
-        buf: Bound<'_, PyBytes>,
+        buf: PyBuffer<u8>,
         offset: u64,
     ) -> PyResult<()> {
-        let data = buf.as_bytes();
-        let ptr = data.as_ptr();
-        let len = data.len() as u32;
+        let (ptr, len) = readable_ptr_and_len(&buf)?;
 
-        let entry = opcode::Write::new(types::Fd(fd), ptr.cast(), len)
+        let entry = opcode::Write::new(types::Fd(fd), ptr, len)
             .offset(offset)
             .build()
             .user_data(user_data);
 
-        self.pinned_immutable_buffers
-            .insert(user_data, buf.unbind());
+        self.pinned_immutable_buffers.insert(user_data, buf);
+        self.push_entry(entry)
+    }
+
+    /// Prep a vectored file write of several buffers, written in order
+    /// without being concatenated first. Any contiguous bytes-like object
+    /// works, like for `prep_write`.
+    #[pyo3(signature = (user_data, fd, bufs, offset))]
+    fn prep_writev(
+        &mut self,
+        _py: Python<'_>,
+        user_data: u64,
+        fd: RawFd,
+        bufs: Vec<PyBuffer<u8>>,
+        offset: u64,
+    ) -> PyResult<()> {
+        let iovecs = readable_iovecs(&bufs)?;
+
+        let entry = opcode::Writev::new(types::Fd(fd), iovecs.as_ptr(), iovecs.len() as u32)
+            .offset(offset)
+            .build()
+            .user_data(user_data);
+
+        self.pinned_iovecs
+            .insert(user_data, IovecRequest { bufs, iovecs });
         self.push_entry(entry)
     }
 
     /// Prep a file open.
-    #[pyo3(signature = (user_data, path, flags, mode, dir_fd))]
+    ///
+    /// With `file_index`, the opened file is installed straight into that
+    /// slot of the registered files instead of the process fd table, and
+    /// the CQE result is 0 on success.
+    #[pyo3(signature = (user_data, path, flags, mode, dir_fd, file_index = None))]
     fn prep_openat(
         &mut self,
         user_data: u64,
@@ -304,14 +773,22 @@ impl Ring {
         flags: i32,
         mode: u32,
         dir_fd: RawFd,
+        file_index: Option<u32>,
     ) -> PyResult<()> {
         let c_path =
             CString::new(path).map_err(|_| PyRuntimeError::new_err("Path contains null byte"))?;
         let ptr = c_path.as_ptr();
 
+        let file_index = file_index
+            .map(|index| {
+                types::DestinationSlot::try_from_slot_target(index)
+                    .map_err(|_| PyValueError::new_err(format!("Invalid file index: {index}")))
+            })
+            .transpose()?;
         let entry = opcode::OpenAt::new(types::Fd(dir_fd), ptr)
             .flags(flags)
             .mode(mode)
+            .file_index(file_index)
             .build()
             .user_data(user_data);
 
@@ -321,11 +798,18 @@ impl Ring {
     }
 
     /// Prep a file/socket close.
-    fn prep_close(&mut self, user_data: u64, fd: RawFd) -> PyResult<()> {
-        let entry = opcode::Close::new(types::Fd(fd))
-            .build()
-            .user_data(user_data);
-        self.push_entry(entry)
+    ///
+    /// With `fixed_file`, `fd` is a slot of the registered files, which is
+    /// emptied. Unlike other operations, this isn't done with
+    /// `IOSQE_FIXED_FILE`.
+    #[pyo3(signature = (user_data, fd, fixed_file = false))]
+    fn prep_close(&mut self, user_data: u64, fd: RawFd, fixed_file: bool) -> PyResult<()> {
+        let entry = if fixed_file {
+            opcode::Close::new(types::Fixed(fd as u32))
+        } else {
+            opcode::Close::new(types::Fd(fd))
+        };
+        self.push_entry(entry.build().user_data(user_data))
     }
 
     /// Prep a cancellation of another in-flight operation.
@@ -356,18 +840,21 @@ impl Ring {
         self.push_entry(entry)
     }
 
-    /// Prep a recv from a connected socket into `buf`.
-    #[pyo3(signature = (user_data, fd, buf, flags = 0))]
+    /// Prep a recv of at most `nbytes` from a connected socket into `buf`.
+    /// The `buf` is pinned until the CQE is consumed, so callers can reuse
+    /// one buffer across receives.
+    #[pyo3(signature = (user_data, fd, buf, nbytes, flags = 0))]
     fn prep_socket_recv(
         &mut self,
         _py: Python<'_>,
         user_data: u64,
         fd: RawFd,
         buf: Bound<'_, PyByteArray>,
+        nbytes: u32,
         flags: u32,
     ) -> PyResult<()> {
         let ptr = buf.data();
-        let len = buf.len() as u32;
+        let len = nbytes.min(buf.len() as u32);
 
         let entry = opcode::Recv::new(types::Fd(fd), ptr.cast(), len)
             .flags(flags as i32)
@@ -378,6 +865,59 @@ impl Ring {
         self.push_entry(entry)
     }
 
+    /// Prepares a multishot recv. The kernel picks a buffer from group `bgid`
+    /// for each arriving message, and reports its id in the CQE flags.
+    fn prep_socket_recv_multishot(
+        &mut self,
+        _py: Python<'_>,
+        user_data: u64,
+        fd: RawFd,
+        bgid: u16,
+    ) -> PyResult<()> {
+        let entry = opcode::RecvMulti::new(types::Fd(fd), bgid)
+            .build()
+            .flags(squeue::Flags::BUFFER_SELECT)
+            .user_data(user_data);
+
+        self.push_entry(entry)
+    }
+
+    /// Hands `nbufs` buffers of `size` bytes to the kernel as buffer group
+    /// `bgid`, starting with buffer id `bid`. `buf` is split into consecutive
+    /// `size` byte buffers, buffer id `i` starting at offset `i * size`.
+    ///
+    /// Also used to give a consumed buffer back, with `nbufs=1`.
+    #[pyo3(signature = (user_data, buf, size, nbufs, bgid, bid = 0))]
+    fn prep_provide_buffers(
+        &mut self,
+        user_data: u64,
+        buf: Bound<'_, PyByteArray>,
+        size: u32,
+        nbufs: u16,
+        bgid: u16,
+        bid: u16,
+    ) -> PyResult<()> {
+        let export = PyBuffer::<u8>::get(buf.as_any())?;
+        let start = bid as usize * size as usize;
+        let end = start + nbufs as usize * size as usize;
+        if end > export.len_bytes() {
+            return Err(PyValueError::new_err(format!(
+                "Buffers {bid}..{} of {size} bytes exceed buffer length {}",
+                bid as usize + nbufs as usize,
+                export.len_bytes()
+            )));
+        }
+        // SAFETY: in bounds, as checked above.
+        let ptr = unsafe { export.buf_ptr().cast::<u8>().add(start) };
+
+        let entry = opcode::ProvideBuffers::new(ptr, size as i32, nbufs, bgid, bid)
+            .build()
+            .user_data(user_data);
+
+        self.provided_buffers.insert(bgid, export);
+        self.push_entry(entry)
+    }
+
     /// Prep a send to a connected socket.
     #[pyo3(signature = (user_data, fd, buf, flags = 0))]
     fn prep_socket_send(
@@ -385,20 +925,77 @@ impl Ring {
         _py: Python<'_>,
         user_data: u64,
         fd: RawFd,
-        buf: Bound<'_, PyBytes>,
+        buf: PyBuffer<u8>,
+        flags: u32,
+    ) -> PyResult<()> {
+        let (ptr, len) = readable_ptr_and_len(&buf)?;
+
+        let entry = opcode::Send::new(types::Fd(fd), ptr, len)
+            .flags(flags as i32)
+            .build()
+            .user_data(user_data);
+
+        self.pinned_immutable_buffers.insert(user_data, buf);
+        self.push_entry(entry)
+    }
+
+    /// Prep a zero-copy send to a connected socket.
+    ///
+    /// The kernel sends straight from `buf` instead of copying it first. The
+    /// result CQE has `IORING_CQE_F_MORE` set, and `buf` stays pinned until a
+    /// second, `IORING_CQE_F_NOTIF` CQE says the kernel is done with it.
+    #[pyo3(signature = (user_data, fd, buf, flags = 0))]
+    fn prep_socket_send_zc(
+        &mut self,
+        _py: Python<'_>,
+        user_data: u64,
+        fd: RawFd,
+        buf: PyBuffer<u8>,
         flags: u32,
     ) -> PyResult<()> {
-        let data = buf.as_bytes();
-        let ptr = data.as_ptr();
-        let len = data.len() as u32;
+        let (ptr, len) = readable_ptr_and_len(&buf)?;
 
-        let entry = opcode::Send::new(types::Fd(fd), ptr.cast(), len)
+        let entry = opcode::SendZc::new(types::Fd(fd), ptr, len)
             .flags(flags as i32)
             .build()
             .user_data(user_data);
 
-        self.pinned_immutable_buffers
-            .insert(user_data, buf.unbind());
+        self.pinned_immutable_buffers.insert(user_data, buf);
+        self.push_entry(entry)
+    }
+
+    /// Prep a scatter send of several buffers to a connected socket.
+    /// The buffers go to the kernel as one iovec each, so they are sent in
+    /// order without being concatenated first. Any contiguous bytes-like
+    /// object works, like for `prep_socket_send`.
+    #[pyo3(signature = (user_data, fd, bufs, flags = 0))]
+    fn prep_socket_sendmsg(
+        &mut self,
+        _py: Python<'_>,
+        user_data: u64,
+        fd: RawFd,
+        bufs: Vec<PyBuffer<u8>>,
+        flags: u32,
+    ) -> PyResult<()> {
+        let iovecs = readable_iovecs(&bufs)?;
+
+        let mut msghdr: Box<libc::msghdr> = Box::new(unsafe { std::mem::zeroed() });
+        msghdr.msg_iov = iovecs.as_ptr() as *mut libc::iovec;
+        msghdr.msg_iovlen = iovecs.len() as _;
+
+        let entry = opcode::SendMsg::new(types::Fd(fd), &*msghdr as *const libc::msghdr)
+            .flags(flags)
+            .build()
+            .user_data(user_data);
+
+        self.pinned_msgs.insert(
+            user_data,
+            MsgRequest {
+                bufs,
+                iovecs,
+                msghdr,
+            },
+        );
         self.push_entry(entry)
     }
 
@@ -408,12 +1005,10 @@ impl Ring {
         _py: Python<'_>,
         user_data: u64,
         fd: RawFd,
-        sock_addr: SockAddr,
+        sock_addr: Bound<'_, SockAddr>,
     ) -> PyResult<()> {
-        self.pinned_sockaddr.insert(user_data, sock_addr.inner);
-
-        let stored = self.pinned_sockaddr.get(&user_data).unwrap();
-        let (ptr, len) = stored.as_ptr_and_len();
+        let (ptr, len) = sock_addr.get().inner.as_ptr_and_len();
+        self.pinned_sockaddr.insert(user_data, sock_addr.unbind());
 
         let entry = opcode::Bind::new(types::Fd(fd), ptr, len)
             .build()
@@ -447,18 +1042,31 @@ impl Ring {
         self.push_entry(entry)
     }
 
+    /// Prepares a multishot accept. The single SQE posts one CQE per accepted
+    /// connection, with `IORING_CQE_F_MORE` set for as long as it stays armed.
+    fn prep_socket_accept_multishot(
+        &mut self,
+        _py: Python<'_>,
+        user_data: u64,
+        fd: RawFd,
+    ) -> PyResult<()> {
+        let entry = opcode::AcceptMulti::new(types::Fd(fd))
+            .build()
+            .user_data(user_data);
+
+        self.push_entry(entry)
+    }
+
     /// Connects to a socket from a client.
     fn prep_socket_connect(
         &mut self,
         _py: Python<'_>,
         user_data: u64,
         fd: RawFd,
-        sock_addr: SockAddr,
+        sock_addr: Bound<'_, SockAddr>,
     ) -> PyResult<()> {
-        self.pinned_sockaddr.insert(user_data, sock_addr.inner);
-
-        let stored = self.pinned_sockaddr.get(&user_data).unwrap();
-        let (ptr, len) = stored.as_ptr_and_len();
+        let (ptr, len) = sock_addr.get().inner.as_ptr_and_len();
+        self.pinned_sockaddr.insert(user_data, sock_addr.unbind());
 
         let entry = opcode::Connect::new(types::Fd(fd), ptr, len)
             .build()
@@ -467,17 +1075,29 @@ impl Ring {
         self.push_entry(entry)
     }
 
-    /// Set socket options.
-    fn prep_socket_setopt(&mut self, user_data: u64, fd: RawFd) -> PyResult<()> {
-        // TODO: Hardcoded for now.
-        let optval = Box::new(1i32); // SO_REUSEADDR value
-        self.pinned_sockopts.insert(user_data, optval);
+    /// Set an integer socket option, e.g. SO_REUSEADDR or TCP_NODELAY.
+    #[pyo3(signature = (
+        user_data,
+        fd,
+        level = libc::SOL_SOCKET,
+        optname = libc::SO_REUSEADDR,
+        val = 1
+    ))]
+    fn prep_socket_setopt(
+        &mut self,
+        user_data: u64,
+        fd: RawFd,
+        level: i32,
+        optname: i32,
+        val: i32,
+    ) -> PyResult<()> {
+        self.pinned_sockopts.insert(user_data, Box::new(val));
         let pinned = self.pinned_sockopts.get(&user_data).unwrap();
 
         let entry = opcode::SetSockOpt::new(
             types::Fd(fd),
-            libc::SOL_SOCKET as u32,
-            libc::SO_REUSEADDR as u32,
+            level as u32,
+            optname as u32,
             pinned.as_ref() as *const i32 as *const libc::c_void,
             std::mem::size_of::<i32>() as u32,
         )
@@ -511,8 +1131,9 @@ impl SockAddrInner {
     }
 }
 
-#[pyclass]
-#[derive(Clone)]
+/// An immutable socket address. Frozen, so borrowing it when passed to a
+/// `prep_*` method needs no runtime borrow-flag bookkeeping.
+#[pyclass(frozen)]
 struct SockAddr {
     inner: SockAddrInner,
 }
@@ -654,6 +1275,24 @@ fn register_constants(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add("MSG_NOSIGNAL", libc::MSG_NOSIGNAL)?;
     m.add("MSG_DONTWAIT", libc::MSG_DONTWAIT)?;
 
+    // SQE flags
+    m.add("IOSQE_FIXED_FILE", squeue::Flags::FIXED_FILE.bits())?;
+    m.add("IOSQE_IO_DRAIN", squeue::Flags::IO_DRAIN.bits())?;
+    m.add("IOSQE_IO_LINK", squeue::Flags::IO_LINK.bits())?;
+    m.add("IOSQE_IO_HARDLINK", squeue::Flags::IO_HARDLINK.bits())?;
+    m.add("IOSQE_ASYNC", squeue::Flags::ASYNC.bits())?;
+    m.add("IOSQE_BUFFER_SELECT", squeue::Flags::BUFFER_SELECT.bits())?;
+    m.add("IOSQE_CQE_SKIP_SUCCESS", squeue::Flags::SKIP_SUCCESS.bits())?;
+
+    // Opcodes, for Ring.supports
+    m.add("IORING_OP_SEND_ZC", opcode::SendZc::CODE)?;
+
+    // CQE flags
+    m.add("IORING_CQE_F_BUFFER", IORING_CQE_F_BUFFER)?;
+    m.add("IORING_CQE_F_MORE", IORING_CQE_F_MORE)?;
+    m.add("IORING_CQE_F_NOTIF", IORING_CQE_F_NOTIF)?;
+    m.add("IORING_CQE_BUFFER_SHIFT", IORING_CQE_BUFFER_SHIFT)?;
+
     // Signals
     m.add("SIGINT", libc::SIGINT)?;
     m.add("SIGTERM", libc::SIGTERM)?;
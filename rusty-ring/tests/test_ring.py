@@ -1,10 +1,21 @@
+import errno
+import os
+import socket
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
+import pytest
+
 from one_ring_loop.log import get_logger
-from rusty_ring import Ring
+from rusty_ring import (
+    IORING_CQE_F_MORE,
+    IORING_OP_SEND_ZC,
+    IOSQE_FIXED_FILE,
+    IOSQE_IO_LINK,
+    Ring,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -44,6 +55,172 @@ class TestRing:
             logger.info("Got read event", io_event=read_event)
             assert bytes(read_buf) == file_content
 
+    def test_fixed_buffers(self, tmp_file_path: Path) -> None:
+        file_content = b"Hello! :)"
+        buffers = [bytearray(file_content), bytearray(16)]
+
+        with Ring(32) as ring, tmp_file_path.open("w+b") as file:
+            ring.register_buffers(buffers)
+
+            ring.prep_write_fixed(0, file.fileno(), buf_index=0, nbytes=9)
+            ring.submit()
+            assert ring.wait().res == len(file_content)
+
+            ring.prep_read_fixed(0, file.fileno(), buf_index=1, nbytes=9)
+            ring.submit()
+            assert ring.wait().res == len(file_content)
+            assert buffers[1][:9] == file_content
+
+            ring.unregister_buffers()
+
+    def test_failed_prep_drops_sqe_flags(self) -> None:
+        left, right = socket.socketpair()
+        with left, right, Ring(32) as ring:
+            # Fails in the prep itself, as no fixed buffer is registered.
+            ring.set_sqe_flags(0, IOSQE_FIXED_FILE)
+            with pytest.raises(ValueError, match="No fixed buffer"):
+                ring.prep_write_fixed(0, left.fileno(), buf_index=0, nbytes=1)
+            # Fails converting the arguments, before the prep runs.
+            ring.set_sqe_flags(1, IOSQE_FIXED_FILE)
+            with pytest.raises(TypeError):
+                ring.prep_socket_send(1, left.fileno(), "not a buffer")
+
+            # FIXED_FILE would make the fd an index into the (empty) file table.
+            ring.prep_socket_send(2, left.fileno(), b"hello")
+            ring.submit()
+            event = ring.wait()
+
+            assert event.user_data == 2
+            assert event.res == len(b"hello")
+            assert right.recv(1024) == b"hello"
+
+    def test_peek_batch(self) -> None:
+        with Ring(32) as ring:
+            for user_data in range(5):
+                ring.prep_nop(user_data)
+            ring.submit()
+            ring.wait()
+
+            events = ring.peek_batch(max_events=3)
+            events += ring.peek_batch()
+
+            assert sorted(event.user_data for event in events) == [1, 2, 3, 4]
+            assert ring.peek_batch() == []
+
+    def test_sqpoll(self) -> None:
+        with Ring(32, sqpoll=True) as ring:
+            ring.prep_nop(7)
+            ring.submit()
+            event = ring.wait()
+            assert event.user_data == 7
+
+    def test_without_optional_setup_flags(self) -> None:
+        with Ring(32, single_issuer=False, coop_taskrun=False) as ring:
+            ring.prep_nop(7)
+            ring.submit()
+            event = ring.wait()
+            assert event.user_data == 7
+
+    def test_cq_larger_than_sq(self) -> None:
+        with Ring(4, cq_entries=64) as ring:
+            for user_data in range(16):
+                ring.prep_nop(user_data)
+            ring.submit()
+            ring.wait()
+
+            events = ring.peek_batch()
+            assert len(events) == 15
+
+    def test_socket_sendmsg(self) -> None:
+        left, right = socket.socketpair()
+        with left, right, Ring(32) as ring:
+            ring.prep_socket_sendmsg(0, left.fileno(), [b"Hello, ", b"world!"])
+            ring.submit()
+            event = ring.wait()
+
+            assert event.res == len(b"Hello, world!")
+            assert right.recv(1024) == b"Hello, world!"
+
+    def test_socket_send_memoryview(self) -> None:
+        left, right = socket.socketpair()
+        data = memoryview(bytearray(b"Hello, world!"))[7:]
+        with left, right, Ring(32) as ring:
+            ring.prep_socket_send(0, left.fileno(), data)
+            ring.submit()
+            event = ring.wait()
+
+            assert event.res == len(b"world!")
+            assert right.recv(1024) == b"world!"
+
+    def test_socket_accept_multishot(self) -> None:
+        with (
+            socket.create_server(("127.0.0.1", 0)) as server,
+            Ring(32) as ring,
+        ):
+            ring.prep_socket_accept_multishot(0, server.fileno())
+            ring.submit()
+
+            port = server.getsockname()[1]
+            clients = [socket.create_connection(("127.0.0.1", port)) for _ in range(2)]
+            events = [ring.wait(), ring.wait()]
+
+            for event in events:
+                assert event.res >= 0
+                assert event.flags & IORING_CQE_F_MORE
+                os.close(event.res)
+            for client in clients:
+                client.close()
+
+    def test_prep_beyond_depth_flushes(self) -> None:
+        with Ring(4) as ring:
+            for user_data in range(6):
+                ring.prep_timeout(user_data, sec=0, nsec=0)
+            ring.submit()
+
+            assert sorted(ring.wait().user_data for _ in range(6)) == list(range(6))
+
+    def test_reserve_keeps_linked_chain_whole(self) -> None:
+        with Ring(4) as ring:
+            for user_data in range(3):
+                ring.prep_nop(user_data)
+            with pytest.raises(ValueError, match="don't fit"):
+                ring.reserve(5)
+            # Flushes the three nops, as the chain won't fit next to them.
+            ring.reserve(2)
+            ring.set_sqe_flags(3, IOSQE_IO_LINK)
+            ring.prep_timeout(3, sec=0, nsec=0)
+            ring.prep_nop(4)
+
+            assert ring.submit() == 2
+            events = {}
+            for _ in range(5):
+                event = ring.wait()
+                events[event.user_data] = event.res
+            # The expired timeout fails, so the nop linked to it is cancelled.
+            assert events[3] == -errno.ETIME
+            assert events[4] == -errno.ECANCELED
+
+    def test_end_link(self) -> None:
+        with Ring(32) as ring:
+            assert not ring.end_link(0)
+            ring.set_sqe_flags(0, IOSQE_IO_LINK)
+            ring.prep_timeout(0, sec=0, nsec=0)
+            assert ring.end_link(1)
+            ring.prep_nop(2)
+            ring.submit()
+
+            events = {}
+            for _ in range(3):
+                event = ring.wait()
+                events[event.user_data] = event.res
+            assert events == {0: -errno.ETIME, 1: -errno.ECANCELED, 2: 0}
+
+    def test_supports(self) -> None:
+        with Ring(32) as ring:
+            assert isinstance(ring.supports(IORING_OP_SEND_ZC), bool)
+            # Past the last opcode any kernel knows of.
+            assert not ring.supports(255)
+
     def test_timeout(self, timing) -> None:
         with Ring(32) as ring:
             sleep_for_sec = 1